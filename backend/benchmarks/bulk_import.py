@@ -0,0 +1,96 @@
+"""
+Benchmark throughput bulk import.
+
+Menghasilkan file NDJSON dan CSV sintetis lalu mengimpornya ke project demo
+lewat `utils.importer.Importer` (jalur yang sama dengan endpoint import dan
+`manage.py import-data`), dan mencetak baris per detik. Bandingkan dengan
+`--per-row`, yang meniru satu POST per entity (insert + commit + refresh).
+
+Contoh (dari direktori backend/):
+    python -m benchmarks.bulk_import --rows 50000 --batch-size 1000
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import tempfile
+import time
+
+if "DATABASE_URL" not in os.environ:
+    path = os.path.join(tempfile.gettempdir(), "devnotex_import_bench.db")
+    if os.path.exists(path):
+        os.remove(path)
+    os.environ["DATABASE_URL"] = "sqlite:///" + path
+
+from sqlalchemy import select
+from models import Project, Task, User
+from utils.database import AsyncSessionLocal, Base, SessionLocal, async_engine, engine
+from utils.importer import Importer, read_records
+from utils.seed import seed_database
+
+STATUSES = ["backlog", "todo", "in_progress", "review", "done"]
+
+def task_rows(count: int):
+    for i in range(count):
+        yield {
+            "title": f"Imported task {i}",
+            "description": f"Migrated from tracker, ticket {i} covers deploy and cache work",
+            "status": STATUSES[i % len(STATUSES)],
+            "priority": "medium" if i % 3 else None,
+        }
+
+def as_ndjson(count: int) -> str:
+    return "".join(json.dumps(row) + "\n" for row in task_rows(count))
+
+def as_csv(count: int) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=["title", "description", "status", "priority"])
+    writer.writeheader()
+    writer.writerows(task_rows(count))
+    return buffer.getvalue()
+
+async def bulk(project_id: str, user_id: str, payload: str, file_format: str, batch_size: int) -> dict:
+    records = read_records(io.StringIO(payload, newline=""), file_format, "task")
+    async with AsyncSessionLocal() as db:
+        return await Importer(db, project_id, user_id, batch_size).run(records)
+
+async def per_row(project_id: str, user_id: str, count: int):
+    async with AsyncSessionLocal() as db:
+        for row in task_rows(count):
+            task = Task(project_id=project_id, created_by=user_id, **row)
+            db.add(task)
+            await db.commit()
+            await db.refresh(task)
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--per-row", type=int, default=2000, help="Rows for the one-commit-per-row baseline")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        seed_database(db)
+        project_id = db.scalar(select(Project.id).limit(1))
+        user_id = db.scalar(select(User.id).limit(1))
+
+    for file_format, payload in (("ndjson", as_ndjson(args.rows)), ("csv", as_csv(args.rows))):
+        start = time.perf_counter()
+        report = await bulk(project_id, user_id, payload, file_format, args.batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"{file_format:8} {report['imported']:7} rows  {elapsed:6.2f} s  "
+              f"{report['imported'] / elapsed:9.0f} rows/s  failed {report['failed']}")
+
+    if args.per_row:
+        start = time.perf_counter()
+        await per_row(project_id, user_id, args.per_row)
+        elapsed = time.perf_counter() - start
+        print(f"{'per-row':8} {args.per_row:7} rows  {elapsed:6.2f} s  {args.per_row / elapsed:9.0f} rows/s")
+
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
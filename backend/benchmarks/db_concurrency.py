@@ -0,0 +1,103 @@
+"""
+Benchmark throughput: Session sync di dalam handler `async def` vs AsyncSession.
+
+Setiap request menjalankan satu query yang mensimulasikan round trip database
+lambat (`SELECT SLEEP(x)` di MySQL, fungsi `sleep_ms` di SQLite). Dengan
+Session sync, event loop terblokir sehingga request diproses satu per satu;
+dengan AsyncSession, round trip dari banyak request berjalan bersamaan.
+
+Catatan: concurrency di atas kapasitas pool (default 5 + overflow 10) membuat
+varian sync macet sampai `pool_timeout`, karena thread yang menunggu koneksi
+adalah event loop yang sama yang seharusnya mengembalikan koneksi tersebut.
+
+Contoh (dari direktori backend/):
+    python -m benchmarks.db_concurrency --requests 200 --concurrency 10
+    DATABASE_URL=mysql+pymysql://root@localhost/devnotex python -m benchmarks.db_concurrency
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+if "DATABASE_URL" not in os.environ:
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.gettempdir(), "devnotex_bench.db")
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from utils.database import AsyncSessionLocal, SessionLocal, async_engine, engine
+
+def _sleep_ms(ms):
+    time.sleep(ms / 1000)
+    return ms
+
+def _register_sqlite_sleep(dbapi_connection, connection_record):
+    dbapi_connection.create_function("sleep_ms", 1, _sleep_ms)
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine, "connect", _register_sqlite_sleep)
+    event.listen(async_engine.sync_engine, "connect", _register_sqlite_sleep)
+    SLOW_QUERY = text("SELECT sleep_ms(:ms)")
+else:
+    SLOW_QUERY = text("SELECT SLEEP(:ms / 1000)")
+
+def get_sync_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def build_app(latency_ms: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/sync")
+    async def sync_route(db: Session = Depends(get_sync_db)):
+        return {"value": db.execute(SLOW_QUERY, {"ms": latency_ms}).scalar()}
+
+    @app.get("/async")
+    async def async_route(db: AsyncSession = Depends(get_async_db)):
+        return {"value": (await db.execute(SLOW_QUERY, {"ms": latency_ms})).scalar()}
+
+    return app
+
+async def run(app: FastAPI, path: str, requests: int, concurrency: int) -> float:
+    limiter = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            async with limiter:
+                response = await client.get(path)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        return time.perf_counter() - start
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency-ms", type=int, default=5)
+    args = parser.parse_args()
+
+    app = build_app(args.latency_ms)
+    print(f"database: {engine.dialect.name}, {args.requests} requests, "
+          f"concurrency {args.concurrency}, {args.latency_ms} ms per query")
+
+    for path in ("/sync", "/async"):
+        elapsed = await run(app, path, args.requests, args.concurrency)
+        print(f"{path:7} {elapsed:7.3f} s  {args.requests / elapsed:8.1f} req/s")
+
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+"""
+Micro-benchmark encoding response.
+
+Membandingkan waktu encode dan ukuran payload untuk halaman list yang
+representatif (task pendek, note dan document berisi teks panjang):
+stdlib `json` (jalur lama FastAPI), `orjson`, dan MessagePack, masing-masing
+mentah, gzip, dan brotli.
+
+Contoh (dari direktori backend/):
+    python -m benchmarks.encoding --items 200 --repeat 50
+"""
+import argparse
+import gzip
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from fastapi.encoders import jsonable_encoder
+from schemas import DocumentPage, NotePage, TaskPage
+from utils.responses import GZIP_LEVEL, BROTLI_QUALITY, brotli, encode_json, encode_msgpack, msgpack, orjson
+
+WORDS = (
+    "deploy cache index query latency migration refactor endpoint schema "
+    "session token project review backlog release rollback monitor"
+).split()
+
+def _text(seed: int, words: int) -> str:
+    rng = random.Random(seed)
+    return " ".join(
+        rng.choice(WORDS) if rng.random() < 0.7 else f"{rng.choice(WORDS)}_{rng.randrange(10000)}"
+        for _ in range(words)
+    )
+
+def _common(seed: int) -> dict:
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=seed)
+    return {
+        "id": str(uuid.UUID(int=seed)),
+        "project_id": str(uuid.UUID(int=1)),
+        "title": _text(seed, 6),
+        "created_by": str(uuid.UUID(int=2)),
+        "created_at": now,
+        "updated_at": now,
+    }
+
+def build_payloads(items: int) -> dict:
+    tasks = [
+        {**_common(i), "description": _text(i, 40), "status": "in_progress",
+         "priority": "high", "tags": ["backend", "perf"], "assigned_to": None,
+         "due_date": None}
+        for i in range(items)
+    ]
+    notes = [{**_common(i), "content": _text(i, 400), "tags": ["meeting"]} for i in range(items)]
+    documents = [{**_common(i), "content": _text(i, 2000), "type": "markdown"} for i in range(items)]
+
+    return {
+        "tasks": jsonable_encoder(TaskPage(items=tasks, next_cursor="abc")),
+        "notes": jsonable_encoder(NotePage(items=notes, next_cursor="abc")),
+        "documents": jsonable_encoder(DocumentPage(items=documents, next_cursor="abc")),
+    }
+
+def stdlib_json(content) -> bytes:
+    # Sama dengan JSONResponse.render bawaan Starlette.
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None,
+                      separators=(",", ":")).encode("utf-8")
+
+def timed(encode, content, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        body = encode(content)
+    return (time.perf_counter() - start) / repeat * 1000, body
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    encoders = [("json", stdlib_json)]
+    if orjson is not None:
+        encoders.append(("orjson", encode_json))
+    if msgpack is not None:
+        encoders.append(("msgpack", encode_msgpack))
+
+    print(f"{'payload':10} {'encoder':8} {'encode':>10} {'raw':>10} {'gzip':>10} {'brotli':>10}")
+    for name, content in build_payloads(args.items).items():
+        for label, encode in encoders:
+            elapsed, body = timed(encode, content, args.repeat)
+            gzipped = len(gzip.compress(body, compresslevel=GZIP_LEVEL))
+            brotlied = len(brotli.compress(body, quality=BROTLI_QUALITY)) if brotli else "-"
+            print(f"{name:10} {label:8} {elapsed:8.3f}ms {len(body):10} {gzipped:10} {brotlied:>10}")
+
+if __name__ == "__main__":
+    main()
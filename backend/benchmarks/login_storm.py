@@ -0,0 +1,91 @@
+"""
+Benchmark latency endpoint non-auth selama badai login.
+
+Menjalankan sejumlah login bersamaan sambil terus memanggil
+`GET /api/projects`, lalu membandingkan p50/p99 latency endpoint tersebut
+antara verifikasi bcrypt inline di event loop dan versi yang di-offload ke
+thread pool (`verify_password_async`).
+
+Contoh (dari direktori backend/):
+    python -m benchmarks.login_storm --logins 40 --probes 100
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+if "DATABASE_URL" not in os.environ:
+    path = os.path.join(tempfile.gettempdir(), "devnotex_login_bench.db")
+    if os.path.exists(path):
+        os.remove(path)
+    os.environ["DATABASE_URL"] = "sqlite:///" + path
+
+import httpx
+from main import app
+from routers import auth as auth_router
+from utils.auth import verify_password
+from utils.database import Base, SessionLocal, async_engine, engine
+from utils.seed import seed_database
+
+EMAIL = "demo@devnotex.com"
+PASSWORD = "testpass"
+
+async def _inline_verify(plain_password: str, hashed_password: str) -> bool:
+    return verify_password(plain_password, hashed_password)
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+async def run(client: httpx.AsyncClient, token: str, logins: int, probes: int):
+    latencies = []
+    shed = []
+
+    async def login():
+        response = await client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+        if response.status_code == 503:
+            shed.append(response)
+        else:
+            response.raise_for_status()
+
+    async def probe():
+        for _ in range(probes):
+            start = time.perf_counter()
+            response = await client.get("/api/projects", headers={"Authorization": f"Bearer {token}"})
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - start) * 1000)
+            await asyncio.sleep(0.002)
+
+    await asyncio.gather(probe(), *(login() for _ in range(logins)))
+    return latencies, len(shed)
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--probes", type=int, default=100)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        seed_database(db)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+        token = response.json()["access_token"]
+
+        offloaded = auth_router.verify_password_async
+        for label, verifier in (("inline", _inline_verify), ("offloaded", offloaded)):
+            auth_router.verify_password_async = verifier
+            latencies, shed = await run(client, token, args.logins, args.probes)
+            print(f"{label:10} p50 {statistics.median(latencies):7.2f} ms   "
+                  f"p99 {percentile(latencies, 99):7.2f} ms   max {max(latencies):7.2f} ms   "
+                  f"logins shed {shed}")
+        auth_router.verify_password_async = offloaded
+
+    await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
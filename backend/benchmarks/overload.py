@@ -0,0 +1,84 @@
+"""
+Benchmark latency saat overload, dengan dan tanpa admission control.
+
+Aplikasi uji punya satu endpoint baca yang memakai "database" berkapasitas
+terbatas (semaphore seukuran pool, setiap query `--latency` ms). Sejumlah
+request dikirim dengan laju tetap `--rate` per detik (default dua kali
+kapasitas); tanpa admission control semuanya antre dan latency naik untuk
+semua orang, dengan admission control kelebihannya ditolak cepat dengan
+503 dan yang diterima tetap cepat.
+
+Contoh (dari direktori backend/):
+    python -m benchmarks.overload --requests 2000 --capacity 10 --latency 20 --rate 1000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+from utils.admission import AdmissionControlMiddleware, Gate
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def build_app(capacity: int, latency_ms: int, gate=None) -> FastAPI:
+    app = FastAPI()
+    database = asyncio.Semaphore(capacity)
+
+    @app.get("/api/items")
+    async def items():
+        async with database:
+            await asyncio.sleep(latency_ms / 1000)
+        return {"ok": True}
+
+    if gate is not None:
+        app.add_middleware(AdmissionControlMiddleware, gates={"reads": gate}, enabled=True)
+    return app
+
+async def run(app: FastAPI, requests: int, rate: float):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def call():
+            started = time.perf_counter()
+            response = await client.get("/api/items")
+            return response.status_code, (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        tasks = []
+        for i in range(requests):
+            tasks.append(asyncio.create_task(call()))
+            await asyncio.sleep(max(0.0, started + (i + 1) / rate - time.perf_counter()))
+        results = await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    ok = [latency for status_code, latency in results if status_code == 200]
+    shed = [latency for status_code, latency in results if status_code == 503]
+    return ok, shed, elapsed
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--capacity", type=int, default=10, help="Simulated database connections")
+    parser.add_argument("--latency", type=int, default=20, help="Milliseconds per simulated query")
+    parser.add_argument("--rate", type=float, help="Requests per second (default: twice the capacity)")
+    parser.add_argument("--queue", type=int, default=20)
+    parser.add_argument("--queue-timeout", type=float, default=0.1)
+    args = parser.parse_args()
+    rate = args.rate or 2 * args.capacity * 1000 / args.latency
+
+    gate = Gate("reads", limit=args.capacity, queue_size=args.queue, queue_timeout=args.queue_timeout, deadline=5)
+    for label, app in (
+        ("unbounded", build_app(args.capacity, args.latency)),
+        ("admission", build_app(args.capacity, args.latency, gate)),
+    ):
+        ok, shed, elapsed = await run(app, args.requests, rate)
+        print(f"{label:10} ok {len(ok):5}  p50 {statistics.median(ok):8.1f} ms  p99 {percentile(ok, 99):8.1f} ms  "
+              f"shed {len(shed):5} (p99 {percentile(shed, 99) if shed else 0:6.1f} ms)  total {elapsed:5.2f} s")
+
+    print("gate", gate.stats())
+
+if __name__ == "__main__":
+    asyncio.run(main())
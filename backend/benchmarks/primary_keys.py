@@ -0,0 +1,104 @@
+"""
+Throughput insert dan ukuran index: CHAR(36) + uuid4 vs BINARY(16) + UUIDv7.
+
+Membuat dua tabel tiruan `tasks` (primary key id, index
+`(project_id, created_at)` dan `(project_id, status)`), mengisi keduanya
+dengan `--rows` baris per batch `--batch-size`, lalu mencetak baris per
+detik serta ukuran data/index. Di SQLite tabel dibuat WITHOUT ROWID agar
+primary key menjadi clustered index seperti InnoDB.
+
+Contoh (dari direktori backend/):
+    python -m benchmarks.primary_keys --rows 200000
+    DATABASE_URL=mysql+pymysql://root@localhost/devnotex python -m benchmarks.primary_keys
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import uuid
+
+if "DATABASE_URL" not in os.environ:
+    path = os.path.join(tempfile.gettempdir(), "devnotex_keys_bench.db")
+    if os.path.exists(path):
+        os.remove(path)
+    os.environ["DATABASE_URL"] = "sqlite:///" + path
+
+from sqlalchemy import CHAR, Column, DateTime, Index, MetaData, String, Table, insert, text
+from utils.database import engine, utcnow
+from utils.ids import BinaryUUID, new_id
+
+VARIANTS = {
+    "char36-uuid4": (CHAR(36), lambda: str(uuid.uuid4())),
+    "binary16-uuid7": (BinaryUUID(), new_id),
+}
+
+def build_table(metadata: MetaData, name: str, id_type) -> Table:
+    return Table(
+        name, metadata,
+        Column("id", id_type, primary_key=True),
+        Column("project_id", id_type, nullable=False),
+        Column("title", String(255), nullable=False),
+        Column("status", String(16), nullable=False),
+        Column("created_at", DateTime, nullable=False),
+        Index(f"ix_{name}_project_created", "project_id", "created_at"),
+        Index(f"ix_{name}_project_status", "project_id", "status"),
+        sqlite_with_rowid=False,
+    )
+
+def table_sizes(connection, name: str) -> tuple:
+    """(ukuran data/clustered index, ukuran index sekunder) dalam byte."""
+    if connection.dialect.name == "sqlite":
+        rows = connection.execute(text("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")).all()
+        sizes = {row_name: size for row_name, size in rows}
+        data = sum(size for row_name, size in sizes.items() if row_name == name or row_name.startswith(f"sqlite_autoindex_{name}"))
+        index = sum(size for row_name, size in sizes.items() if row_name.startswith(f"ix_{name}_"))
+        return data, index
+
+    connection.execute(text(f"ANALYZE TABLE {name}"))
+    return connection.execute(text(
+        "SELECT data_length, index_length FROM information_schema.tables "
+        "WHERE table_schema = DATABASE() AND table_name = :name"
+    ), {"name": name}).one()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--projects", type=int, default=50)
+    args = parser.parse_args()
+
+    metadata = MetaData()
+    tables = {variant: build_table(metadata, f"bench_keys_{variant.replace('-', '_')}", id_type)
+              for variant, (id_type, _) in VARIANTS.items()}
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+
+    try:
+        for variant, (_, make_id) in VARIANTS.items():
+            table = tables[variant]
+            projects = [make_id() for _ in range(args.projects)]
+            started = time.perf_counter()
+            with engine.begin() as connection:
+                for offset in range(0, args.rows, args.batch_size):
+                    connection.execute(insert(table), [
+                        {
+                            "id": make_id(),
+                            "project_id": random.choice(projects),
+                            "title": f"task {offset + i}",
+                            "status": "todo",
+                            "created_at": utcnow(),
+                        }
+                        for i in range(min(args.batch_size, args.rows - offset))
+                    ])
+            elapsed = time.perf_counter() - started
+
+            with engine.begin() as connection:
+                data, index = table_sizes(connection, table.name)
+            print(f"{variant:15} {args.rows / elapsed:9.0f} rows/s   data {data / 1024 / 1024:7.2f} MiB   "
+                  f"secondary indexes {index / 1024 / 1024:7.2f} MiB")
+    finally:
+        metadata.drop_all(engine)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Waktu cold start worker.
+
+Setiap run menyalakan proses Python baru dan mengukur:
+  import      : `import main` (modul, router, dan `create_app()`)
+  lifespan    : startup lifespan sampai aplikasi siap menerima request
+  first       : request pertama yang tidak menyentuh database (GET /health)
+  first db    : request pertama yang menyentuh database (GET /api/projects),
+                termasuk membuka koneksi pertama dari pool
+  ready       : total dari awal proses sampai request database pertama selesai
+  legacy      : (info) biaya `create_all` + `seed_database` yang dulu
+                dijalankan di setiap worker saat startup
+
+Database disiapkan sekali lewat `manage.py init-db --seed` sebelum run
+pertama, sama seperti di deployment. Dengan `--max-ready` skrip keluar
+dengan status 1 bila median `ready` melewati batas (ms).
+
+Contoh (dari direktori backend/):
+    python -m benchmarks.startup --runs 10 --max-ready 2500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+STEPS = ["import", "lifespan", "first", "first db", "ready", "legacy"]
+
+def child():
+    started = time.perf_counter()
+    import main
+    imported = time.perf_counter()
+
+    import asyncio
+    import httpx
+    from models import User
+    from utils.auth import create_access_token
+    from utils.database import Base, SessionLocal, engine
+    from utils.seed import seed_database
+
+    with SessionLocal() as db:
+        user_id = db.query(User.id).filter(User.email == "demo@devnotex.com").scalar()
+    token = create_access_token({"sub": user_id})
+
+    async def serve():
+        timings = {"import": imported - started}
+        lifespan_started = time.perf_counter()
+        async with main.app.router.lifespan_context(main.app):
+            timings["lifespan"] = time.perf_counter() - lifespan_started
+
+            transport = httpx.ASGITransport(app=main.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                request_started = time.perf_counter()
+                (await client.get("/health")).raise_for_status()
+                timings["first"] = time.perf_counter() - request_started
+
+                request_started = time.perf_counter()
+                response = await client.get("/api/projects", headers={"Authorization": f"Bearer {token}"})
+                response.raise_for_status()
+                timings["first db"] = time.perf_counter() - request_started
+
+        # Token dan lookup user di atas hanya persiapan skenario, bukan
+        # bagian startup worker.
+        timings["ready"] = timings["import"] + timings["lifespan"] + timings["first"] + timings["first db"]
+        return timings
+
+    timings = asyncio.run(serve())
+
+    legacy_started = time.perf_counter()
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        seed_database(db)
+    timings["legacy"] = time.perf_counter() - legacy_started
+
+    print(json.dumps(timings))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ready", type=float, help="Fail when the median ready time exceeds this many ms")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child()
+        return
+
+    env = dict(os.environ)
+    if "DATABASE_URL" not in env:
+        path = os.path.join(tempfile.gettempdir(), "devnotex_startup_bench.db")
+        if os.path.exists(path):
+            os.remove(path)
+        env["DATABASE_URL"] = "sqlite:///" + path
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run(
+        [sys.executable, "manage.py", "init-db", "--seed"],
+        cwd=backend_dir, env=env, check=True, capture_output=True
+    )
+
+    runs = []
+    for _ in range(args.runs):
+        result = subprocess.run(
+            [sys.executable, "-m", "benchmarks.startup", "--child"],
+            cwd=backend_dir, env=env, check=True, capture_output=True, text=True
+        )
+        runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+    print(f"{args.runs} cold starts (ms)")
+    for step in STEPS:
+        values = [run[step] * 1000 for run in runs]
+        print(f"{step:9} median {statistics.median(values):8.1f}  min {min(values):8.1f}  max {max(values):8.1f}")
+
+    median_ready = statistics.median(run["ready"] * 1000 for run in runs)
+    if args.max_ready is not None and median_ready > args.max_ready:
+        print(f"ready median {median_ready:.1f} ms exceeds budget {args.max_ready:.1f} ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,72 +1,139 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from utils.database import Base, engine, SessionLocal
-from utils.seed import seed_database
-from routers import auth, projects, notes, tasks, documents
+from utils.database import async_engine, check_database, pool_status, replicas, warm_up_pool, warm_up_replicas
+from utils.permissions import membership_cache
+from utils.auth import token_cache
+from utils.responses import CompressionMiddleware, ContentNegotiationMiddleware, NegotiatedResponse
+from utils.events import create_broker, hub
+from utils.admission import AdmissionControlMiddleware, admission_stats
+from routers import auth, projects, notes, tasks, documents, search, changes, events
 import logging
+import os
+import secrets
 from contextlib import asynccontextmanager
+from dotenv import load_dotenv
+
+load_dotenv()
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(
-    title="DevNoteX API",
-    description="Backend API for DevNoteX - Developer Workspace Platform",
-    version="1.0.0"
-)
+# Token untuk `/metrics`; kosong berarti endpoint dimatikan (404).
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+def require_metrics_token(request: Request):
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    authorization = request.headers.get("authorization", "")
+    if not secrets.compare_digest(authorization.encode(), f"Bearer {METRICS_TOKEN}".encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    db = SessionLocal()
+    # Skema dan seed data tidak disentuh di sini; jalankan sekali
+    # `python manage.py init-db --seed` sebelum worker dinyalakan.
+    await hub.start(create_broker())
+    try:
+        # Database yang belum bisa dihubungi tidak menggagalkan startup;
+        # `/ready` tetap 503 sampai koneksi berhasil.
+        warmed = await warm_up_pool()
+        logger.info(f"Database pool warmed up with {warmed} connections")
+    except Exception as exc:
+        logger.warning(f"Database pool warm-up failed: {exc}")
+    await warm_up_replicas()
+
     try:
-        seed_database(db)
         yield
     finally:
-        db.close()
-        
-app = FastAPI(lifespan=lifespan)
-
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000", "http://localhost:8080"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.include_router(auth.router)
-app.include_router(projects.router)
-app.include_router(notes.router)
-app.include_router(tasks.router)
-app.include_router(documents.router)
-
-# @app.on_event("startup")
-# async def startup_event():
-#     logger.info("Creating database tables...")
-#     Base.metadata.create_all(bind=engine)
-#     logger.info("Database tables created successfully!")
-
-#     logger.info("Seeding database...")
-#     db = SessionLocal()
-#     try:
-#         seed_database(db)
-#     finally:
-#         db.close()
-
-@app.get("/")
-async def root():
-    return {
-        "message": "Welcome to DevNoteX API",
-        "version": "1.0.0",
-        "docs": "/docs"
-    }
-
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
+        await hub.stop()
+        await async_engine.dispose()
+        await replicas.dispose()
+
+def create_app() -> FastAPI:
+    """
+    Membangun aplikasi tanpa efek samping: tidak membuka koneksi database,
+    tidak membuat tabel, dan tidak menulis seed data.
+    """
+    app = FastAPI(
+        title="DevNoteX API",
+        description="Backend API for DevNoteX - Developer Workspace Platform",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=NegotiatedResponse,
+    )
+
+    app.add_middleware(ContentNegotiationMiddleware)
+    app.add_middleware(CompressionMiddleware)
+    # Di dalam CORS agar response 503 tetap membawa header CORS.
+    app.add_middleware(AdmissionControlMiddleware)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:5173", "http://localhost:3000", "http://localhost:8080"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=["ETag", "Content-Encoding"],
+    )
+
+    app.include_router(auth.router)
+    app.include_router(projects.router)
+    app.include_router(notes.router)
+    app.include_router(tasks.router)
+    app.include_router(documents.router)
+    app.include_router(search.router)
+    app.include_router(changes.router)
+    app.include_router(events.router)
+
+    @app.get("/")
+    async def root():
+        return {
+            "message": "Welcome to DevNoteX API",
+            "version": "1.0.0",
+            "docs": "/docs"
+        }
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
+
+    @app.get("/ready")
+    async def readiness_check():
+        """
+        Probe load balancer: 200 hanya bila worker bisa menjalankan query.
+        `/health` tetap murah dan hanya menandakan proses hidup. Replica yang
+        mati tidak membuat worker tidak siap karena baca jatuh ke primary.
+        """
+        try:
+            await check_database()
+        except Exception as exc:
+            # Endpoint ini tanpa auth: detail error (host, DSN, driver) hanya ke log.
+            logger.warning(f"Readiness check failed: {exc!r}")
+            return NegotiatedResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={"status": "unavailable", "pool": pool_status()},
+            )
+        return {"status": "ready", "pool": pool_status()}
+
+    @app.get("/metrics", dependencies=[Depends(require_metrics_token)])
+    async def metrics():
+        """Statistik internal; hanya aktif bila METRICS_TOKEN di-set."""
+        return {
+            "membership_cache": membership_cache.stats(),
+            "token_cache": token_cache.stats(),
+            "events": hub.stats(),
+            "database_pool": pool_status(),
+            "read_replicas": replicas.stats(),
+            "admission": admission_stats(),
+        }
+
+    return app
+
+app = create_app()
 
 if __name__ == "__main__":
     import uvicorn
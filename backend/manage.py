@@ -0,0 +1,170 @@
+import argparse
+import asyncio
+import logging
+import os
+from utils.changes import TOMBSTONE_RETENTION_DAYS, prune_tombstones
+from utils.content import compress_existing_content
+from utils.database import AsyncSessionLocal, SessionLocal, async_engine, pool_budget
+from utils.events import run_relay
+from utils.importer import FORMATS, IMPORT_BATCH_SIZE, Importer, detect_format, read_records
+from utils.seed import seed_database
+from utils.search import rebuild_search_index
+from utils.stats import rebuild_project_stats, reconcile_all_stats
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def init_db(args):
+    # Konfigurasi dibuat tanpa alembic.ini agar fileConfig di env.py tidak
+    # menimpa logging perintah ini.
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config()
+    config.set_main_option("script_location", os.path.join(BASE_DIR, "migrations"))
+    command.upgrade(config, "head")
+    logger.info("Database schema is up to date")
+
+    if args.seed:
+        seed(args)
+
+def seed(args):
+    db = SessionLocal()
+    try:
+        seed_database(db)
+    finally:
+        db.close()
+
+def reindex_search(args):
+    db = SessionLocal()
+    try:
+        indexed = rebuild_search_index(db, project_id=args.project, batch_size=args.batch_size)
+        logger.info(f"Indexed {indexed} entities")
+    finally:
+        db.close()
+
+def reconcile_stats(args):
+    db = SessionLocal()
+    try:
+        if args.project:
+            rebuild_project_stats(db, args.project)
+            db.commit()
+            reconciled = 1
+        else:
+            reconciled = reconcile_all_stats(db)
+        logger.info(f"Reconciled stats for {reconciled} projects")
+    finally:
+        db.close()
+
+def prune_deleted(args):
+    db = SessionLocal()
+    try:
+        pruned = prune_tombstones(db, retention_days=args.days)
+        logger.info(f"Pruned {pruned} tombstones older than {args.days} days")
+    finally:
+        db.close()
+
+async def _import_file(args) -> dict:
+    with open(args.file, encoding="utf-8-sig", newline="") as lines:
+        records = read_records(lines, args.format or detect_format(args.file), args.type)
+        async with AsyncSessionLocal() as db:
+            return await Importer(db, args.project, args.user, args.batch_size).run(records)
+
+def import_data(args):
+    try:
+        report = asyncio.run(_import_file(args))
+    finally:
+        asyncio.run(async_engine.dispose())
+
+    logger.info(f"Imported {report['imported']} rows, {report['failed']} failed")
+    for error in report["errors"]:
+        logger.warning(f"Line {error['line']}: {error['detail']}")
+
+def compress_content(args):
+    db = SessionLocal()
+    try:
+        compressed = compress_existing_content(db, batch_size=args.batch_size, pause=args.pause)
+        logger.info(f"Compressed {compressed} note/document bodies")
+    finally:
+        db.close()
+
+def serve(args):
+    # Worker uvicorn dijalankan sebagai proses baru dan membaca ukuran pool
+    # dari environment, jadi budget cukup dipasang di sini sebelum start.
+    if args.max_connections:
+        if args.max_connections < args.workers:
+            raise SystemExit("--max-connections must be at least --workers")
+        os.environ.update(pool_budget(args.workers, args.max_connections))
+    logger.info(
+        f"Starting {args.workers} workers, pool {os.getenv('DB_POOL_SIZE', '5')}"
+        f" + overflow {os.getenv('DB_MAX_OVERFLOW', '10')} connections each"
+    )
+    import uvicorn
+    uvicorn.run("main:app", host=args.host, port=args.port, workers=args.workers, proxy_headers=True)
+
+def event_relay(args):
+    try:
+        asyncio.run(run_relay(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+def main():
+    parser = argparse.ArgumentParser(description="DevNoteX management commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    init = commands.add_parser("init-db", help="Apply all migrations (run once before starting workers)")
+    init.add_argument("--seed", action="store_true", help="Also create the demo user and project")
+    init.set_defaults(handler=init_db)
+
+    seeder = commands.add_parser("seed", help="Create the demo user and project if missing")
+    seeder.set_defaults(handler=seed)
+
+    reindex = commands.add_parser("reindex-search", help="Rebuild the project search index")
+    reindex.add_argument("--project", help="Only rebuild this project id")
+    reindex.add_argument("--batch-size", type=int, default=500)
+    reindex.set_defaults(handler=reindex_search)
+
+    reconcile = commands.add_parser("reconcile-stats", help="Rebuild materialized project statistics")
+    reconcile.add_argument("--project", help="Only reconcile this project id")
+    reconcile.set_defaults(handler=reconcile_stats)
+
+    prune = commands.add_parser("prune-tombstones", help="Delete tombstones past the sync retention window")
+    prune.add_argument("--days", type=int, default=TOMBSTONE_RETENTION_DAYS)
+    prune.set_defaults(handler=prune_deleted)
+
+    importer = commands.add_parser("import-data", help="Bulk import tasks, notes or documents from NDJSON/CSV")
+    importer.add_argument("file")
+    importer.add_argument("--project", required=True, help="Target project id")
+    importer.add_argument("--user", required=True, help="User id recorded as created_by")
+    importer.add_argument("--type", choices=["task", "note", "document"], help="Entity type for rows without one")
+    importer.add_argument("--format", choices=FORMATS, help="Defaults to the file extension")
+    importer.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    importer.set_defaults(handler=import_data)
+
+    compress = commands.add_parser("compress-content", help="Compress existing long note/document bodies")
+    compress.add_argument("--batch-size", type=int, default=500)
+    compress.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches")
+    compress.set_defaults(handler=compress_content)
+
+    server = commands.add_parser("serve", help="Run the API with multiple workers (production)")
+    server.add_argument("--host", default="0.0.0.0")
+    server.add_argument("--port", type=int, default=8000)
+    server.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1))))
+    server.add_argument(
+        "--max-connections", type=int, default=int(os.getenv("DB_MAX_CONNECTIONS", "0")),
+        help="Database connections shared by all workers (0 = use DB_POOL_SIZE/DB_MAX_OVERFLOW per worker)"
+    )
+    server.set_defaults(handler=serve)
+
+    relay = commands.add_parser("event-relay", help="Relay real-time events between API workers")
+    relay.add_argument("--host", default="127.0.0.1")
+    relay.add_argument("--port", type=int, default=8765)
+    relay.set_defaults(handler=event_relay)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""initial schema
+
+Skema awal, identik dengan hasil `Base.metadata.create_all` sebelum ada
+migrasi. Database lama yang tabelnya sudah ada cukup menjalankan
+`alembic upgrade head`: tabel yang sudah ada akan dilewati.
+
+Revision ID: 0001
+Revises:
+Create Date: 2025-01-15 00:00:00
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+def _existing_tables():
+    if context.is_offline_mode():
+        return set()
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+def upgrade():
+    existing = _existing_tables()
+
+    if "users" not in existing:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.CHAR(36), primary_key=True),
+            sa.Column("email", sa.String(255), nullable=False),
+            sa.Column("hashed_password", sa.String(255), nullable=False),
+            sa.Column("full_name", sa.String(255), nullable=False),
+            sa.Column("avatar_url", sa.String(500), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    if "projects" not in existing:
+        op.create_table(
+            "projects",
+            sa.Column("id", sa.CHAR(36), primary_key=True),
+            sa.Column("name", sa.String(255), nullable=False),
+            sa.Column("description", sa.String(1000), nullable=True),
+            sa.Column("repo_url", sa.String(500), nullable=True),
+            sa.Column("created_by", sa.CHAR(36), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+    if "project_members" not in existing:
+        op.create_table(
+            "project_members",
+            sa.Column("id", sa.CHAR(36), primary_key=True),
+            sa.Column("project_id", sa.CHAR(36), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("user_id", sa.CHAR(36), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("role", sa.Enum("admin", "member", "viewer", name="roleenum"), nullable=False),
+            sa.Column("joined_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+    if "notes" not in existing:
+        op.create_table(
+            "notes",
+            sa.Column("id", sa.CHAR(36), primary_key=True),
+            sa.Column("project_id", sa.CHAR(36), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("title", sa.String(255), nullable=False),
+            sa.Column("content", sa.Text, nullable=True),
+            sa.Column("created_by", sa.CHAR(36), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+    if "tasks" not in existing:
+        op.create_table(
+            "tasks",
+            sa.Column("id", sa.CHAR(36), primary_key=True),
+            sa.Column("project_id", sa.CHAR(36), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("title", sa.String(255), nullable=False),
+            sa.Column("description", sa.Text, nullable=True),
+            sa.Column(
+                "status",
+                sa.Enum("backlog", "todo", "in_progress", "review", "done", name="statusenum"),
+                nullable=False,
+            ),
+            sa.Column("priority", sa.Enum("low", "medium", "high", "urgent", name="priorityenum"), nullable=True),
+            sa.Column("assigned_to", sa.CHAR(36), sa.ForeignKey("users.id"), nullable=True),
+            sa.Column("due_date", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("created_by", sa.CHAR(36), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+    if "documents" not in existing:
+        op.create_table(
+            "documents",
+            sa.Column("id", sa.CHAR(36), primary_key=True),
+            sa.Column("project_id", sa.CHAR(36), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("title", sa.String(255), nullable=False),
+            sa.Column("content", sa.Text, nullable=True),
+            sa.Column(
+                "type",
+                sa.Enum("setup", "environment", "deployment", "general", name="documenttypeenum"),
+                nullable=True,
+            ),
+            sa.Column("created_by", sa.CHAR(36), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+def downgrade():
+    op.drop_table("documents")
+    op.drop_table("tasks")
+    op.drop_table("notes")
+    op.drop_table("project_members")
+    op.drop_table("projects")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
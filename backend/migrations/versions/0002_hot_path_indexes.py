@@ -0,0 +1,71 @@
+"""hot path indexes
+
+Index komposit untuk pola query yang dipakai router: cek membership
+`(project_id, user_id)`, daftar project per user, keyset pagination
+`(project_id, created_at, id)`, serta filter status/updated_at/assignee.
+
+Keanggotaan ganda (data lama tanpa unique constraint) dihapus lebih dulu,
+menyisakan satu baris per `(project_id, user_id)`. Index yang sudah dibuat
+oleh `create_all` dilewati.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-01-15 00:00:01
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_project_members_user_id", "project_members", ["user_id"]),
+    ("ix_tasks_project_created", "tasks", ["project_id", "created_at", "id"]),
+    ("ix_tasks_project_updated", "tasks", ["project_id", "updated_at"]),
+    ("ix_tasks_project_status", "tasks", ["project_id", "status"]),
+    ("ix_tasks_assigned_to", "tasks", ["assigned_to"]),
+    ("ix_notes_project_created", "notes", ["project_id", "created_at", "id"]),
+    ("ix_notes_project_updated", "notes", ["project_id", "updated_at"]),
+    ("ix_documents_project_created", "documents", ["project_id", "created_at", "id"]),
+    ("ix_documents_project_updated", "documents", ["project_id", "updated_at"]),
+    ("ix_documents_project_type", "documents", ["project_id", "type"]),
+]
+
+def _existing_indexes():
+    if context.is_offline_mode():
+        return set()
+    inspector = sa.inspect(op.get_bind())
+    return {
+        index["name"]
+        for table in ("project_members", "tasks", "notes", "documents")
+        for index in inspector.get_indexes(table)
+    }
+
+def upgrade():
+    existing = _existing_indexes()
+
+    op.execute(
+        "DELETE FROM project_members WHERE id NOT IN ("
+        "SELECT keep_id FROM ("
+        "SELECT MIN(id) AS keep_id FROM project_members GROUP BY project_id, user_id"
+        ") AS keep)"
+    )
+    if "uq_project_members_project_user" not in existing:
+        op.create_index(
+            "uq_project_members_project_user",
+            "project_members",
+            ["project_id", "user_id"],
+            unique=True,
+        )
+
+    for name, table, columns in INDEXES:
+        if name not in existing:
+            op.create_index(name, table, columns)
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
+
+    op.drop_index("uq_project_members_project_user", table_name="project_members")
@@ -0,0 +1,36 @@
+"""search postings
+
+Tabel inverted index untuk endpoint pencarian project. Setelah upgrade,
+isi index untuk data lama dengan `python manage.py reindex-search`.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2025-01-20 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        "search_postings",
+        sa.Column("project_id", sa.CHAR(36), sa.ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column(
+            "term",
+            sa.String(64).with_variant(mysql.VARCHAR(64, collation="utf8mb4_bin"), "mysql"),
+            primary_key=True,
+        ),
+        sa.Column("entity_type", sa.String(16), primary_key=True),
+        sa.Column("entity_id", sa.CHAR(36), primary_key=True),
+        sa.Column("weight", sa.Integer, nullable=False),
+    )
+    op.create_index("ix_search_postings_entity", "search_postings", ["entity_type", "entity_id"])
+
+def downgrade():
+    op.drop_index("ix_search_postings_entity", table_name="search_postings")
+    op.drop_table("search_postings")
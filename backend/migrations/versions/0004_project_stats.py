@@ -0,0 +1,51 @@
+"""project stats
+
+Counter statistik per project dan bucket task terbuka per tanggal jatuh
+tempo. Project lama dihitung saat stats pertama kali dibaca, atau sekaligus
+dengan `python manage.py reconcile-stats`.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-01-27 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+COUNTERS = [
+    "tasks_total",
+    "tasks_backlog",
+    "tasks_todo",
+    "tasks_in_progress",
+    "tasks_review",
+    "tasks_done",
+    "priority_none",
+    "priority_low",
+    "priority_medium",
+    "priority_high",
+    "priority_urgent",
+    "notes_total",
+    "documents_total",
+]
+
+def upgrade():
+    op.create_table(
+        "project_stats",
+        sa.Column("project_id", sa.CHAR(36), sa.ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+        *[sa.Column(name, sa.Integer, nullable=False) for name in COUNTERS],
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_table(
+        "task_due_counts",
+        sa.Column("project_id", sa.CHAR(36), sa.ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("due_day", sa.Date, primary_key=True),
+        sa.Column("open_tasks", sa.Integer, nullable=False),
+    )
+
+def downgrade():
+    op.drop_table("task_due_counts")
+    op.drop_table("project_stats")
@@ -0,0 +1,33 @@
+"""project versions
+
+Nomor versi per koleksi untuk ETag. Setiap project yang sudah ada langsung
+mendapat baris versi agar penulisan berikutnya selalu menaikkan versinya.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-02-03 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        "project_versions",
+        sa.Column("project_id", sa.CHAR(36), sa.ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("project", sa.Integer, nullable=False),
+        sa.Column("tasks", sa.Integer, nullable=False),
+        sa.Column("notes", sa.Integer, nullable=False),
+        sa.Column("documents", sa.Integer, nullable=False),
+    )
+    op.execute(
+        "INSERT INTO project_versions (project_id, project, tasks, notes, documents) "
+        "SELECT id, 0, 0, 0, 0 FROM projects"
+    )
+
+def downgrade():
+    op.drop_table("project_versions")
@@ -0,0 +1,33 @@
+"""tombstones
+
+Jejak penghapusan untuk changes feed. Penghapusan sebelum migrasi ini
+tidak tercatat, jadi klien yang sudah punya data lokal sebaiknya
+melakukan sinkronisasi penuh sekali.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-02-10 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table(
+        "tombstones",
+        sa.Column("entity_id", sa.CHAR(36), primary_key=True),
+        sa.Column("entity_type", sa.String(16), nullable=False),
+        sa.Column("project_id", sa.CHAR(36), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index(
+        "ix_tombstones_project_deleted", "tombstones", ["project_id", "deleted_at", "entity_id"]
+    )
+
+def downgrade():
+    op.drop_index("ix_tombstones_project_deleted", table_name="tombstones")
+    op.drop_table("tombstones")
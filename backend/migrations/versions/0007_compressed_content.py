@@ -0,0 +1,44 @@
+"""compressed content
+
+Kolom blob terkompres untuk isi note dan document. Baris lama tetap
+terbaca sebagai teks biasa; kompres di background dengan
+`python manage.py compress-content`.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2025-02-17 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+TABLES = ("notes", "documents")
+
+def upgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch:
+            batch.add_column(sa.Column("content_blob", sa.LargeBinary, nullable=True))
+            batch.add_column(sa.Column("content_codec", sa.String(16), nullable=True))
+
+def downgrade():
+    # Isi terkompres harus dikembalikan ke teks sebelum kolomnya dibuang.
+    from utils.content import decode_content
+
+    bind = op.get_bind()
+    for table in TABLES:
+        rows = bind.execute(sa.text(
+            f"SELECT id, content_blob, content_codec FROM {table} WHERE content_codec IS NOT NULL"
+        )).all()
+        for row in rows:
+            bind.execute(
+                sa.text(f"UPDATE {table} SET content = :content WHERE id = :id"),
+                {"content": decode_content(None, row.content_blob, row.content_codec), "id": row.id}
+            )
+
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column("content_codec")
+            batch.drop_column("content_blob")
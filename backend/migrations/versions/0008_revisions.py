@@ -0,0 +1,45 @@
+"""revisions
+
+Riwayat isi note dan document. Entity yang sudah ada mulai di revisi 0;
+isinya saat ini baru disimpan sebagai snapshot pada perubahan pertama.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2025-02-24 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+TABLES = ("notes", "documents")
+
+def upgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch:
+            batch.add_column(sa.Column("revision", sa.Integer, nullable=False, server_default="0"))
+
+    op.create_table(
+        "revisions",
+        sa.Column("entity_type", sa.String(16), primary_key=True),
+        sa.Column("entity_id", sa.CHAR(36), primary_key=True),
+        sa.Column("number", sa.Integer, primary_key=True, autoincrement=False),
+        sa.Column("project_id", sa.CHAR(36), sa.ForeignKey("projects.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("kind", sa.String(16), nullable=False),
+        sa.Column("body", sa.LargeBinary, nullable=False),
+        sa.Column("size", sa.Integer, nullable=False),
+        sa.Column("created_by", sa.CHAR(36), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_revisions_project", "revisions", ["project_id"])
+
+def downgrade():
+    op.drop_index("ix_revisions_project", table_name="revisions")
+    op.drop_table("revisions")
+
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column("revision")
@@ -0,0 +1,159 @@
+"""binary uuid keys
+
+Semua kolom id (primary key, foreign key, dan entity_id) diubah dari
+CHAR(36) menjadi BINARY(16) (BLOB di SQLite). Nilai lama dikonversi
+di tempat, jadi id yang sudah dipakai klien tidak berubah; id baru
+memakai UUIDv7 yang terurut waktu.
+
+Di MySQL foreign key dilepas dulu, kolom diubah lewat VARBINARY(36),
+isinya di-UNHEX, lalu foreign key dipasang lagi. Setiap tabel disalin
+ulang oleh ALTER TABLE, jadi jalankan saat trafik rendah. Mode `--sql`
+didukung untuk MySQL dan memakai nama foreign key bawaan MySQL untuk
+tabel dari migrasi 0001-0008 (`FOREIGN_KEYS`); database lama hasil
+create_all yang nama constraint-nya berbeda sebaiknya dimigrasi online.
+Di SQLite konversi butuh koneksi langsung, jadi mode `--sql` tidak
+didukung.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2025-03-10 00:00:00
+"""
+import uuid
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+# tabel -> kolom UUID (nama, nullable)
+COLUMNS = {
+    "users": [("id", False)],
+    "projects": [("id", False), ("created_by", False)],
+    "project_members": [("id", False), ("project_id", False), ("user_id", False)],
+    "tasks": [("id", False), ("project_id", False), ("assigned_to", True), ("created_by", False)],
+    "notes": [("id", False), ("project_id", False), ("created_by", False)],
+    "documents": [("id", False), ("project_id", False), ("created_by", False)],
+    "revisions": [("entity_id", False), ("project_id", False), ("created_by", False)],
+    "search_postings": [("project_id", False), ("entity_id", False)],
+    "project_stats": [("project_id", False)],
+    "task_due_counts": [("project_id", False)],
+    "project_versions": [("project_id", False)],
+    "tombstones": [("entity_id", False), ("project_id", False)],
+}
+
+def _uuid_to_bin(value):
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        value = value.decode("ascii")
+    return uuid.UUID(value).bytes
+
+def _bin_to_uuid(value):
+    if value is None:
+        return None
+    return str(uuid.UUID(bytes=bytes(value)))
+
+# (tabel, nama, kolom, tabel rujukan, ondelete). Foreign key dari migrasi
+# 0001-0008 tidak diberi nama, jadi MySQL menamainya `<tabel>_ibfk_<n>`
+# sesuai urutan kolom.
+FOREIGN_KEYS = [
+    ("projects", "projects_ibfk_1", "created_by", "users", None),
+    ("project_members", "project_members_ibfk_1", "project_id", "projects", "CASCADE"),
+    ("project_members", "project_members_ibfk_2", "user_id", "users", None),
+    ("notes", "notes_ibfk_1", "project_id", "projects", "CASCADE"),
+    ("notes", "notes_ibfk_2", "created_by", "users", None),
+    ("tasks", "tasks_ibfk_1", "project_id", "projects", "CASCADE"),
+    ("tasks", "tasks_ibfk_2", "assigned_to", "users", None),
+    ("tasks", "tasks_ibfk_3", "created_by", "users", None),
+    ("documents", "documents_ibfk_1", "project_id", "projects", "CASCADE"),
+    ("documents", "documents_ibfk_2", "created_by", "users", None),
+    ("search_postings", "search_postings_ibfk_1", "project_id", "projects", "CASCADE"),
+    ("project_stats", "project_stats_ibfk_1", "project_id", "projects", "CASCADE"),
+    ("task_due_counts", "task_due_counts_ibfk_1", "project_id", "projects", "CASCADE"),
+    ("project_versions", "project_versions_ibfk_1", "project_id", "projects", "CASCADE"),
+    ("tombstones", "tombstones_ibfk_1", "project_id", "projects", "CASCADE"),
+    ("revisions", "revisions_ibfk_1", "project_id", "projects", "CASCADE"),
+    ("revisions", "revisions_ibfk_2", "created_by", "users", None),
+]
+
+def _existing_foreign_key_names():
+    """(tabel, kolom) -> nama constraint sebenarnya; kosong di mode offline."""
+    if context.is_offline_mode():
+        return {}
+    inspector = sa.inspect(op.get_bind())
+    return {
+        (table, fk["constrained_columns"][0]): fk["name"]
+        for table in {table for table, *_ in FOREIGN_KEYS}
+        for fk in inspector.get_foreign_keys(table)
+    }
+
+def _drop_foreign_keys():
+    existing = _existing_foreign_key_names()
+    for table, name, column, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(existing.get((table, column), name), table, type_="foreignkey")
+
+def _create_foreign_keys():
+    for table, name, column, referred_table, ondelete in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referred_table, [column], ["id"], ondelete=ondelete)
+
+def _modify(table, columns, type_sql):
+    op.execute(f"ALTER TABLE {table} " + ", ".join(
+        f"MODIFY {column} {type_sql} {'NULL' if nullable else 'NOT NULL'}" for column, nullable in columns
+    ))
+
+def _convert_sqlite(to_binary: bool):
+    bind = op.get_bind()
+    function = _uuid_to_bin if to_binary else _bin_to_uuid
+    bind.connection.driver_connection.create_function("convert_uuid", 1, function, deterministic=True)
+
+    new_type, old_type = (sa.LargeBinary(), sa.CHAR(36)) if to_binary else (sa.CHAR(36), sa.LargeBinary())
+    for table, columns in COLUMNS.items():
+        if not to_binary:
+            op.execute(f"UPDATE {table} SET " + ", ".join(f"{column} = convert_uuid({column})" for column, _ in columns))
+
+        # CAST ke BLOB/CHAR menyalin isi apa adanya saat tabel dibuat ulang.
+        with op.batch_alter_table(table, recreate="always") as batch:
+            for column, nullable in columns:
+                batch.alter_column(column, type_=new_type, existing_type=old_type, existing_nullable=nullable)
+
+        if to_binary:
+            op.execute(f"UPDATE {table} SET " + ", ".join(f"{column} = convert_uuid({column})" for column, _ in columns))
+
+def _is_sqlite():
+    if op.get_context().dialect.name != "sqlite":
+        return False
+    if context.is_offline_mode():
+        raise RuntimeError("Migration 0009 converts SQLite ids in Python and must run against a live database")
+    return True
+
+def upgrade():
+    if _is_sqlite():
+        _convert_sqlite(to_binary=True)
+        return
+
+    _drop_foreign_keys()
+    for table, columns in COLUMNS.items():
+        _modify(table, columns, "VARBINARY(36)")
+        op.execute(f"UPDATE {table} SET " + ", ".join(
+            f"{column} = UNHEX(REPLACE({column}, '-', ''))" for column, _ in columns
+        ))
+        _modify(table, columns, "BINARY(16)")
+    _create_foreign_keys()
+
+def downgrade():
+    if _is_sqlite():
+        _convert_sqlite(to_binary=False)
+        return
+
+    _drop_foreign_keys()
+    for table, columns in COLUMNS.items():
+        _modify(table, columns, "VARBINARY(36)")
+        op.execute(f"UPDATE {table} SET " + ", ".join(
+            f"{column} = LOWER(CONCAT_WS('-', HEX(SUBSTR({column}, 1, 4)), HEX(SUBSTR({column}, 5, 2)), "
+            f"HEX(SUBSTR({column}, 7, 2)), HEX(SUBSTR({column}, 9, 2)), HEX(SUBSTR({column}, 11, 6))))"
+            for column, _ in columns
+        ))
+        _modify(table, columns, "CHAR(36)")
+    _create_foreign_keys()
@@ -0,0 +1,34 @@
+"""search term collation
+
+`search_postings.term` memakai collation biner di MySQL. Dengan collation
+default `utf8mb4_unicode_ci`, term yang berbeda di Python ("resume" dan
+"résumé", "strasse" dan "straße") dianggap sama sehingga primary key
+bentrok saat entity yang memuat keduanya diindeks. Database yang dibuat
+setelah revisi ini sudah memakai collation biner sejak 0003; di SQLite
+migrasi ini tidak melakukan apa pun.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2025-03-17 00:00:00
+"""
+from alembic import op
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    if op.get_context().dialect.name != "mysql":
+        return
+    op.execute(
+        "ALTER TABLE search_postings "
+        "MODIFY term VARCHAR(64) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL"
+    )
+
+def downgrade():
+    if op.get_context().dialect.name != "mysql":
+        return
+    # Kembali ke collation default database; term yang hanya berbeda aksen
+    # harus dibersihkan dulu (reindex-search) agar primary key tidak bentrok.
+    op.execute("ALTER TABLE search_postings MODIFY term VARCHAR(64) NOT NULL")
@@ -3,6 +3,11 @@ from models.project import Project, ProjectMember, RoleEnum
 from models.note import Note
 from models.task import Task, StatusEnum, PriorityEnum
 from models.document import Document, DocumentTypeEnum
+from models.search import SearchPosting
+from models.stats import ProjectStatistics, TaskDueCount
+from models.version import ProjectVersion
+from models.tombstone import Tombstone
+from models.revision import Revision
 
 __all__ = [
     "User",
@@ -15,4 +20,10 @@ __all__ = [
     "PriorityEnum",
     "Document",
     "DocumentTypeEnum",
+    "SearchPosting",
+    "ProjectStatistics",
+    "TaskDueCount",
+    "ProjectVersion",
+    "Tombstone",
+    "Revision",
 ]
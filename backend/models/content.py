@@ -0,0 +1,21 @@
+from sqlalchemy import Column, LargeBinary, String, Text
+from utils.content import decode_content, encode_content
+
+class CompressedContentMixin:
+    """
+    Kolom `content` yang disimpan terkompres bila panjang. Atribut `content`
+    adalah property: isi baru di-dekompres saat benar-benar dibaca, dan
+    setiap penulisan memilih sendiri antara teks biasa atau blob terkompres.
+    """
+
+    _content = Column("content", Text, nullable=True)
+    content_blob = Column(LargeBinary, nullable=True)
+    content_codec = Column(String(16), nullable=True)
+
+    @property
+    def content(self):
+        return decode_content(self._content, self.content_blob, self.content_codec)
+
+    @content.setter
+    def content(self, value):
+        self._content, self.content_blob, self.content_codec = encode_content(value)
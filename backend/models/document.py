@@ -1,9 +1,9 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Enum, Index
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.mysql import CHAR
 from sqlalchemy.orm import relationship
-from utils.database import Base
-import uuid
+from utils.database import Base, utcnow
+from utils.ids import BinaryUUID, new_id
+from models.content import CompressedContentMixin
 import enum
 
 class DocumentTypeEnum(str, enum.Enum):
@@ -12,16 +12,21 @@ class DocumentTypeEnum(str, enum.Enum):
     deployment = "deployment"
     general = "general"
 
-class Document(Base):
+class Document(CompressedContentMixin, Base):
     __tablename__ = "documents"
+    __table_args__ = (
+        Index("ix_documents_project_created", "project_id", "created_at", "id"),
+        Index("ix_documents_project_updated", "project_id", "updated_at"),
+        Index("ix_documents_project_type", "project_id", "type"),
+    )
 
-    id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    project_id = Column(CHAR(36), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    id = Column(BinaryUUID, primary_key=True, default=new_id)
+    project_id = Column(BinaryUUID, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False)
-    content = Column(Text, nullable=True)
     type = Column(Enum(DocumentTypeEnum), nullable=True)
-    created_by = Column(CHAR(36), ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    revision = Column(Integer, nullable=False, default=0, server_default="0")
+    created_by = Column(BinaryUUID, ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow)
 
     project = relationship("Project", back_populates="documents")
@@ -1,21 +1,20 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.mysql import CHAR
 from sqlalchemy.orm import relationship
-from utils.database import Base
-import uuid
+from utils.database import Base, utcnow
+from utils.ids import BinaryUUID, new_id
 import enum
 
 class Project(Base):
     __tablename__ = "projects"
 
-    id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(BinaryUUID, primary_key=True, default=new_id)
     name = Column(String(255), nullable=False)
     description = Column(String(1000), nullable=True)
     repo_url = Column(String(500), nullable=True)
-    created_by = Column(CHAR(36), ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_by = Column(BinaryUUID, ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow)
 
     members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan")
     notes = relationship("Note", back_populates="project", cascade="all, delete-orphan")
@@ -29,11 +28,15 @@ class RoleEnum(str, enum.Enum):
 
 class ProjectMember(Base):
     __tablename__ = "project_members"
+    __table_args__ = (
+        Index("uq_project_members_project_user", "project_id", "user_id", unique=True),
+        Index("ix_project_members_user_id", "user_id"),
+    )
 
-    id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    project_id = Column(CHAR(36), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
-    user_id = Column(CHAR(36), ForeignKey("users.id"), nullable=False)
+    id = Column(BinaryUUID, primary_key=True, default=new_id)
+    project_id = Column(BinaryUUID, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(BinaryUUID, ForeignKey("users.id"), nullable=False)
     role = Column(Enum(RoleEnum), nullable=False)
-    joined_at = Column(DateTime(timezone=True), server_default=func.now())
+    joined_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
 
     project = relationship("Project", back_populates="members")
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Integer, LargeBinary
+from sqlalchemy.sql import func
+from utils.database import Base, utcnow
+from utils.ids import BinaryUUID
+
+class Revision(Base):
+    """
+    Riwayat isi note dan document. Setiap `REVISION_SNAPSHOT_INTERVAL`
+    revisi disimpan utuh (`snapshot`), di antaranya hanya delta dari revisi
+    sebelumnya (`delta`). `body` selalu terkompres zlib.
+    """
+    __tablename__ = "revisions"
+    __table_args__ = (
+        Index("ix_revisions_project", "project_id"),
+    )
+
+    entity_type = Column(String(16), primary_key=True)
+    entity_id = Column(BinaryUUID, primary_key=True)
+    number = Column(Integer, primary_key=True, autoincrement=False)
+    project_id = Column(BinaryUUID, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String(16), nullable=False)
+    body = Column(LargeBinary, nullable=False)
+    size = Column(Integer, nullable=False)
+    created_by = Column(BinaryUUID, ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False)
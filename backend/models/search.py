@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
+from sqlalchemy.dialects import mysql
+from utils.database import Base
+from utils.ids import BinaryUUID
+
+class SearchPosting(Base):
+    """
+    Inverted index untuk pencarian per project: satu baris per
+    (term, entity). Primary key diawali `(project_id, term)` sehingga
+    query pencarian cukup membaca posting list term yang dicari.
+    """
+    __tablename__ = "search_postings"
+    __table_args__ = (
+        Index("ix_search_postings_entity", "entity_type", "entity_id"),
+    )
+
+    project_id = Column(BinaryUUID, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    # Collation biner: term dibandingkan per byte seperti di Python. Dengan
+    # collation *_ci, "resume" dan "résumé" dianggap sama dan primary key bentrok.
+    term = Column(String(64).with_variant(mysql.VARCHAR(64, collation="utf8mb4_bin"), "mysql"), primary_key=True)
+    entity_type = Column(String(16), primary_key=True)
+    entity_id = Column(BinaryUUID, primary_key=True)
+    weight = Column(Integer, nullable=False)
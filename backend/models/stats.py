@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from utils.database import Base, utcnow
+from utils.ids import BinaryUUID
+
+class ProjectStatistics(Base):
+    """
+    Counter per project yang diperbarui secara inkremental oleh setiap
+    penulisan task/note/document, sehingga pembacaan stats cukup satu baris.
+    """
+    __tablename__ = "project_stats"
+
+    project_id = Column(BinaryUUID, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    tasks_total = Column(Integer, nullable=False, default=0)
+    tasks_backlog = Column(Integer, nullable=False, default=0)
+    tasks_todo = Column(Integer, nullable=False, default=0)
+    tasks_in_progress = Column(Integer, nullable=False, default=0)
+    tasks_review = Column(Integer, nullable=False, default=0)
+    tasks_done = Column(Integer, nullable=False, default=0)
+    priority_none = Column(Integer, nullable=False, default=0)
+    priority_low = Column(Integer, nullable=False, default=0)
+    priority_medium = Column(Integer, nullable=False, default=0)
+    priority_high = Column(Integer, nullable=False, default=0)
+    priority_urgent = Column(Integer, nullable=False, default=0)
+    notes_total = Column(Integer, nullable=False, default=0)
+    documents_total = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow)
+
+class TaskDueCount(Base):
+    """
+    Jumlah task yang belum selesai per tanggal jatuh tempo. Jumlah task
+    overdue adalah total bucket sebelum hari ini.
+    """
+    __tablename__ = "task_due_counts"
+
+    project_id = Column(BinaryUUID, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    due_day = Column(Date, primary_key=True)
+    open_tasks = Column(Integer, nullable=False, default=0)
@@ -1,9 +1,8 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.mysql import CHAR
 from sqlalchemy.orm import relationship
-from utils.database import Base
-import uuid
+from utils.database import Base, utcnow
+from utils.ids import BinaryUUID, new_id
 import enum
 
 class StatusEnum(str, enum.Enum):
@@ -21,17 +20,23 @@ class PriorityEnum(str, enum.Enum):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_project_created", "project_id", "created_at", "id"),
+        Index("ix_tasks_project_updated", "project_id", "updated_at"),
+        Index("ix_tasks_project_status", "project_id", "status"),
+        Index("ix_tasks_assigned_to", "assigned_to"),
+    )
 
-    id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    project_id = Column(CHAR(36), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    id = Column(BinaryUUID, primary_key=True, default=new_id)
+    project_id = Column(BinaryUUID, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     status = Column(Enum(StatusEnum), nullable=False, default=StatusEnum.backlog)
     priority = Column(Enum(PriorityEnum), nullable=True)
-    assigned_to = Column(CHAR(36), ForeignKey("users.id"), nullable=True)
+    assigned_to = Column(BinaryUUID, ForeignKey("users.id"), nullable=True)
     due_date = Column(DateTime(timezone=True), nullable=True)
-    created_by = Column(CHAR(36), ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_by = Column(BinaryUUID, ForeignKey("users.id"), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow)
 
     project = relationship("Project", back_populates="tasks")
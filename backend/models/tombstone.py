@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from utils.database import Base, utcnow
+from utils.ids import BinaryUUID
+
+class Tombstone(Base):
+    """
+    Jejak entity yang dihapus, dibaca oleh changes feed agar klien tahu
+    apa yang harus dibuang. Dipangkas setelah masa retensi
+    (`manage.py prune-tombstones`).
+    """
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        Index("ix_tombstones_project_deleted", "project_id", "deleted_at", "entity_id"),
+    )
+
+    entity_id = Column(BinaryUUID, primary_key=True)
+    entity_type = Column(String(16), nullable=False)
+    project_id = Column(BinaryUUID, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    deleted_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), nullable=False)
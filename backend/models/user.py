@@ -1,16 +1,15 @@
 from sqlalchemy import Column, String, DateTime
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.mysql import CHAR
-from utils.database import Base
-import uuid
+from utils.database import Base, utcnow
+from utils.ids import BinaryUUID, new_id
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(CHAR(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(BinaryUUID, primary_key=True, default=new_id)
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
     full_name = Column(String(255), nullable=False)
     avatar_url = Column(String(500), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    created_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), default=utcnow, server_default=func.now(), onupdate=utcnow)
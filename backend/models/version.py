@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from utils.database import Base
+from utils.ids import BinaryUUID
+
+class ProjectVersion(Base):
+    """
+    Nomor versi per koleksi dalam sebuah project, dinaikkan oleh setiap
+    penulisan. Dipakai untuk ETag tanpa perlu memuat isi koleksinya.
+    """
+    __tablename__ = "project_versions"
+
+    project_id = Column(BinaryUUID, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    project = Column(Integer, nullable=False, default=0)
+    tasks = Column(Integer, nullable=False, default=0)
+    notes = Column(Integer, nullable=False, default=0)
+    documents = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from utils.database import get_primary_db
+from utils.auth import get_current_user_id
+from utils.permissions import check_project_access
+from utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from utils.changes import read_changes
+from schemas import ChangesPage
+
+router = APIRouter(prefix="/api/projects/{project_id}/changes", tags=["Changes"])
+
+@router.get("", response_model=ChangesPage)
+async def get_changes(
+    project_id: str,
+    since: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_primary_db)
+):
+    """
+    Perubahan task, note, dan document sejak `since` (sync token dari
+    response sebelumnya). Ulangi dengan `sync_token` selama `has_more`
+    bernilai true.
+
+    Selalu dibaca dari primary: replica yang tertinggal lebih lama dari
+    SYNC_SAFETY_WINDOW bisa membuat perubahan terlewat selamanya.
+    """
+    await check_project_access(project_id, user_id, db)
+
+    return await read_changes(db, project_id, since, limit)
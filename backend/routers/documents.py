@@ -1,54 +1,70 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
 from utils.database import get_db
 from utils.auth import get_current_user_id
-from models import Document, ProjectMember
-from schemas import DocumentCreate, DocumentUpdate, DocumentResponse
+from utils.permissions import check_project_access, check_member_access, ensure_can_modify
+from utils.repository import ScopedRepository
+from utils.batch import BatchRepository
+from utils.changes import record_deletions
+from utils.events import publish_changes
+from utils.revisions import (
+    apply_patch, commit_revisions, list_revisions, reconstruct_revision,
+    remove_revisions, revision_rows, save_revisions,
+)
+from utils.search import index_entity, remove_entity, touches_index
+from utils.stats import increment_counter
+from utils.etag import bump_version, etag_matches, get_versions, make_etag, not_modified, set_etag
+from utils.pagination import load_fields, paginate, DEFAULT_PAGE_SIZE, LIST_VIEW_PATTERN, MAX_PAGE_SIZE
+from models import Document
+from schemas import (
+    DocumentCreate, DocumentUpdate, DocumentResponse, DocumentPage, DocumentSummary, DocumentSummaryPage,
+    DocumentBatchWrite, DocumentBatchResult, DocumentBatchRead,
+    ContentPatch, RevisionContent, RevisionPage,
+)
 
 router = APIRouter(prefix="/api/projects/{project_id}/documents", tags=["Documents"])
 
-def check_member_access(project_id: str, user_id: str, db: Session):
-    membership = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user_id,
-        ProjectMember.role.in_(["admin", "member"])
-    ).first()
+document_repository = ScopedRepository(Document, "Document not found")
+document_batch_repository = BatchRepository(Document, "document", "documents", "documents_total", "Document not found", revisions=True)
 
-    if not membership:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to modify this project"
-        )
-
-@router.get("", response_model=List[DocumentResponse])
+@router.get("", response_model=Union[DocumentPage, DocumentSummaryPage])
 async def get_documents(
     project_id: str,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: str = Query("full", pattern=LIST_VIEW_PATTERN),
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    membership = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user_id
-    ).first()
+    await check_project_access(project_id, user_id, db)
+
+    versions = await get_versions(db, project_id, "documents")
+    etag = make_etag(project_id, "documents", versions["documents"], request.url.query)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    if not membership:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this project"
-        )
+    stmt = select(Document).where(Document.project_id == project_id)
+    if view == "summary":
+        # Kolom teks besar tidak ikut di-SELECT.
+        stmt = stmt.options(load_fields(Document, DocumentSummary))
+    documents, next_cursor = await paginate(db, stmt, Document, cursor, limit)
 
-    documents = db.query(Document).filter(Document.project_id == project_id).all()
-    return documents
+    set_etag(response, etag)
+    page = DocumentSummaryPage if view == "summary" else DocumentPage
+    return page(items=documents, next_cursor=next_cursor)
 
 @router.post("", response_model=DocumentResponse, status_code=status.HTTP_201_CREATED)
 async def create_document(
     project_id: str,
     doc_data: DocumentCreate,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_member_access(project_id, user_id, db)
+    await check_member_access(project_id, user_id, db)
 
     new_document = Document(
         project_id=project_id,
@@ -59,40 +75,49 @@ async def create_document(
     )
 
     db.add(new_document)
-    db.commit()
-    db.refresh(new_document)
+    await index_entity(db, "document", new_document, replace=False)
+    await increment_counter(db, project_id, "documents_total", 1)
+    await bump_version(db, project_id, "documents")
+    await db.commit()
+    await publish_changes(project_id, "document", "created", [new_document.id])
 
     return new_document
 
+@router.get("/batch", response_model=DocumentBatchRead)
+async def get_documents_batch(
+    project_id: str,
+    ids: List[str] = Query(..., min_length=1),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    return await document_batch_repository.get_many(db, project_id, user_id, ids)
+
+@router.post("/batch", response_model=DocumentBatchResult)
+async def write_documents_batch(
+    project_id: str,
+    batch: DocumentBatchWrite,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    results = await document_batch_repository.write(db, project_id, user_id, batch)
+    return DocumentBatchResult(results=results)
+
 @router.get("/{doc_id}", response_model=DocumentResponse)
 async def get_document(
     project_id: str,
     doc_id: str,
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    membership = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user_id
-    ).first()
-
-    if not membership:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this project"
-        )
-
-    document = db.query(Document).filter(
-        Document.id == doc_id,
-        Document.project_id == project_id
-    ).first()
-
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
+    document, version = await document_repository.get_with_version(db, project_id, doc_id, user_id, "documents")
 
+    etag = make_etag(document.id, document.updated_at, version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    set_etag(response, etag)
     return document
 
 @router.put("/{doc_id}", response_model=DocumentResponse)
@@ -101,49 +126,96 @@ async def update_document(
     doc_id: str,
     doc_data: DocumentUpdate,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_member_access(project_id, user_id, db)
-
-    document = db.query(Document).filter(
-        Document.id == doc_id,
-        Document.project_id == project_id
-    ).first()
-
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
+    document = await document_repository.get(
+        db, project_id, doc_id, user_id, authorize=ensure_can_modify
+    )
 
     update_data = doc_data.dict(exclude_unset=True)
+    previous = document.content if "content" in update_data else None
     for key, value in update_data.items():
         setattr(document, key, value)
 
-    db.commit()
-    db.refresh(document)
+    if "content" in update_data:
+        await save_revisions(db, revision_rows("document", document, previous, user_id))
+
+    if touches_index("document", update_data):
+        await index_entity(db, "document", document)
+
+    await bump_version(db, project_id, "documents")
+    await commit_revisions(db)
+    await publish_changes(project_id, "document", "updated", [document.id])
 
     return document
 
-@router.delete("/{doc_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_document(
+@router.patch("/{doc_id}", response_model=DocumentResponse)
+async def patch_document(
     project_id: str,
     doc_id: str,
+    patch: ContentPatch,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_member_access(project_id, user_id, db)
+    """
+    Mengubah isi dengan diff terhadap `base_revision`. Bila revisi saat ini
+    sudah berbeda, dikembalikan 409 dan klien perlu memuat ulang.
+    """
+    document = await document_repository.get(
+        db, project_id, doc_id, user_id, authorize=ensure_can_modify
+    )
 
-    document = db.query(Document).filter(
-        Document.id == doc_id,
-        Document.project_id == project_id
-    ).first()
+    await apply_patch(db, "document", document, patch, user_id)
+    await index_entity(db, "document", document)
+    await bump_version(db, project_id, "documents")
+    await commit_revisions(db)
+    await publish_changes(project_id, "document", "updated", [document.id])
 
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found"
-        )
+    return document
 
-    db.delete(document)
-    db.commit()
+@router.get("/{doc_id}/revisions", response_model=RevisionPage)
+async def get_document_revisions(
+    project_id: str,
+    doc_id: str,
+    before: Optional[int] = Query(None, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    document = await document_repository.get(db, project_id, doc_id, user_id)
+
+    revisions, next_before = await list_revisions(db, "document", document.id, limit, before)
+    return RevisionPage(items=revisions, next_before=next_before)
+
+@router.get("/{doc_id}/revisions/{number}", response_model=RevisionContent)
+async def get_document_revision(
+    project_id: str,
+    doc_id: str,
+    number: int,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    document = await document_repository.get(db, project_id, doc_id, user_id)
+
+    content = await reconstruct_revision(db, "document", document, number)
+    if content is None and number != (document.revision or 0):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Revision not found")
+
+    return RevisionContent(number=number, content=content)
+
+@router.delete("/{doc_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_document(
+    project_id: str,
+    doc_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await document_repository.delete(db, project_id, doc_id, user_id)
+
+    await remove_entity(db, "document", doc_id)
+    await record_deletions(db, project_id, "document", [doc_id])
+    await remove_revisions(db, "document", [doc_id])
+    await increment_counter(db, project_id, "documents_total", -1)
+    await bump_version(db, project_id, "documents")
+    await db.commit()
+    await publish_changes(project_id, "document", "deleted", [doc_id])
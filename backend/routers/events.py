@@ -0,0 +1,120 @@
+import asyncio
+import time
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+from starlette.datastructures import Headers, QueryParams
+from utils.database import AsyncSessionLocal
+from utils.auth import decode_token, get_token_user_id
+from utils.permissions import check_project_access
+from utils.events import EVENT_HEARTBEAT, hub
+
+router = APIRouter(prefix="/api/projects/{project_id}", tags=["Events"])
+
+def _stream_token(query_params: QueryParams, headers: Headers) -> Optional[str]:
+    # EventSource dan WebSocket browser tidak bisa mengirim header
+    # Authorization, jadi token juga diterima lewat `?token=`.
+    token = query_params.get("token")
+    if token:
+        return token
+
+    scheme, _, credentials = headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and credentials:
+        return credentials
+    return None
+
+async def authorize_stream(project_id: str, token: Optional[str]) -> float:
+    """
+    Memvalidasi token dan akses project, lalu mengembalikan waktu kedaluwarsa
+    token. Session database hanya dipakai sebentar di sini, tidak ditahan
+    selama koneksi terbuka.
+    """
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    user_id = get_token_user_id(token)
+    async with AsyncSessionLocal() as db:
+        await check_project_access(project_id, user_id, db)
+
+    exp = decode_token(token).get("exp")
+    return exp if isinstance(exp, (int, float)) else float("inf")
+
+@router.get("/events")
+async def stream_events(project_id: str, request: Request):
+    """
+    Server-Sent Events berisi perubahan task, note, dan document di project.
+    Event `changes` membawa daftar `{type, op, id}`; event `resync` berarti
+    ada event yang terlewat dan klien perlu mengejar lewat changes feed.
+    Stream ditutup saat token kedaluwarsa agar klien tersambung lagi dengan
+    token baru.
+    """
+    expires_at = await authorize_stream(project_id, _stream_token(request.query_params, request.headers))
+
+    async def stream():
+        # Subscribe di dalam generator: bila klien putus sebelum stream
+        # dimulai, generator tidak pernah berjalan dan tidak ada yang bocor.
+        subscription = hub.subscribe(project_id)
+        try:
+            yield b"retry: 5000\n\n"
+            while (remaining := expires_at - time.time()) > 0:
+                message = await subscription.get(min(EVENT_HEARTBEAT, remaining))
+                if message is None:
+                    yield b": ping\n\n"
+                    continue
+
+                event, data = message
+                yield b"event: " + event.encode("utf-8") + b"\ndata: " + data + b"\n\n"
+        finally:
+            hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.websocket("/ws")
+async def project_socket(websocket: WebSocket, project_id: str):
+    """
+    Channel yang sama dengan `/events` lewat WebSocket. Setiap pesan adalah
+    `{"event": ..., "data": ...}`; pesan dari klien diabaikan.
+    """
+    try:
+        expires_at = await authorize_stream(project_id, _stream_token(websocket.query_params, websocket.headers))
+    except HTTPException as exc:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(exc.detail))
+        return
+
+    await websocket.accept()
+
+    async def send():
+        while (remaining := expires_at - time.time()) > 0:
+            message = await subscription.get(min(EVENT_HEARTBEAT, remaining))
+            if message is None:
+                await websocket.send_text('{"event":"ping"}')
+                continue
+
+            event, data = message
+            await websocket.send_text('{"event":"' + event + '","data":' + data.decode("utf-8") + "}")
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason="Token expired")
+
+    async def receive():
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+
+    subscription = hub.subscribe(project_id)
+    tasks = []
+    try:
+        tasks = [asyncio.create_task(send()), asyncio.create_task(receive())]
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        hub.unsubscribe(subscription)
@@ -1,54 +1,70 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
 from utils.database import get_db
 from utils.auth import get_current_user_id
-from models import Note, ProjectMember
-from schemas import NoteCreate, NoteUpdate, NoteResponse
+from utils.permissions import check_project_access, check_member_access, ensure_can_modify
+from utils.repository import ScopedRepository
+from utils.batch import BatchRepository
+from utils.changes import record_deletions
+from utils.events import publish_changes
+from utils.revisions import (
+    apply_patch, commit_revisions, list_revisions, reconstruct_revision,
+    remove_revisions, revision_rows, save_revisions,
+)
+from utils.search import index_entity, remove_entity, touches_index
+from utils.stats import increment_counter
+from utils.etag import bump_version, etag_matches, get_versions, make_etag, not_modified, set_etag
+from utils.pagination import load_fields, paginate, DEFAULT_PAGE_SIZE, LIST_VIEW_PATTERN, MAX_PAGE_SIZE
+from models import Note
+from schemas import (
+    NoteCreate, NoteUpdate, NoteResponse, NotePage, NoteSummary, NoteSummaryPage,
+    NoteBatchWrite, NoteBatchResult, NoteBatchRead,
+    ContentPatch, RevisionContent, RevisionPage,
+)
 
 router = APIRouter(prefix="/api/projects/{project_id}/notes", tags=["Notes"])
 
-def check_member_access(project_id: str, user_id: str, db: Session):
-    membership = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user_id,
-        ProjectMember.role.in_(["admin", "member"])
-    ).first()
+note_repository = ScopedRepository(Note, "Note not found")
+note_batch_repository = BatchRepository(Note, "note", "notes", "notes_total", "Note not found", revisions=True)
 
-    if not membership:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to modify this project"
-        )
-
-@router.get("", response_model=List[NoteResponse])
+@router.get("", response_model=Union[NotePage, NoteSummaryPage])
 async def get_notes(
     project_id: str,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: str = Query("full", pattern=LIST_VIEW_PATTERN),
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    membership = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user_id
-    ).first()
+    await check_project_access(project_id, user_id, db)
+
+    versions = await get_versions(db, project_id, "notes")
+    etag = make_etag(project_id, "notes", versions["notes"], request.url.query)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    if not membership:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this project"
-        )
+    stmt = select(Note).where(Note.project_id == project_id)
+    if view == "summary":
+        # Kolom teks besar tidak ikut di-SELECT.
+        stmt = stmt.options(load_fields(Note, NoteSummary))
+    notes, next_cursor = await paginate(db, stmt, Note, cursor, limit)
 
-    notes = db.query(Note).filter(Note.project_id == project_id).all()
-    return notes
+    set_etag(response, etag)
+    page = NoteSummaryPage if view == "summary" else NotePage
+    return page(items=notes, next_cursor=next_cursor)
 
 @router.post("", response_model=NoteResponse, status_code=status.HTTP_201_CREATED)
 async def create_note(
     project_id: str,
     note_data: NoteCreate,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_member_access(project_id, user_id, db)
+    await check_member_access(project_id, user_id, db)
 
     new_note = Note(
         project_id=project_id,
@@ -58,40 +74,49 @@ async def create_note(
     )
 
     db.add(new_note)
-    db.commit()
-    db.refresh(new_note)
+    await index_entity(db, "note", new_note, replace=False)
+    await increment_counter(db, project_id, "notes_total", 1)
+    await bump_version(db, project_id, "notes")
+    await db.commit()
+    await publish_changes(project_id, "note", "created", [new_note.id])
 
     return new_note
 
+@router.get("/batch", response_model=NoteBatchRead)
+async def get_notes_batch(
+    project_id: str,
+    ids: List[str] = Query(..., min_length=1),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    return await note_batch_repository.get_many(db, project_id, user_id, ids)
+
+@router.post("/batch", response_model=NoteBatchResult)
+async def write_notes_batch(
+    project_id: str,
+    batch: NoteBatchWrite,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    results = await note_batch_repository.write(db, project_id, user_id, batch)
+    return NoteBatchResult(results=results)
+
 @router.get("/{note_id}", response_model=NoteResponse)
 async def get_note(
     project_id: str,
     note_id: str,
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    membership = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user_id
-    ).first()
-
-    if not membership:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this project"
-        )
-
-    note = db.query(Note).filter(
-        Note.id == note_id,
-        Note.project_id == project_id
-    ).first()
-
-    if not note:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Note not found"
-        )
+    note, version = await note_repository.get_with_version(db, project_id, note_id, user_id, "notes")
 
+    etag = make_etag(note.id, note.updated_at, version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    set_etag(response, etag)
     return note
 
 @router.put("/{note_id}", response_model=NoteResponse)
@@ -100,49 +125,96 @@ async def update_note(
     note_id: str,
     note_data: NoteUpdate,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_member_access(project_id, user_id, db)
-
-    note = db.query(Note).filter(
-        Note.id == note_id,
-        Note.project_id == project_id
-    ).first()
-
-    if not note:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Note not found"
-        )
+    note = await note_repository.get(
+        db, project_id, note_id, user_id, authorize=ensure_can_modify
+    )
 
     update_data = note_data.dict(exclude_unset=True)
+    previous = note.content if "content" in update_data else None
     for key, value in update_data.items():
         setattr(note, key, value)
 
-    db.commit()
-    db.refresh(note)
+    if "content" in update_data:
+        await save_revisions(db, revision_rows("note", note, previous, user_id))
+
+    if touches_index("note", update_data):
+        await index_entity(db, "note", note)
+
+    await bump_version(db, project_id, "notes")
+    await commit_revisions(db)
+    await publish_changes(project_id, "note", "updated", [note.id])
 
     return note
 
-@router.delete("/{note_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_note(
+@router.patch("/{note_id}", response_model=NoteResponse)
+async def patch_note(
     project_id: str,
     note_id: str,
+    patch: ContentPatch,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_member_access(project_id, user_id, db)
+    """
+    Mengubah isi dengan diff terhadap `base_revision`. Bila revisi saat ini
+    sudah berbeda, dikembalikan 409 dan klien perlu memuat ulang.
+    """
+    note = await note_repository.get(
+        db, project_id, note_id, user_id, authorize=ensure_can_modify
+    )
 
-    note = db.query(Note).filter(
-        Note.id == note_id,
-        Note.project_id == project_id
-    ).first()
+    await apply_patch(db, "note", note, patch, user_id)
+    await index_entity(db, "note", note)
+    await bump_version(db, project_id, "notes")
+    await commit_revisions(db)
+    await publish_changes(project_id, "note", "updated", [note.id])
 
-    if not note:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Note not found"
-        )
+    return note
 
-    db.delete(note)
-    db.commit()
+@router.get("/{note_id}/revisions", response_model=RevisionPage)
+async def get_note_revisions(
+    project_id: str,
+    note_id: str,
+    before: Optional[int] = Query(None, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    note = await note_repository.get(db, project_id, note_id, user_id)
+
+    revisions, next_before = await list_revisions(db, "note", note.id, limit, before)
+    return RevisionPage(items=revisions, next_before=next_before)
+
+@router.get("/{note_id}/revisions/{number}", response_model=RevisionContent)
+async def get_note_revision(
+    project_id: str,
+    note_id: str,
+    number: int,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    note = await note_repository.get(db, project_id, note_id, user_id)
+
+    content = await reconstruct_revision(db, "note", note, number)
+    if content is None and number != (note.revision or 0):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Revision not found")
+
+    return RevisionContent(number=number, content=content)
+
+@router.delete("/{note_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_note(
+    project_id: str,
+    note_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await note_repository.delete(db, project_id, note_id, user_id)
+
+    await remove_entity(db, "note", note_id)
+    await record_deletions(db, project_id, "note", [note_id])
+    await remove_revisions(db, "note", [note_id])
+    await increment_counter(db, project_id, "notes_total", -1)
+    await bump_version(db, project_id, "notes")
+    await db.commit()
+    await publish_changes(project_id, "note", "deleted", [note_id])
@@ -1,50 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List
+import io
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timezone
+from typing import List, Optional
 from utils.database import get_db
 from utils.auth import get_current_user_id
-from models import Project, ProjectMember, RoleEnum, Task, StatusEnum
-from schemas import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectStats
+from utils.permissions import (
+    check_member_access, check_project_access, ensure_admin, get_member_role,
+    invalidate_project, remember_member_role,
+)
+from utils.repository import ScopedRepository
+from utils.changes import remove_tombstones
+from utils.events import publish_changes
+from utils.export import export_project
+from utils.revisions import remove_project_revisions
+from utils.importer import FORMATS, IMPORT_BATCH_SIZE, Importer, detect_format, read_records
+from utils.search import remove_project
+from utils.stats import read_project_stats, remove_project_stats
+from utils.etag import bump_version, etag_matches, get_versions, make_etag, not_modified, remove_versions, set_etag
+from models import Document, Note, Project, ProjectMember, ProjectStatistics, ProjectVersion, RoleEnum, Task
+from schemas import ImportReport, ProjectCreate, ProjectUpdate, ProjectResponse, ProjectStats
 
 router = APIRouter(prefix="/api/projects", tags=["Projects"])
 
-def check_project_access(project_id: str, user_id: str, db: Session, required_role: str = None):
-    membership = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user_id
-    ).first()
-
-    if not membership:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this project"
-        )
-
-    if required_role and membership.role != required_role:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"You need {required_role} role for this action"
-        )
-
-    return membership
+project_repository = ScopedRepository(Project, "Project not found", scope_column=Project.id)
 
 @router.get("", response_model=List[ProjectResponse])
 async def get_projects(
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    projects = db.query(Project).join(ProjectMember).filter(
+    result = await db.scalars(select(Project).join(ProjectMember).where(
         ProjectMember.user_id == user_id
-    ).all()
+    ))
 
-    return projects
+    return result.all()
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreate,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     new_project = Project(
         name=project_data.name,
@@ -54,36 +52,35 @@ async def create_project(
     )
 
     db.add(new_project)
-    db.commit()
-    db.refresh(new_project)
-
-    new_member = ProjectMember(
-        project_id=new_project.id,
-        user_id=user_id,
-        role=RoleEnum.admin
-    )
-
-    db.add(new_member)
-    db.commit()
+    # Flush mengirim INSERT project lebih dulu (id-nya dibutuhkan baris
+    # lain); semuanya tetap satu transaksi dengan satu commit.
+    await db.flush()
+
+    db.add_all([
+        ProjectMember(project_id=new_project.id, user_id=user_id, role=RoleEnum.admin),
+        ProjectStatistics(project_id=new_project.id),
+        ProjectVersion(project_id=new_project.id),
+    ])
+    await db.commit()
+    remember_member_role(new_project.id, user_id, RoleEnum.admin)
 
     return new_project
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: str,
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_project_access(project_id, user_id, db)
-
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project, version = await project_repository.get_with_version(db, project_id, project_id, user_id, "project")
 
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
+    etag = make_etag(project.id, project.updated_at, version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
+    set_etag(response, etag)
     return project
 
 @router.put("/{project_id}", response_model=ProjectResponse)
@@ -91,24 +88,19 @@ async def update_project(
     project_id: str,
     project_data: ProjectUpdate,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_project_access(project_id, user_id, db, required_role="admin")
-
-    project = db.query(Project).filter(Project.id == project_id).first()
-
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
+    project = await project_repository.get(
+        db, project_id, project_id, user_id, authorize=ensure_admin
+    )
 
     update_data = project_data.dict(exclude_unset=True)
     for key, value in update_data.items():
         setattr(project, key, value)
 
-    db.commit()
-    db.refresh(project)
+    await bump_version(db, project_id, "project")
+    await db.commit()
+    await publish_changes(project_id, "project", "updated", [project_id])
 
     return project
 
@@ -116,39 +108,81 @@ async def update_project(
 async def delete_project(
     project_id: str,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_project_access(project_id, user_id, db, required_role="admin")
-
-    project = db.query(Project).filter(Project.id == project_id).first()
-
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found"
-        )
-
-    db.delete(project)
-    db.commit()
+    # Otorisasi cukup sekali di awal: setelah baris anak (termasuk
+    # membership) terhapus, role tidak bisa diperiksa ulang.
+    ensure_admin(await get_member_role(project_id, user_id, db))
+
+    # Baris anak dihapus langsung per tabel, bukan lewat cascade ORM yang
+    # memuat setiap task/note/document ke memori lebih dulu.
+    await remove_project(db, project_id)
+    await remove_project_stats(db, project_id)
+    await remove_versions(db, project_id)
+    await remove_tombstones(db, project_id)
+    await remove_project_revisions(db, project_id)
+    for model in (Task, Note, Document, ProjectMember):
+        await db.execute(delete(model).where(model.project_id == project_id))
+    await db.execute(delete(Project).where(Project.id == project_id))
+    await db.commit()
+    # Role semua anggota project di cache dibuang, bukan hanya milik user ini.
+    invalidate_project(project_id)
+    await publish_changes(project_id, "project", "deleted", [project_id])
 
 @router.get("/{project_id}/stats", response_model=ProjectStats)
 async def get_project_stats(
     project_id: str,
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_project_access(project_id, user_id, db)
+    await check_project_access(project_id, user_id, db)
+
+    # Jumlah overdue berubah seiring tanggal, jadi tanggal ikut masuk ETag.
+    versions = await get_versions(db, project_id, "tasks", "notes", "documents")
+    etag = make_etag(project_id, "stats", *versions.values(), datetime.now(timezone.utc).date())
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    tasks_total = db.query(func.count(Task.id)).filter(
-        Task.project_id == project_id
-    ).scalar()
+    stats = await read_project_stats(db, project_id)
 
-    tasks_completed = db.query(func.count(Task.id)).filter(
-        Task.project_id == project_id,
-        Task.status == StatusEnum.done
-    ).scalar()
+    set_etag(response, etag)
+    return ProjectStats(**stats)
 
-    return ProjectStats(
-        tasks_total=tasks_total or 0,
-        tasks_completed=tasks_completed or 0
+@router.get("/{project_id}/export")
+async def export_project_ndjson(
+    project_id: str,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await check_project_access(project_id, user_id, db)
+
+    return StreamingResponse(
+        export_project(project_id),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="project-{project_id}.ndjson"'}
     )
+
+@router.post("/{project_id}/import", response_model=ImportReport)
+async def import_project_data(
+    project_id: str,
+    file: UploadFile = File(...),
+    entity_type: Optional[str] = Query(None, alias="type"),
+    file_format: Optional[str] = Query(None, alias="format", pattern="^(" + "|".join(FORMATS) + ")$"),
+    batch_size: int = Query(IMPORT_BATCH_SIZE, ge=1, le=10000),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Import task, note, atau document dari file NDJSON/CSV. `type` wajib bila
+    baris tidak membawa type sendiri (CSV tanpa kolom `entity_type`, NDJSON
+    selain format export).
+    Baris yang tidak valid dilaporkan per nomor baris, sisanya tetap masuk.
+    """
+    await check_member_access(project_id, user_id, db)
+
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", errors="replace", newline="")
+    records = read_records(lines, file_format or detect_format(file.filename), entity_type)
+
+    return await Importer(db, project_id, user_id, batch_size).run(records)
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from utils.database import get_db
+from utils.auth import get_current_user_id
+from utils.permissions import check_project_access
+from utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from utils.search import search_project
+from schemas import SearchPage
+
+router = APIRouter(prefix="/api/projects/{project_id}/search", tags=["Search"])
+
+@router.get("", response_model=SearchPage)
+async def search(
+    project_id: str,
+    q: str = Query(..., min_length=1, max_length=200),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    await check_project_access(project_id, user_id, db)
+
+    hits, next_cursor = await search_project(db, project_id, q, limit, cursor)
+
+    return SearchPage(items=hits, next_cursor=next_cursor)
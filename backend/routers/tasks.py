@@ -1,54 +1,65 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Union
 from utils.database import get_db
 from utils.auth import get_current_user_id
-from models import Task, ProjectMember
-from schemas import TaskCreate, TaskUpdate, TaskResponse
+from utils.permissions import check_project_access, check_member_access, ensure_can_modify
+from utils.repository import ScopedRepository
+from utils.batch import TaskBatchRepository
+from utils.changes import record_deletions
+from utils.events import publish_changes
+from utils.search import index_entity, remove_entity, touches_index
+from utils.stats import apply_task_change, task_snapshot
+from utils.etag import bump_version, etag_matches, get_versions, make_etag, not_modified, set_etag
+from utils.pagination import load_fields, paginate, DEFAULT_PAGE_SIZE, LIST_VIEW_PATTERN, MAX_PAGE_SIZE
+from models import Task
+from schemas import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskPage, TaskSummary, TaskSummaryPage,
+    TaskBatchWrite, TaskBatchResult, TaskBatchRead,
+)
 
 router = APIRouter(prefix="/api/projects/{project_id}/tasks", tags=["Tasks"])
 
-def check_member_access(project_id: str, user_id: str, db: Session):
-    membership = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user_id,
-        ProjectMember.role.in_(["admin", "member"])
-    ).first()
+task_repository = ScopedRepository(Task, "Task not found")
+task_batch_repository = TaskBatchRepository(Task, "task", "tasks", "tasks_total", "Task not found")
 
-    if not membership:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have permission to modify this project"
-        )
-
-@router.get("", response_model=List[TaskResponse])
+@router.get("", response_model=Union[TaskPage, TaskSummaryPage])
 async def get_tasks(
     project_id: str,
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    view: str = Query("full", pattern=LIST_VIEW_PATTERN),
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    membership = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user_id
-    ).first()
+    await check_project_access(project_id, user_id, db)
+
+    versions = await get_versions(db, project_id, "tasks")
+    etag = make_etag(project_id, "tasks", versions["tasks"], request.url.query)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    if not membership:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this project"
-        )
+    stmt = select(Task).where(Task.project_id == project_id)
+    if view == "summary":
+        # Kolom teks besar tidak ikut di-SELECT.
+        stmt = stmt.options(load_fields(Task, TaskSummary))
+    tasks, next_cursor = await paginate(db, stmt, Task, cursor, limit)
 
-    tasks = db.query(Task).filter(Task.project_id == project_id).all()
-    return tasks
+    set_etag(response, etag)
+    page = TaskSummaryPage if view == "summary" else TaskPage
+    return page(items=tasks, next_cursor=next_cursor)
 
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     project_id: str,
     task_data: TaskCreate,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_member_access(project_id, user_id, db)
+    await check_member_access(project_id, user_id, db)
 
     new_task = Task(
         project_id=project_id,
@@ -62,40 +73,49 @@ async def create_task(
     )
 
     db.add(new_task)
-    db.commit()
-    db.refresh(new_task)
+    await index_entity(db, "task", new_task, replace=False)
+    await apply_task_change(db, project_id, None, task_snapshot(new_task))
+    await bump_version(db, project_id, "tasks")
+    await db.commit()
+    await publish_changes(project_id, "task", "created", [new_task.id])
 
     return new_task
 
+@router.get("/batch", response_model=TaskBatchRead)
+async def get_tasks_batch(
+    project_id: str,
+    ids: List[str] = Query(..., min_length=1),
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    return await task_batch_repository.get_many(db, project_id, user_id, ids)
+
+@router.post("/batch", response_model=TaskBatchResult)
+async def write_tasks_batch(
+    project_id: str,
+    batch: TaskBatchWrite,
+    user_id: str = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    results = await task_batch_repository.write(db, project_id, user_id, batch)
+    return TaskBatchResult(results=results)
+
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     project_id: str,
     task_id: str,
+    request: Request,
+    response: Response,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    membership = db.query(ProjectMember).filter(
-        ProjectMember.project_id == project_id,
-        ProjectMember.user_id == user_id
-    ).first()
-
-    if not membership:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You don't have access to this project"
-        )
-
-    task = db.query(Task).filter(
-        Task.id == task_id,
-        Task.project_id == project_id
-    ).first()
-
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
-        )
+    task, version = await task_repository.get_with_version(db, project_id, task_id, user_id, "tasks")
 
+    etag = make_etag(task.id, task.updated_at, version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    set_etag(response, etag)
     return task
 
 @router.put("/{task_id}", response_model=TaskResponse)
@@ -104,27 +124,26 @@ async def update_task(
     task_id: str,
     task_data: TaskUpdate,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_member_access(project_id, user_id, db)
-
-    task = db.query(Task).filter(
-        Task.id == task_id,
-        Task.project_id == project_id
-    ).first()
-
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
-        )
+    # Dikunci sampai commit: delta counter dihitung dari snapshot ini.
+    task = await task_repository.get(
+        db, project_id, task_id, user_id, authorize=ensure_can_modify, lock=True
+    )
 
+    before = task_snapshot(task)
     update_data = task_data.dict(exclude_unset=True)
     for key, value in update_data.items():
         setattr(task, key, value)
 
-    db.commit()
-    db.refresh(task)
+    await apply_task_change(db, project_id, before, task_snapshot(task))
+
+    if touches_index("task", update_data):
+        await index_entity(db, "task", task)
+
+    await bump_version(db, project_id, "tasks")
+    await db.commit()
+    await publish_changes(project_id, "task", "updated", [task.id])
 
     return task
 
@@ -133,20 +152,15 @@ async def delete_task(
     project_id: str,
     task_id: str,
     user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    check_member_access(project_id, user_id, db)
-
-    task = db.query(Task).filter(
-        Task.id == task_id,
-        Task.project_id == project_id
-    ).first()
-
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found"
-        )
+    row = await task_repository.delete(
+        db, project_id, task_id, user_id, Task.status, Task.priority, Task.due_date
+    )
 
-    db.delete(task)
-    db.commit()
+    await remove_entity(db, "task", task_id)
+    await record_deletions(db, project_id, "task", [task_id])
+    await apply_task_change(db, project_id, task_snapshot(row), None)
+    await bump_version(db, project_id, "tasks")
+    await db.commit()
+    await publish_changes(project_id, "task", "deleted", [task_id])
@@ -7,9 +7,22 @@ from schemas.project import (
     ProjectMemberCreate,
     ProjectMemberResponse,
 )
-from schemas.note import NoteCreate, NoteUpdate, NoteResponse
-from schemas.task import TaskCreate, TaskUpdate, TaskResponse
-from schemas.document import DocumentCreate, DocumentUpdate, DocumentResponse
+from schemas.note import (
+    NoteCreate, NoteUpdate, NoteResponse, NotePage, NoteSummary, NoteSummaryPage,
+    NoteBatchWrite, NoteBatchResult, NoteBatchRead,
+)
+from schemas.task import (
+    TaskCreate, TaskUpdate, TaskResponse, TaskPage, TaskSummary, TaskSummaryPage,
+    TaskBatchWrite, TaskBatchResult, TaskBatchRead,
+)
+from schemas.document import (
+    DocumentCreate, DocumentUpdate, DocumentResponse, DocumentPage, DocumentSummary, DocumentSummaryPage,
+    DocumentBatchWrite, DocumentBatchResult, DocumentBatchRead,
+)
+from schemas.search import SearchHit, SearchPage
+from schemas.batch import BatchItemResult, ImportReport, ImportRowError
+from schemas.changes import ChangesPage, DeletedEntity
+from schemas.revision import ContentPatch, RevisionContent, RevisionInfo, RevisionPage, TextOp
 
 __all__ = [
     "UserCreate",
@@ -25,10 +38,40 @@ __all__ = [
     "NoteCreate",
     "NoteUpdate",
     "NoteResponse",
+    "NotePage",
+    "NoteSummary",
+    "NoteSummaryPage",
+    "NoteBatchWrite",
+    "NoteBatchResult",
+    "NoteBatchRead",
     "TaskCreate",
     "TaskUpdate",
     "TaskResponse",
+    "TaskPage",
+    "TaskSummary",
+    "TaskSummaryPage",
+    "TaskBatchWrite",
+    "TaskBatchResult",
+    "TaskBatchRead",
     "DocumentCreate",
     "DocumentUpdate",
     "DocumentResponse",
+    "DocumentPage",
+    "DocumentSummary",
+    "DocumentSummaryPage",
+    "DocumentBatchWrite",
+    "DocumentBatchResult",
+    "DocumentBatchRead",
+    "SearchHit",
+    "SearchPage",
+    "BatchItemResult",
+    "ImportReport",
+    "ImportRowError",
+    "ChangesPage",
+    "DeletedEntity",
+    "ContentPatch",
+    "RevisionContent",
+    "RevisionInfo",
+    "RevisionPage",
+    "TextOp",
 ]
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class BatchItemResult(BaseModel):
+    op: str
+    index: int
+    id: Optional[str] = None
+    status: int
+    detail: Optional[str] = None
+
+class BatchReadBase(BaseModel):
+    missing: List[str] = []
+
+class ImportRowError(BaseModel):
+    line: int
+    detail: str
+
+class ImportReport(BaseModel):
+    imported: int
+    failed: int
+    errors: List[ImportRowError] = []
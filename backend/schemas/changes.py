@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List
+from schemas.task import TaskResponse
+from schemas.note import NoteResponse
+from schemas.document import DocumentResponse
+
+class DeletedEntity(BaseModel):
+    type: str
+    id: str
+    deleted_at: datetime
+
+class ChangesPage(BaseModel):
+    tasks: List[TaskResponse] = []
+    notes: List[NoteResponse] = []
+    documents: List[DocumentResponse] = []
+    deleted: List[DeletedEntity] = []
+    sync_token: str
+    has_more: bool
@@ -1,6 +1,8 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from utils.ids import UUIDStr
+from schemas.batch import BatchItemResult, BatchReadBase
 
 class DocumentBase(BaseModel):
     title: str
@@ -18,9 +20,47 @@ class DocumentUpdate(BaseModel):
 class DocumentResponse(DocumentBase):
     id: str
     project_id: str
+    revision: int = 0
     created_by: str
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
+
+class DocumentSummary(BaseModel):
+    id: str
+    project_id: str
+    title: str
+    type: Optional[str] = None
+    created_by: str
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class DocumentPage(BaseModel):
+    items: List[DocumentResponse]
+    next_cursor: Optional[str] = None
+
+class DocumentSummaryPage(BaseModel):
+    items: List[DocumentSummary]
+    next_cursor: Optional[str] = None
+
+class DocumentBatchUpdate(DocumentUpdate):
+    id: UUIDStr
+
+class DocumentBatchWrite(BaseModel):
+    create: List[DocumentCreate] = []
+    update: List[DocumentBatchUpdate] = []
+    delete: List[UUIDStr] = []
+
+class DocumentBatchItem(BatchItemResult):
+    item: Optional[DocumentResponse] = None
+
+class DocumentBatchResult(BaseModel):
+    results: List[DocumentBatchItem]
+
+class DocumentBatchRead(BatchReadBase):
+    items: List[DocumentResponse]
@@ -1,6 +1,8 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from utils.ids import UUIDStr
+from schemas.batch import BatchItemResult, BatchReadBase
 
 class NoteBase(BaseModel):
     title: str
@@ -16,9 +18,46 @@ class NoteUpdate(BaseModel):
 class NoteResponse(NoteBase):
     id: str
     project_id: str
+    revision: int = 0
     created_by: str
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
+
+class NoteSummary(BaseModel):
+    id: str
+    project_id: str
+    title: str
+    created_by: str
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class NotePage(BaseModel):
+    items: List[NoteResponse]
+    next_cursor: Optional[str] = None
+
+class NoteSummaryPage(BaseModel):
+    items: List[NoteSummary]
+    next_cursor: Optional[str] = None
+
+class NoteBatchUpdate(NoteUpdate):
+    id: UUIDStr
+
+class NoteBatchWrite(BaseModel):
+    create: List[NoteCreate] = []
+    update: List[NoteBatchUpdate] = []
+    delete: List[UUIDStr] = []
+
+class NoteBatchItem(BatchItemResult):
+    item: Optional[NoteResponse] = None
+
+class NoteBatchResult(BaseModel):
+    results: List[NoteBatchItem]
+
+class NoteBatchRead(BatchReadBase):
+    items: List[NoteResponse]
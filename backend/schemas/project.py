@@ -1,6 +1,7 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
+from utils.ids import UUIDStr
 
 class ProjectBase(BaseModel):
     name: str
@@ -27,13 +28,18 @@ class ProjectResponse(ProjectBase):
 class ProjectStats(BaseModel):
     tasks_total: int
     tasks_completed: int
+    tasks_overdue: int = 0
+    tasks_by_status: Dict[str, int] = {}
+    tasks_by_priority: Dict[str, int] = {}
+    notes_total: int = 0
+    documents_total: int = 0
 
 class ProjectMemberBase(BaseModel):
     user_id: str
     role: str
 
 class ProjectMemberCreate(ProjectMemberBase):
-    pass
+    user_id: UUIDStr
 
 class ProjectMemberResponse(ProjectMemberBase):
     id: str
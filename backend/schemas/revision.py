@@ -0,0 +1,42 @@
+from pydantic import BaseModel, Field, model_validator
+from datetime import datetime
+from typing import List, Optional
+
+class TextOp(BaseModel):
+    """
+    Satu operasi diff terhadap isi di `base_revision`, dihitung dalam
+    karakter: pertahankan (`retain`), sisipkan (`insert`), atau hapus
+    (`delete`). Sisa teks setelah operasi terakhir dipertahankan.
+    """
+    retain: Optional[int] = Field(None, ge=1)
+    insert: Optional[str] = Field(None, min_length=1)
+    delete: Optional[int] = Field(None, ge=1)
+
+    @model_validator(mode="after")
+    def check_single_op(self):
+        if sum(value is not None for value in (self.retain, self.insert, self.delete)) != 1:
+            raise ValueError("Each op must have exactly one of retain, insert, delete")
+        return self
+
+class ContentPatch(BaseModel):
+    base_revision: int = Field(..., ge=0)
+    ops: List[TextOp]
+    title: Optional[str] = None
+
+class RevisionInfo(BaseModel):
+    number: int
+    kind: str
+    size: int
+    created_by: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class RevisionPage(BaseModel):
+    items: List[RevisionInfo]
+    next_before: Optional[int] = None
+
+class RevisionContent(BaseModel):
+    number: int
+    content: Optional[str] = None
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+
+class SearchHit(BaseModel):
+    type: str
+    id: str
+    title: str
+    snippet: Optional[str] = None
+    score: int
+    updated_at: datetime
+
+class SearchPage(BaseModel):
+    items: List[SearchHit]
+    next_cursor: Optional[str] = None
@@ -1,6 +1,8 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from utils.ids import UUIDStr
+from schemas.batch import BatchItemResult, BatchReadBase
 
 class TaskBase(BaseModel):
     title: str
@@ -11,14 +13,14 @@ class TaskBase(BaseModel):
     due_date: Optional[datetime] = None
 
 class TaskCreate(TaskBase):
-    pass
+    assigned_to: Optional[UUIDStr] = None
 
 class TaskUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     status: Optional[str] = None
     priority: Optional[str] = None
-    assigned_to: Optional[str] = None
+    assigned_to: Optional[UUIDStr] = None
     due_date: Optional[datetime] = None
 
 class TaskResponse(TaskBase):
@@ -30,3 +32,43 @@ class TaskResponse(TaskBase):
 
     class Config:
         from_attributes = True
+
+class TaskSummary(BaseModel):
+    id: str
+    project_id: str
+    title: str
+    status: str
+    priority: Optional[str] = None
+    assigned_to: Optional[str] = None
+    due_date: Optional[datetime] = None
+    created_by: str
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class TaskPage(BaseModel):
+    items: List[TaskResponse]
+    next_cursor: Optional[str] = None
+
+class TaskSummaryPage(BaseModel):
+    items: List[TaskSummary]
+    next_cursor: Optional[str] = None
+
+class TaskBatchUpdate(TaskUpdate):
+    id: UUIDStr
+
+class TaskBatchWrite(BaseModel):
+    create: List[TaskCreate] = []
+    update: List[TaskBatchUpdate] = []
+    delete: List[UUIDStr] = []
+
+class TaskBatchItem(BatchItemResult):
+    item: Optional[TaskResponse] = None
+
+class TaskBatchResult(BaseModel):
+    results: List[TaskBatchItem]
+
+class TaskBatchRead(BatchReadBase):
+    items: List[TaskResponse]
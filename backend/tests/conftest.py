@@ -0,0 +1,38 @@
+import os
+import tempfile
+
+# Database uji dipasang sebelum modul aplikasi di-import, karena engine
+# dibuat saat import utils.database.
+_db_path = os.path.join(tempfile.mkdtemp(prefix="devnotex_tests_"), "test.db")
+os.environ["DATABASE_URL"] = "sqlite:///" + _db_path
+os.environ.pop("DATABASE_REPLICA_URLS", None)
+
+import pytest
+from fastapi.testclient import TestClient
+from main import app
+from utils.database import Base, SessionLocal, engine
+from utils.seed import seed_database
+
+EMAIL = "demo@devnotex.com"
+PASSWORD = "testpass"
+
+@pytest.fixture(scope="session")
+def client():
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        seed_database(db)
+
+    with TestClient(app) as client:
+        yield client
+
+@pytest.fixture(scope="session")
+def auth_headers(client):
+    response = client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+@pytest.fixture
+def project(client, auth_headers):
+    response = client.post("/api/projects", json={"name": "Test"}, headers=auth_headers)
+    response.raise_for_status()
+    return response.json()
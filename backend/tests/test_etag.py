@@ -0,0 +1,46 @@
+from sqlalchemy import event
+from utils.database import async_engine
+from utils.permissions import membership_cache
+
+def count_statements(call):
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        response = call()
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", on_execute)
+    return response, statements
+
+def test_conditional_get_is_one_statement(client, auth_headers, project):
+    task = client.post(f"/api/projects/{project['id']}/tasks", json={"title": "t"}, headers=auth_headers).json()
+    url = f"/api/projects/{project['id']}/tasks/{task['id']}"
+    etag = client.get(url, headers=auth_headers).headers["ETag"]
+
+    for warm in (True, False):
+        if not warm:
+            membership_cache.clear()
+        response, statements = count_statements(
+            lambda: client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        )
+        assert response.status_code == 304
+        assert len(statements) == 1
+
+    client.put(url, json={"title": "t2"}, headers=auth_headers)
+    response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+def test_non_member_gets_no_etag(client, auth_headers, project):
+    url = f"/api/projects/{project['id']}"
+    etag = client.get(url, headers=auth_headers).headers["ETag"]
+
+    client.post("/api/auth/register", json={"email": "outsider@devnotex.com", "password": "outsider", "full_name": "O"})
+    token = client.post("/api/auth/login", json={"email": "outsider@devnotex.com", "password": "outsider"}).json()["access_token"]
+
+    response = client.get(url, headers={"Authorization": f"Bearer {token}", "If-None-Match": etag})
+    assert response.status_code == 403
+    assert "ETag" not in response.headers
@@ -0,0 +1,24 @@
+import asyncio
+from starlette.requests import Request
+from routers import events
+from utils.events import hub
+
+def test_sse_subscribes_only_when_stream_starts(project, monkeypatch):
+    async def authorized(project_id, token):
+        return float("inf")
+
+    monkeypatch.setattr(events, "authorize_stream", authorized)
+    request = Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": []})
+
+    # Klien yang putus sebelum body dikirim: generator tidak pernah berjalan.
+    response = asyncio.run(events.stream_events(project["id"], request))
+    assert response.status_code == 200
+    assert project["id"] not in hub.subscriptions
+
+def test_websocket_unsubscribes_on_disconnect(client, auth_headers, project):
+    token = auth_headers["Authorization"].split()[1]
+
+    with client.websocket_connect(f"/api/projects/{project['id']}/ws?token={token}"):
+        pass
+
+    assert project["id"] not in hub.subscriptions
@@ -0,0 +1,44 @@
+import uuid
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.exc import StatementError
+from models import Task
+from utils.database import engine
+from utils.ids import BinaryUUID, new_id
+
+def test_task_with_malformed_assignee_is_rejected(client, auth_headers, project):
+    base = f"/api/projects/{project['id']}/tasks"
+
+    response = client.post(base, json={"title": "t", "assigned_to": "bob"}, headers=auth_headers)
+    assert response.status_code == 422
+
+    response = client.get(base, headers=auth_headers)
+    assert response.status_code == 200
+
+def test_malformed_path_id_is_not_found(client, auth_headers, project):
+    url = f"/api/projects/{project['id']}/tasks/not-a-uuid"
+
+    assert client.get(url, headers=auth_headers).status_code == 404
+    assert client.put(url, json={"title": "x"}, headers=auth_headers).status_code == 404
+    assert client.delete(url, headers=auth_headers).status_code == 404
+
+def test_batch_with_malformed_id_is_rejected(client, auth_headers, project):
+    response = client.post(
+        f"/api/projects/{project['id']}/tasks/batch", json={"delete": ["bob"]}, headers=auth_headers
+    )
+    assert response.status_code == 422
+
+def test_malformed_id_is_not_written():
+    with pytest.raises(StatementError, match="Invalid UUID"):
+        with engine.begin() as connection:
+            connection.execute(insert(Task.__table__), {
+                "id": new_id(), "project_id": "bob", "title": "t", "created_by": new_id(),
+            })
+
+def test_result_value_tolerates_legacy_values():
+    column_type = BinaryUUID()
+    value = uuid.uuid4()
+
+    assert column_type.process_result_value(value.bytes, None) == str(value)
+    assert column_type.process_result_value(str(value).encode(), None) == str(value)
+    assert column_type.process_result_value(b"", None) == ""
@@ -0,0 +1,38 @@
+from sqlalchemy.exc import IntegrityError
+from utils import importer
+
+def test_import_csv_reports_invalid_rows(client, auth_headers, project):
+    rows = ["title,status,assigned_to"]
+    rows += [f"task {i},todo," for i in range(5)]
+    rows += ["bad status,nope,", "bad assignee,todo,bob"]
+    payload = "\n".join(rows) + "\n"
+
+    response = client.post(
+        f"/api/projects/{project['id']}/import?type=task&batch_size=2",
+        files={"file": ("tasks.csv", payload.encode(), "text/csv")},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+
+    report = response.json()
+    assert report["imported"] == 5
+    assert report["failed"] == 2
+    assert [error["line"] for error in report["errors"]] == [7, 8]
+
+    tasks = client.get(f"/api/projects/{project['id']}/tasks", headers=auth_headers).json()
+    assert len(tasks["items"]) == 5
+
+def test_import_database_error_is_not_leaked(client, auth_headers, project, monkeypatch):
+    async def failing_bump(db, project_id, collection):
+        raise IntegrityError("INSERT INTO tasks ...", {}, Exception("Duplicate entry for key 'tasks.PRIMARY'"))
+
+    monkeypatch.setattr(importer, "bump_version", failing_bump)
+
+    response = client.post(
+        f"/api/projects/{project['id']}/import?type=task",
+        files={"file": ("tasks.csv", b"title\none\ntwo\n", "text/csv")},
+        headers=auth_headers,
+    )
+    report = response.json()
+    assert report["imported"] == 0
+    assert [error["detail"] for error in report["errors"]] == ["Database error", "Database error"]
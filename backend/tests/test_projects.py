@@ -0,0 +1,11 @@
+from utils.permissions import membership_cache
+
+def test_delete_project_with_cold_membership_cache(client, auth_headers, project):
+    base = f"/api/projects/{project['id']}"
+    membership_cache.clear()
+
+    response = client.delete(base, headers=auth_headers)
+    assert response.status_code == 204
+
+    assert client.get(base, headers=auth_headers).status_code == 403
+    assert all(item["id"] != project["id"] for item in client.get("/api/projects", headers=auth_headers).json())
@@ -0,0 +1,17 @@
+from utils import database
+
+def test_unreachable_replica_falls_back_to_primary(client, auth_headers, project, monkeypatch, tmp_path):
+    replica_set = database.ReplicaSet([f"sqlite:///{tmp_path}/missing/replica.db"])
+    monkeypatch.setattr(database, "replicas", replica_set)
+    url = f"/api/projects/{project['id']}"
+
+    # Koneksi pertama gagal dan replica ditandai mati; request berikutnya
+    # langsung ke primary. Keduanya terhitung sebagai fallback.
+    for expected in (1, 2):
+        assert client.get(url, headers=auth_headers).status_code == 200
+        assert replica_set.fallbacks == expected
+
+    stats = replica_set.stats()["replicas"][0]
+    assert stats["failures"] == 1
+    assert stats["healthy"] is False
+    assert stats["sessions"] == 0
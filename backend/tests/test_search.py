@@ -0,0 +1,30 @@
+import pytest
+from utils.pagination import encode_keyset
+
+def test_search_pages_with_cursor(client, auth_headers, project):
+    base = f"/api/projects/{project['id']}"
+    for i in range(3):
+        client.post(f"{base}/notes", json={"title": f"deploy {i}", "content": "cache"}, headers=auth_headers)
+
+    page = client.get(f"{base}/search", params={"q": "deploy", "limit": 2}, headers=auth_headers).json()
+    assert len(page["items"]) == 2
+
+    rest = client.get(
+        f"{base}/search", params={"q": "deploy", "limit": 2, "cursor": page["next_cursor"]}, headers=auth_headers
+    ).json()
+    assert len(rest["items"]) == 1
+
+@pytest.mark.parametrize("values", [
+    [{"score": 1}, "note", "x"],
+    [True, "note", "x"],
+    [3, ["note"], "x"],
+    [3, "note", 7],
+])
+def test_search_rejects_malformed_cursor(client, auth_headers, project, values):
+    response = client.get(
+        f"/api/projects/{project['id']}/search",
+        params={"q": "deploy", "cursor": encode_keyset(values)},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,31 @@
+from sqlalchemy import delete, insert
+from models import ProjectStatistics
+from utils import stats
+from utils.database import engine
+
+def test_concurrent_first_stats_read_reuses_existing_row(client, auth_headers, project, monkeypatch):
+    with engine.begin() as connection:
+        connection.execute(delete(ProjectStatistics).where(ProjectStatistics.project_id == project["id"]))
+
+    def racing_rebuild(db, project_id):
+        # Read lain menyisipkan baris stats tepat sebelum rebuild ini menulis.
+        with engine.begin() as other:
+            other.execute(insert(ProjectStatistics).values(project_id=project_id))
+        db.add(ProjectStatistics(project_id=project_id))
+        db.flush()
+
+    monkeypatch.setattr(stats, "rebuild_project_stats", racing_rebuild)
+
+    response = client.get(f"/api/projects/{project['id']}/stats", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["tasks_total"] == 0
+
+def test_task_update_keeps_counters_consistent(client, auth_headers, project):
+    base = f"/api/projects/{project['id']}"
+    task = client.post(f"{base}/tasks", json={"title": "t", "status": "todo"}, headers=auth_headers).json()
+    client.put(f"{base}/tasks/{task['id']}", json={"status": "done"}, headers=auth_headers)
+
+    body = client.get(f"{base}/stats", headers=auth_headers).json()
+    assert body["tasks_total"] == 1
+    assert body["tasks_by_status"]["todo"] == 0
+    assert body["tasks_by_status"]["done"] == 1
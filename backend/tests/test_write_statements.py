@@ -0,0 +1,110 @@
+"""
+Jumlah statement SQL dan commit per endpoint tulis.
+
+Setiap endpoint create/update/delete dipanggil lewat aplikasi (membership
+cache sudah hangat) dan statement yang dikirim ke database dihitung, untuk
+menangkap regresi seperti refresh setelah commit, commit ganda, atau
+SELECT sebelum DELETE.
+"""
+import pytest
+from sqlalchemy import event
+from utils.database import async_engine
+
+# endpoint -> (maks. statement, maks. commit) untuk skenario di bawah pada
+# SQLite. Di MySQL (tanpa DELETE ... RETURNING) delete task butuh satu
+# SELECT kolom tambahan.
+BUDGETS = {
+    "register": (2, 1),
+    "create project": (4, 1),
+    "update project": (3, 1),
+    "create task": (3, 1),
+    "update task": (4, 1),
+    "delete task": (5, 1),
+    "create note": (4, 1),
+    "update note": (6, 1),
+    "patch note": (6, 1),
+    "delete note": (6, 1),
+    "create document": (3, 1),
+    "update document": (5, 1),
+    "delete document": (6, 1),
+    "batch notes": (4, 1),
+    "delete project": (11, 1),
+}
+
+class StatementCounter:
+    def __init__(self, sync_engine):
+        self.sync_engine = sync_engine
+        self.statements = []
+        self.commits = 0
+        event.listen(sync_engine, "before_cursor_execute", self.on_execute)
+        event.listen(sync_engine, "commit", self.on_commit)
+
+    def on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(" ".join(statement.split())[:100])
+
+    def on_commit(self, conn):
+        self.commits += 1
+
+    def reset(self):
+        self.statements = []
+        self.commits = 0
+
+    def close(self):
+        event.remove(self.sync_engine, "before_cursor_execute", self.on_execute)
+        event.remove(self.sync_engine, "commit", self.on_commit)
+
+@pytest.fixture(scope="module")
+def measured(client, auth_headers):
+    counter = StatementCounter(async_engine.sync_engine)
+    results = {}
+
+    def measure(name: str, method: str, url: str, headers=auth_headers, **kwargs):
+        counter.reset()
+        response = client.request(method, url, headers=headers, **kwargs)
+        response.raise_for_status()
+        results[name] = (len(counter.statements), counter.commits, list(counter.statements))
+        return response.json() if response.content else None
+
+    try:
+        measure("register", "POST", "/api/auth/register", headers={}, json={
+            "email": "statements@devnotex.com", "password": "benchpass", "full_name": "Bench"
+        })
+
+        project = measure("create project", "POST", "/api/projects", json={"name": "Bench"})
+        base = f"/api/projects/{project['id']}"
+        # Membership cache dihangatkan agar yang terukur hanya jalur tulis.
+        client.get(base, headers=auth_headers)
+
+        measure("update project", "PUT", base, json={"description": "bench"})
+
+        task = measure("create task", "POST", f"{base}/tasks", json={"title": "t", "status": "todo"})
+        measure("update task", "PUT", f"{base}/tasks/{task['id']}", json={"status": "done"})
+        measure("delete task", "DELETE", f"{base}/tasks/{task['id']}")
+
+        note = measure("create note", "POST", f"{base}/notes", json={"title": "n", "content": "one\n"})
+        note = measure("update note", "PUT", f"{base}/notes/{note['id']}", json={"content": "one\ntwo\n"})
+        measure("patch note", "PATCH", f"{base}/notes/{note['id']}", json={
+            "base_revision": note["revision"], "ops": [{"retain": 4}, {"insert": "three\n"}]
+        })
+        measure("delete note", "DELETE", f"{base}/notes/{note['id']}")
+
+        document = measure("create document", "POST", f"{base}/documents", json={"title": "d", "content": "x"})
+        measure("update document", "PUT", f"{base}/documents/{document['id']}", json={"title": "d2"})
+        measure("delete document", "DELETE", f"{base}/documents/{document['id']}")
+
+        measure("batch notes", "POST", f"{base}/notes/batch", json={
+            "create": [{"title": f"n{i}", "content": "batch"} for i in range(3)]
+        })
+        measure("delete project", "DELETE", base)
+    finally:
+        counter.close()
+
+    return results
+
+@pytest.mark.parametrize("name", list(BUDGETS))
+def test_statement_budget(measured, name):
+    statements, commits, executed = measured[name]
+    max_statements, max_commits = BUDGETS[name]
+
+    assert statements <= max_statements, "\n".join([f"{name}: {statements} statements"] + executed)
+    assert commits <= max_commits, f"{name}: {commits} commits"
@@ -0,0 +1,208 @@
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+from dotenv import load_dotenv
+from starlette.responses import JSONResponse
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+ADMISSION_CONTROL = os.getenv("ADMISSION_CONTROL", "true").lower() in ("1", "true", "yes")
+ADMISSION_RETRY_AFTER = int(os.getenv("ADMISSION_RETRY_AFTER", "1"))
+
+# group -> (concurrency, panjang antrian, maks. tunggu di antrian (detik),
+# deadline request (detik, 0 = tanpa deadline)). Bisa di-override lewat
+# ADMISSION_<GROUP>_LIMIT / _QUEUE / _QUEUE_TIMEOUT / _DEADLINE.
+DEFAULT_GROUPS = {
+    "auth": (8, 32, 2.0, 10.0),
+    "reads": (32, 64, 1.0, 10.0),
+    "writes": (16, 32, 2.0, 15.0),
+    # Export/import mengalirkan data cukup lama; slot ditahan sampai
+    # stream selesai, jadi tidak diberi deadline.
+    "exports": (2, 4, 5.0, 0.0),
+}
+
+class Gate:
+    """
+    Pembatas concurrency untuk satu group route dengan antrian tunggu
+    terbatas (FIFO). Request yang tidak mendapat slot dalam
+    `queue_timeout` detik, atau datang saat antrian penuh, langsung ditolak
+    sehingga yang sudah diterima tetap mendapat latency yang stabil.
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, queue_timeout: float, deadline: float):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.deadline = deadline
+        self.active = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.queued = 0
+        self.shed_queue_full = 0
+        self.shed_timeout = 0
+        self.deadline_exceeded = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+
+    async def acquire(self) -> bool:
+        if self.active < self.limit and not self.waiters:
+            self.active += 1
+            self.admitted += 1
+            return True
+
+        if len(self.waiters) >= self.queue_size:
+            self.shed_queue_full += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        self.queued += 1
+        started = time.perf_counter()
+        try:
+            # Slot diserahkan langsung oleh `release` lewat set_result,
+            # jadi `active` tidak turun-naik di antaranya.
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.shed_timeout += 1
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+
+        self.waited += 1
+        self.wait_seconds += time.perf_counter() - started
+        self.admitted += 1
+        return True
+
+    def release(self):
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queue_depth": len(self.waiters),
+            "queue_size": self.queue_size,
+            "admitted": self.admitted,
+            "shed_queue_full": self.shed_queue_full,
+            "shed_timeout": self.shed_timeout,
+            "deadline_exceeded": self.deadline_exceeded,
+            "queued": self.queued,
+            "avg_wait_ms": round(self.wait_seconds * 1000 / self.waited, 2) if self.waited else 0.0,
+        }
+
+def _setting(group: str, name: str, default):
+    return type(default)(os.getenv(f"ADMISSION_{group.upper()}_{name}", str(default)))
+
+def create_gates() -> Dict[str, Gate]:
+    return {
+        group: Gate(
+            group,
+            limit=_setting(group, "LIMIT", limit),
+            queue_size=_setting(group, "QUEUE", queue_size),
+            queue_timeout=_setting(group, "QUEUE_TIMEOUT", queue_timeout),
+            deadline=_setting(group, "DEADLINE", deadline),
+        )
+        for group, (limit, queue_size, queue_timeout, deadline) in DEFAULT_GROUPS.items()
+    }
+
+def route_group(scope) -> Optional[str]:
+    """
+    Group untuk request, atau None untuk request yang tidak dibatasi:
+    health/ready/metrics/docs dan stream event yang terbuka lama.
+    """
+    path: str = scope["path"]
+    if not path.startswith("/api/"):
+        return None
+    if path.startswith("/api/auth/"):
+        return "auth"
+    if path.endswith("/events"):
+        return None
+    if path.endswith(("/export", "/import")):
+        return "exports"
+    return "reads" if scope["method"] in ("GET", "HEAD") else "writes"
+
+def overloaded_response() -> JSONResponse:
+    return JSONResponse(
+        {"detail": "Server is busy, please retry"},
+        status_code=503,
+        headers={"Retry-After": str(ADMISSION_RETRY_AFTER)},
+    )
+
+class AdmissionControlMiddleware:
+    """
+    Admission control per group route. Request yang diterima dijalankan
+    dengan deadline group-nya; bila deadline lewat sebelum response mulai
+    dikirim, handler dibatalkan dan klien menerima 503 + Retry-After.
+    """
+
+    def __init__(
+        self,
+        app,
+        gates: Optional[Dict[str, Gate]] = None,
+        classify: Callable[[dict], Optional[str]] = route_group,
+        enabled: bool = ADMISSION_CONTROL,
+    ):
+        self.app = app
+        self.gates = gates if gates is not None else admission_gates
+        self.classify = classify
+        self.enabled = enabled
+
+    async def __call__(self, scope, receive, send):
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        gate = self.gates.get(self.classify(scope))
+        if gate is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await gate.acquire():
+            await overloaded_response()(scope, receive, send)
+            return
+
+        try:
+            if gate.deadline <= 0:
+                await self.app(scope, receive, send)
+            else:
+                await self._call_with_deadline(gate, scope, receive, send)
+        finally:
+            gate.release()
+
+    async def _call_with_deadline(self, gate: Gate, scope, receive, send):
+        response_started = False
+
+        async def send_tracking(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await asyncio.wait_for(self.app(scope, receive, send_tracking), gate.deadline)
+        except asyncio.TimeoutError:
+            gate.deadline_exceeded += 1
+            logger.warning(f"{scope['method']} {scope['path']} exceeded the {gate.deadline:g}s {gate.name} deadline")
+            if not response_started:
+                await overloaded_response()(scope, receive, send)
+
+admission_gates = create_gates()
+
+def admission_stats() -> dict:
+    return {"enabled": ADMISSION_CONTROL, "groups": {name: gate.stats() for name, gate in admission_gates.items()}}
@@ -0,0 +1,183 @@
+import os
+from typing import Dict, List
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from utils.changes import record_deletions
+from utils.etag import bump_version
+from utils.events import publish_changes
+from utils.permissions import check_member_access, check_project_access
+from utils.revisions import commit_revisions, remove_revisions, revision_rows, save_revisions
+from utils.search import index_entities, remove_entities, touches_index
+from utils.stats import apply_task_changes, increment_counter, task_snapshot
+
+load_dotenv()
+
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "100"))
+
+def ensure_batch_size(count: int):
+    if count > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch too large (max {MAX_BATCH_SIZE} items)"
+        )
+
+class BatchRepository:
+    """
+    Operasi banyak entity sekaligus dalam satu project: membership dicek
+    sekali, baris dimuat dengan satu query IN, dan semua penulisan
+    (termasuk index pencarian, statistik, dan versi ETag) masuk ke satu
+    transaksi. Hasil dikembalikan per item; id yang tidak ditemukan
+    menjadi 404 tanpa menggagalkan item lain.
+    """
+
+    def __init__(
+        self,
+        model,
+        entity_type: str,
+        collection: str,
+        counter: str,
+        not_found: str,
+        revisions: bool = False
+    ):
+        self.model = model
+        self.entity_type = entity_type
+        self.collection = collection
+        self.counter = counter
+        self.not_found = not_found
+        self.revisions = revisions
+
+    async def _load(self, db: AsyncSession, project_id: str, ids: List[str], lock: bool = False) -> Dict[str, object]:
+        if not ids:
+            return {}
+
+        stmt = select(self.model).where(
+            self.model.project_id == project_id,
+            self.model.id.in_(ids)
+        )
+        if lock:
+            # Snapshot statistik diambil dari baris ini; dikunci agar update
+            # bersamaan tidak menerapkan delta yang sama dua kali.
+            stmt = stmt.with_for_update()
+        result = await db.scalars(stmt)
+        return {entity.id: entity for entity in result}
+
+    def snapshot(self, entity):
+        return True
+
+    async def apply_stats(self, db: AsyncSession, project_id: str, changes: list):
+        delta = sum((after is not None) - (before is not None) for before, after in changes)
+        if delta:
+            await increment_counter(db, project_id, self.counter, delta)
+
+    async def get_many(self, db: AsyncSession, project_id: str, user_id: str, ids: List[str]) -> dict:
+        ids = list(dict.fromkeys(ids))
+        ensure_batch_size(len(ids))
+        await check_project_access(project_id, user_id, db)
+
+        found = await self._load(db, project_id, ids)
+        return {
+            "items": [found[entity_id] for entity_id in ids if entity_id in found],
+            "missing": [entity_id for entity_id in ids if entity_id not in found],
+        }
+
+    async def write(self, db: AsyncSession, project_id: str, user_id: str, batch) -> List[dict]:
+        ensure_batch_size(len(batch.create) + len(batch.update) + len(batch.delete))
+        await check_member_access(project_id, user_id, db)
+
+        existing = await self._load(db, project_id, [item.id for item in batch.update] + batch.delete, lock=True)
+
+        results = []
+        changes = []
+        touched = set()
+        revisions = []
+        created, updated, reindexed, deleted_ids = [], [], [], []
+
+        def reject(op: str, index: int, entity_id: str):
+            if entity_id in touched:
+                code, detail = status.HTTP_409_CONFLICT, "Duplicate id in batch"
+            elif entity_id not in existing:
+                code, detail = status.HTTP_404_NOT_FOUND, self.not_found
+            else:
+                touched.add(entity_id)
+                return False
+
+            results.append({"op": op, "index": index, "id": entity_id, "status": code, "detail": detail})
+            return True
+
+        for index, data in enumerate(batch.create):
+            entity = self.model(**data.dict(), project_id=project_id, created_by=user_id)
+            created.append(entity)
+            changes.append((None, self.snapshot(entity)))
+            results.append({"op": "create", "index": index, "entity": entity, "status": status.HTTP_201_CREATED})
+
+        for index, data in enumerate(batch.update):
+            if reject("update", index, data.id):
+                continue
+
+            entity = existing[data.id]
+            before = self.snapshot(entity)
+            update_data = data.dict(exclude_unset=True, exclude={"id"})
+            previous = entity.content if self.revisions and "content" in update_data else None
+            for key, value in update_data.items():
+                setattr(entity, key, value)
+
+            if self.revisions and "content" in update_data:
+                revisions.extend(revision_rows(self.entity_type, entity, previous, user_id))
+
+            changes.append((before, self.snapshot(entity)))
+            updated.append(entity)
+            if touches_index(self.entity_type, update_data):
+                reindexed.append(entity)
+            results.append({"op": "update", "index": index, "entity": entity, "status": status.HTTP_200_OK})
+
+        for index, entity_id in enumerate(batch.delete):
+            if reject("delete", index, entity_id):
+                continue
+
+            changes.append((self.snapshot(existing[entity_id]), None))
+            deleted_ids.append(entity_id)
+            results.append({"op": "delete", "index": index, "id": entity_id, "status": status.HTTP_204_NO_CONTENT})
+
+        if created or updated or deleted_ids:
+            db.add_all(created)
+            await db.flush()
+
+            # Posting entity yang dihapus dan yang diindeks ulang dibuang
+            # dengan satu DELETE; entity baru belum punya posting.
+            await remove_entities(db, self.entity_type, deleted_ids + [entity.id for entity in reindexed])
+            await index_entities(db, self.entity_type, created + reindexed, replace=False)
+            await self.apply_stats(db, project_id, changes)
+            await save_revisions(db, revisions)
+
+            if deleted_ids:
+                await db.execute(delete(self.model).where(
+                    self.model.project_id == project_id,
+                    self.model.id.in_(deleted_ids)
+                ))
+                await record_deletions(db, project_id, self.entity_type, deleted_ids)
+                if self.revisions:
+                    await remove_revisions(db, self.entity_type, deleted_ids)
+
+            await bump_version(db, project_id, self.collection)
+            await commit_revisions(db)
+
+            await publish_changes(project_id, self.entity_type, "created", [entity.id for entity in created])
+            await publish_changes(project_id, self.entity_type, "updated", [entity.id for entity in updated])
+            await publish_changes(project_id, self.entity_type, "deleted", deleted_ids)
+
+        for result in results:
+            entity = result.pop("entity", None)
+            if entity is not None:
+                result["id"] = entity.id
+                result["item"] = entity
+
+        return results
+
+class TaskBatchRepository(BatchRepository):
+    def snapshot(self, entity):
+        return task_snapshot(entity)
+
+    async def apply_stats(self, db: AsyncSession, project_id: str, changes: list):
+        await apply_task_changes(db, project_id, changes)
@@ -0,0 +1,130 @@
+import os
+from datetime import datetime, timedelta
+from typing import List, Optional
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from sqlalchemy import and_, delete, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from models import Document, Note, Task, Tombstone
+from utils.database import utcnow
+from utils.pagination import decode_keyset, encode_keyset
+
+load_dotenv()
+
+# Perubahan yang lebih baru dari jendela ini dikirim ulang pada sync
+# berikutnya, karena transaksi yang belum commit masih bisa muncul dengan
+# updated_at yang lebih awal (atau ditulis worker dengan jam yang sedikit
+# tertinggal). Klien harus menerapkan perubahan secara idempoten.
+SYNC_SAFETY_WINDOW = int(os.getenv("SYNC_SAFETY_WINDOW", "5"))
+TOMBSTONE_RETENTION_DAYS = int(os.getenv("TOMBSTONE_RETENTION_DAYS", "30"))
+
+# sumber -> (model, kolom waktu perubahan, kolom id). Nama sumber juga
+# menjadi tie-breaker urutan untuk waktu perubahan yang sama.
+SOURCES = {
+    "document": (Document, Document.updated_at, Document.id),
+    "note": (Note, Note.updated_at, Note.id),
+    "task": (Task, Task.updated_at, Task.id),
+    "tombstone": (Tombstone, Tombstone.deleted_at, Tombstone.entity_id),
+}
+
+async def record_deletions(db: AsyncSession, project_id: str, entity_type: str, entity_ids: List[str]):
+    if not entity_ids:
+        return
+
+    await db.execute(insert(Tombstone), [
+        {"entity_id": entity_id, "entity_type": entity_type, "project_id": project_id}
+        for entity_id in entity_ids
+    ])
+
+async def remove_tombstones(db: AsyncSession, project_id: str):
+    await db.execute(delete(Tombstone).where(Tombstone.project_id == project_id))
+
+def _decode_token(token: str):
+    last_at, last_source, last_id = decode_keyset(token, 3)
+    try:
+        return datetime.fromisoformat(last_at), last_source, last_id
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync token"
+        )
+
+def _encode_token(position) -> str:
+    changed_at, source, entity_id = position
+    return encode_keyset([changed_at.isoformat(), source, entity_id])
+
+def _after(source: str, changed_at, entity_id, position):
+    last_at, last_source, last_id = position
+    if source > last_source:
+        return changed_at >= last_at
+    if source < last_source:
+        return changed_at > last_at
+    return or_(changed_at > last_at, and_(changed_at == last_at, entity_id > last_id))
+
+async def read_changes(db: AsyncSession, project_id: str, token: Optional[str], limit: int) -> dict:
+    """
+    Entity yang dibuat, diubah, atau dihapus sejak `token`, diurutkan
+    berdasarkan (waktu perubahan, sumber, id). Setiap sumber dibaca lewat
+    index `(project_id, updated_at)` atau `(project_id, deleted_at)` dengan
+    paling banyak `limit + 1` baris, lalu digabung.
+
+    Tanpa token berarti sinkronisasi penuh; tombstone tidak dikirim karena
+    klien belum punya data lokal.
+    """
+    now = utcnow()
+    position = None
+
+    if token:
+        position = _decode_token(token)
+        if position[0] < now - timedelta(days=TOMBSTONE_RETENTION_DAYS):
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="Sync token expired, full resync required"
+            )
+
+    rows = []
+    for source, (model, changed_at, entity_id) in SOURCES.items():
+        if source == "tombstone" and position is None:
+            continue
+
+        stmt = select(model).where(model.project_id == project_id)
+        if position is not None:
+            stmt = stmt.where(_after(source, changed_at, entity_id, position))
+
+        result = await db.scalars(stmt.order_by(changed_at, entity_id).limit(limit + 1))
+        for entity in result:
+            key = (getattr(entity, changed_at.key), source, getattr(entity, entity_id.key))
+            rows.append((key, entity))
+
+    rows.sort(key=lambda row: row[0])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_position = rows[-1][0] if rows else position
+    if not has_more:
+        horizon = now - timedelta(seconds=SYNC_SAFETY_WINDOW)
+        if next_position is None or next_position[0] > horizon:
+            next_position = (horizon, "", "")
+
+    page = {"tasks": [], "notes": [], "documents": [], "deleted": []}
+    for (_, source, _), entity in rows:
+        if source == "tombstone":
+            page["deleted"].append({
+                "type": entity.entity_type,
+                "id": entity.entity_id,
+                "deleted_at": entity.deleted_at,
+            })
+        else:
+            page[source + "s"].append(entity)
+
+    page["sync_token"] = _encode_token(next_position)
+    page["has_more"] = has_more
+    return page
+
+def prune_tombstones(db: Session, retention_days: int = TOMBSTONE_RETENTION_DAYS) -> int:
+    """Menghapus tombstone yang lebih tua dari masa retensi. Dipakai oleh `manage.py prune-tombstones`."""
+    cutoff = utcnow() - timedelta(days=retention_days)
+    pruned = db.execute(delete(Tombstone).where(Tombstone.deleted_at < cutoff)).rowcount
+    db.commit()
+    return pruned
@@ -0,0 +1,114 @@
+import os
+import time
+import zlib
+from typing import Optional, Tuple
+from dotenv import load_dotenv
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+load_dotenv()
+
+CONTENT_COMPRESSION_THRESHOLD = int(os.getenv("CONTENT_COMPRESSION_THRESHOLD", "1024"))
+CONTENT_CODEC = os.getenv("CONTENT_CODEC", "zlib")
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 10
+
+CODECS = {
+    "zlib": (lambda data: zlib.compress(data, ZLIB_LEVEL), zlib.decompress),
+}
+if zstandard is not None:
+    CODECS["zstd"] = (
+        lambda data: zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data),
+        lambda data: zstandard.ZstdDecompressor().decompress(data),
+    )
+
+def encode_content(text: Optional[str]) -> Tuple[Optional[str], Optional[bytes], Optional[str]]:
+    """
+    Mengembalikan `(text, blob, codec)` untuk disimpan. Isi di bawah
+    `CONTENT_COMPRESSION_THRESHOLD` byte, atau yang tidak mengecil
+    setelah dikompres, tetap disimpan sebagai teks biasa.
+    """
+    if text is None:
+        return None, None, None
+
+    raw = text.encode("utf-8")
+    if len(raw) < CONTENT_COMPRESSION_THRESHOLD or CONTENT_CODEC not in CODECS:
+        return text, None, None
+
+    compress, _ = CODECS[CONTENT_CODEC]
+    blob = compress(raw)
+    if len(blob) >= len(raw) * 0.9:
+        return text, None, None
+
+    return None, blob, CONTENT_CODEC
+
+def decode_content(text: Optional[str], blob: Optional[bytes], codec: Optional[str]) -> Optional[str]:
+    if codec is None:
+        return text
+
+    if codec not in CODECS:
+        raise ValueError(f"Unsupported content codec: {codec}")
+
+    _, decompress = CODECS[codec]
+    return decompress(blob).decode("utf-8")
+
+def content_columns(text: Optional[str]) -> dict:
+    """`encode_content` dalam bentuk nama kolom tabel, untuk INSERT/UPDATE Core."""
+    text, blob, codec = encode_content(text)
+    return {"content": text, "content_blob": blob, "content_codec": codec}
+
+def compress_existing_content(db, batch_size: int = 500, pause: float = 0.0) -> int:
+    """
+    Mengompres isi note/document lama yang masih berupa teks biasa, per batch
+    dengan commit terpisah sehingga aman dijalankan saat aplikasi berjalan.
+    `updated_at` tidak diubah; baris yang isinya berubah di tengah proses
+    dilewati (UPDATE bersyarat pada isi lama).
+    Dipakai oleh `manage.py compress-content`.
+    """
+    # Diimpor di sini karena models mengimpor modul ini.
+    from sqlalchemy import func, select, update
+    from models import Document, Note
+
+    compressed = 0
+    for model in (Note, Document):
+        table = model.__table__
+        last_id = ""
+        while True:
+            rows = db.execute(
+                select(table.c.id, table.c.content)
+                .where(
+                    table.c.id > last_id,
+                    table.c.content_codec.is_(None),
+                    func.length(table.c.content) >= CONTENT_COMPRESSION_THRESHOLD
+                )
+                .order_by(table.c.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                break
+
+            for row in rows:
+                text, blob, codec = encode_content(row.content)
+                if codec is None:
+                    continue
+
+                result = db.execute(
+                    update(table)
+                    .where(
+                        table.c.id == row.id,
+                        table.c.content == row.content,
+                        table.c.content_codec.is_(None)
+                    )
+                    .values(content=text, content_blob=blob, content_codec=codec, updated_at=table.c.updated_at)
+                )
+                compressed += result.rowcount
+
+            db.commit()
+            last_id = rows[-1].id
+            if pause:
+                time.sleep(pause)
+
+    return compressed
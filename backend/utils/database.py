@@ -1,21 +1,323 @@
-from sqlalchemy import create_engine
+import asyncio
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from fastapi import Request, Response
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 from dotenv import load_dotenv
+from utils.cache import TTLCache
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 DATABASE_URL = os.getenv("DATABASE_URL", "mysql+pymysql://root@localhost:3306/devnotex")
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+ASYNC_DRIVERS = {
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+}
+
+def to_async_url(url: str) -> str:
+    """
+    Mengubah URL driver sync (pymysql/pysqlite) menjadi driver asyncio yang
+    setara, misalnya `mysql+pymysql://...` menjadi `mysql+aiomysql://...`.
+    """
+    scheme, sep, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or to_async_url(DATABASE_URL)
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+DB_POOL_WARMUP = int(os.getenv("DB_POOL_WARMUP", str(DB_POOL_SIZE)))
+DB_READY_TIMEOUT = float(os.getenv("DB_READY_TIMEOUT", "2"))
+
+# Replica baca, dipisah koma. Kosong berarti semua request ke primary.
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+DB_REPLICA_PIN_SECONDS = float(os.getenv("DB_REPLICA_PIN_SECONDS", "5"))
+DB_REPLICA_RETRY_SECONDS = float(os.getenv("DB_REPLICA_RETRY_SECONDS", "30"))
+DB_REPLICA_PIN_CACHE_SIZE = int(os.getenv("DB_REPLICA_PIN_CACHE_SIZE", "10000"))
+
+READ_METHODS = {"GET", "HEAD"}
+PRIMARY_PIN_COOKIE = "devnotex_primary_until"
+
+def pool_options(url: str) -> dict:
+    """
+    Opsi pool dari environment. SQLite memakai pool bawaan dialeknya
+    (tanpa ukuran pool), jadi hanya recycle dan pre-ping yang diteruskan.
+    """
+    options = {"pool_pre_ping": DB_POOL_PRE_PING, "pool_recycle": DB_POOL_RECYCLE}
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW, pool_timeout=DB_POOL_TIMEOUT)
+    return options
+
+def pool_budget(workers: int, max_connections: int) -> dict:
+    """
+    Membagi batas koneksi database ke beberapa worker: setiap worker boleh
+    memegang paling banyak `max_connections // workers` koneksi (pool +
+    overflow). Dikembalikan sebagai variabel environment untuk worker.
+    """
+    share = max(1, max_connections // workers)
+    pool_size = max(1, min(DB_POOL_SIZE, share))
+    max_overflow = max(0, share - pool_size)
+    return {
+        "DB_POOL_SIZE": str(pool_size),
+        "DB_MAX_OVERFLOW": str(max_overflow),
+        "DB_POOL_WARMUP": str(min(DB_POOL_WARMUP, pool_size)),
+    }
+
+# Engine sync hanya dipakai untuk migrasi, seed dan skrip offline.
+engine = create_engine(DATABASE_URL, **pool_options(DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+def create_sessionmaker(bind: AsyncEngine) -> async_sessionmaker:
+    return async_sessionmaker(
+        bind=bind,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **pool_options(ASYNC_DATABASE_URL))
+AsyncSessionLocal = create_sessionmaker(async_engine)
+
+class Replica:
+    def __init__(self, url: str):
+        async_url = to_async_url(url)
+        self.name = make_url(async_url).render_as_string(hide_password=True)
+        self.engine = create_async_engine(async_url, **pool_options(async_url))
+        self.sessionmaker = create_sessionmaker(self.engine)
+        self.down_until = 0.0
+        self.sessions = 0
+        self.failures = 0
+
+    def healthy(self, now: float) -> bool:
+        return self.down_until <= now
+
+class ReplicaSet:
+    """
+    Replica baca yang dipilih bergiliran. Replica yang gagal dihubungi
+    dilewati selama `DB_REPLICA_RETRY_SECONDS`; bila tidak ada replica
+    sehat, request baca jatuh ke primary.
+    """
+
+    def __init__(self, urls: List[str]):
+        self.replicas = [Replica(url) for url in urls]
+        self._next = 0
+        self.fallbacks = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self, exclude: Tuple[Replica, ...] = ()) -> Optional[Replica]:
+        now = time.monotonic()
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next % len(self.replicas)]
+            self._next += 1
+            if replica not in exclude and replica.healthy(now):
+                return replica
+        return None
+
+    def mark_down(self, replica: Replica, exc: Exception):
+        replica.failures += 1
+        replica.down_until = time.monotonic() + DB_REPLICA_RETRY_SECONDS
+        logger.warning(f"Read replica {replica.name} unavailable, using primary for {DB_REPLICA_RETRY_SECONDS:g}s: {exc}")
+
+    async def dispose(self):
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        return {
+            "fallbacks": self.fallbacks,
+            "replicas": [
+                {
+                    "url": replica.name,
+                    "healthy": replica.healthy(now),
+                    "sessions": replica.sessions,
+                    "failures": replica.failures,
+                    "pool": pool_status(replica.engine),
+                }
+                for replica in self.replicas
+            ],
+        }
+
+replicas = ReplicaSet(DATABASE_REPLICA_URLS)
+
+# Authorization header -> pin. Cookie menjangkau worker lain; cache ini
+# menangani klien yang tidak menyimpan cookie.
+primary_pins = TTLCache(maxsize=DB_REPLICA_PIN_CACHE_SIZE, ttl=DB_REPLICA_PIN_SECONDS)
+
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
+def utcnow() -> datetime:
+    """
+    Default kolom timestamp. Diisi di Python agar nilai yang ditulis sudah
+    ada di objek tanpa SELECT ulang setelah commit. UTC tanpa tzinfo dan
+    dibulatkan ke detik, sama dengan yang disimpan kolom DATETIME MySQL.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+async def warm_up_pool(count: int = DB_POOL_WARMUP, engine: Optional[AsyncEngine] = None) -> int:
+    """
+    Membuka `count` koneksi sekaligus saat startup lalu mengembalikannya ke
+    pool, agar request pertama tidak menanggung biaya connect + handshake.
+    Tidak melebihi ukuran pool: koneksi overflow langsung ditutup saat
+    dikembalikan.
+    """
+    engine = engine or async_engine
+    size = getattr(engine.pool, "size", None)
+    if size is None:
+        # NullPool dan sejenisnya tidak menyimpan koneksi.
+        return 0
+
+    count = min(count, size())
+    if count <= 0:
+        return 0
+
+    # Semua koneksi ditahan sampai selesai agar pool benar-benar membuka
+    # `count` koneksi berbeda, bukan memakai ulang satu koneksi.
+    connections = []
     try:
-        yield db
+        for _ in range(count):
+            connection = await engine.connect()
+            connections.append(connection)
+            await connection.execute(text("SELECT 1"))
     finally:
-        db.close()
+        for connection in connections:
+            await connection.close()
+    return count
+
+def pool_status(engine: Optional[AsyncEngine] = None) -> dict:
+    pool = (engine or async_engine).pool
+    status = {"class": type(pool).__name__}
+    if hasattr(pool, "checkedout"):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    return status
+
+async def check_database(timeout: float = DB_READY_TIMEOUT):
+    """Round trip `SELECT 1` lewat pool; gagal bila melewati `timeout` detik."""
+    async def ping():
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    await asyncio.wait_for(ping(), timeout)
+
+async def warm_up_replicas(count: int = DB_POOL_WARMUP):
+    for replica in replicas.replicas:
+        try:
+            await warm_up_pool(count, replica.engine)
+        except (DBAPIError, OSError) as exc:
+            replicas.mark_down(replica, exc)
+
+async def open_replica_session() -> Optional[Tuple[Replica, AsyncSession]]:
+    """
+    Session ke replica sehat berikutnya, atau None bila tidak ada. Koneksi
+    diambil di sini (dengan pre-ping) agar replica yang mati terdeteksi
+    sebelum handler berjalan dan request masih bisa dialihkan ke primary.
+    """
+    tried = ()
+    while (replica := replicas.choose(tried)) is not None:
+        tried += (replica,)
+        db = replica.sessionmaker()
+        try:
+            await db.connection()
+        except (DBAPIError, OSError) as exc:
+            await db.close()
+            replicas.mark_down(replica, exc)
+            continue
+
+        replica.sessions += 1
+        return replica, db
+
+    return None
+
+def pinned_to_primary(request: Request) -> bool:
+    try:
+        if float(request.cookies.get(PRIMARY_PIN_COOKIE, 0)) > time.time():
+            return True
+    except ValueError:
+        pass
+
+    authorization = request.headers.get("authorization")
+    return authorization is not None and primary_pins.get(authorization) is True
+
+def pin_to_primary(request: Request, response: Response):
+    """
+    Read-your-writes: selama `DB_REPLICA_PIN_SECONDS` setelah menulis,
+    request baca dari klien yang sama tetap ke primary sehingga tidak
+    membaca replica yang belum menyusul.
+    """
+    authorization = request.headers.get("authorization")
+    if authorization is not None:
+        primary_pins.set(authorization, True)
+
+    response.set_cookie(
+        PRIMARY_PIN_COOKIE,
+        str(int(time.time() + DB_REPLICA_PIN_SECONDS) + 1),
+        max_age=math.ceil(DB_REPLICA_PIN_SECONDS),
+        httponly=True,
+        samesite="lax",
+    )
+
+@asynccontextmanager
+async def read_session():
+    """Session untuk pekerjaan baca di luar request (misalnya export)."""
+    opened = await open_replica_session()
+    if opened is None and replicas:
+        replicas.fallbacks += 1
+    db = opened[1] if opened is not None else AsyncSessionLocal()
+    async with db:
+        yield db
+
+async def get_db(request: Request, response: Response):
+    """
+    GET/HEAD memakai replica bila ada (kecuali klien baru saja menulis),
+    request lain selalu ke primary. Endpoint baca yang harus melihat data
+    terbaru memakai `get_primary_db`.
+    """
+    if request.method not in READ_METHODS:
+        if replicas:
+            pin_to_primary(request, response)
+    elif replicas and not pinned_to_primary(request):
+        opened = await open_replica_session()
+        if opened is not None:
+            replica, db = opened
+            async with db:
+                try:
+                    yield db
+                except DBAPIError as exc:
+                    if exc.connection_invalidated:
+                        replicas.mark_down(replica, exc)
+                    raise
+            return
+
+        # Tidak ada replica yang bisa dihubungi: request baca dialihkan ke primary.
+        replicas.fallbacks += 1
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_primary_db():
+    async with AsyncSessionLocal() as db:
+        yield db
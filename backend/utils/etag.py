@@ -0,0 +1,59 @@
+import hashlib
+from datetime import datetime
+from typing import Dict
+from fastapi import Request, Response, status
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from models import ProjectVersion
+from utils.responses import response_media_type
+
+COLLECTIONS = ("project", "tasks", "notes", "documents")
+
+async def bump_version(db: AsyncSession, project_id: str, collection: str):
+    column = getattr(ProjectVersion, collection)
+    await db.execute(
+        update(ProjectVersion)
+        .where(ProjectVersion.project_id == project_id)
+        .values({collection: column + 1})
+        .execution_options(synchronize_session=False)
+    )
+
+async def get_versions(db: AsyncSession, project_id: str, *collections: str) -> Dict[str, int]:
+    row = (await db.execute(
+        select(*(getattr(ProjectVersion, collection) for collection in collections))
+        .where(ProjectVersion.project_id == project_id)
+    )).first()
+
+    if row is None:
+        return dict.fromkeys(collections, 0)
+    return dict(zip(collections, row))
+
+async def remove_versions(db: AsyncSession, project_id: str):
+    await db.execute(delete(ProjectVersion).where(ProjectVersion.project_id == project_id))
+
+def make_etag(*parts) -> str:
+    # Media type ikut di-hash agar representasi JSON dan MessagePack
+    # tidak berbagi ETag yang sama.
+    raw = ":".join(
+        part.isoformat() if isinstance(part, datetime) else str(part)
+        for part in (*parts, response_media_type())
+    )
+    return '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + '"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    candidates = [candidate.strip().removeprefix("W/") for candidate in header.split(",")]
+    return "*" in candidates or etag in candidates
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+def set_etag(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
@@ -0,0 +1,263 @@
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+from dotenv import load_dotenv
+from utils.responses import encode_json
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+EVENT_QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "100"))
+EVENT_HEARTBEAT = float(os.getenv("EVENT_HEARTBEAT", "15"))
+EVENT_BROKER_URL = os.getenv("EVENT_BROKER_URL", "")
+EVENT_RELAY_MAX_BUFFER = int(os.getenv("EVENT_RELAY_MAX_BUFFER", str(4 * 1024 * 1024)))
+
+# Pesan di antrian: (nama event, data JSON). Data di-encode sekali saat
+# publish, bukan sekali per koneksi.
+Message = Tuple[str, bytes]
+
+RESYNC: Message = ("resync", b"{}")
+
+class Subscription:
+    """
+    Antrian event milik satu koneksi SSE/WebSocket. Antrian dibatasi: bila
+    klien terlalu lambat dan antrian penuh, isinya dibuang dan diganti satu
+    pesan `resync`, sehingga klien mengejar lewat changes feed alih-alih
+    server menimbun event tanpa batas.
+    """
+
+    def __init__(self, project_id: str, maxsize: int):
+        self.project_id = project_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.overflows = 0
+
+    def push(self, message: Message) -> bool:
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        self.overflows += 1
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(RESYNC)
+        return False
+
+    async def get(self, timeout: float) -> Optional[Message]:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+class Broker:
+    """
+    Penyalur event antar worker. Implementasi dasar hanya meneruskan ke hub
+    di proses ini; broker lain juga mengirim ke worker lain dan memanggil
+    `hub.dispatch` untuk pesan yang diterima dari luar.
+    """
+
+    def __init__(self):
+        self.hub: Optional["EventHub"] = None
+
+    async def start(self, hub: "EventHub"):
+        self.hub = hub
+
+    async def publish(self, project_id: str, message: Message):
+        self.hub.dispatch(project_id, message)
+
+    async def stop(self):
+        pass
+
+class LocalBroker(Broker):
+    pass
+
+class TcpBroker(Broker):
+    """
+    Broker lewat relay TCP lokal (`manage.py event-relay`): setiap pesan
+    ditulis sebagai satu baris `project_id<TAB>event<TAB>data JSON` dan
+    relay meneruskannya ke worker lain.
+    Pesan untuk worker sendiri langsung di-dispatch tanpa menunggu relay.
+
+    Bila koneksi ke relay putus, event dari worker lain bisa terlewat, jadi
+    setelah tersambung lagi semua klien lokal diminta resync.
+    """
+
+    def __init__(self, host: str, port: int):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.writer: Optional[asyncio.StreamWriter] = None
+        self.task: Optional[asyncio.Task] = None
+
+    async def start(self, hub: "EventHub"):
+        await super().start(hub)
+        self.task = asyncio.create_task(self._run())
+
+    async def publish(self, project_id: str, message: Message):
+        self.hub.dispatch(project_id, message)
+
+        writer = self.writer
+        if writer is None:
+            return
+
+        event, data = message
+        writer.write(f"{project_id}\t{event}\t".encode("utf-8") + data + b"\n")
+        if writer.transport.get_write_buffer_size() > EVENT_RELAY_MAX_BUFFER:
+            logger.warning("Event relay is not keeping up, reconnecting")
+            writer.close()
+
+    async def _run(self):
+        delay = 0.5
+        connected_before = False
+        while True:
+            try:
+                reader, self.writer = await asyncio.open_connection(
+                    self.host, self.port, limit=EVENT_RELAY_MAX_BUFFER
+                )
+            except OSError as exc:
+                logger.warning(f"Event relay {self.host}:{self.port} unavailable: {exc}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
+                continue
+
+            delay = 0.5
+            if connected_before:
+                self.hub.resync_all()
+            connected_before = True
+
+            try:
+                while line := await reader.readline():
+                    project_id, event, data = line.rstrip(b"\n").split(b"\t", 2)
+                    self.hub.dispatch(project_id.decode("utf-8"), (event.decode("utf-8"), data))
+            except (OSError, ValueError) as exc:
+                logger.warning(f"Event relay connection lost: {exc}")
+            finally:
+                self.writer.close()
+                self.writer = None
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+        if self.writer is not None:
+            self.writer.close()
+
+BROKERS = {
+    "local": lambda url: LocalBroker(),
+    "tcp": lambda url: TcpBroker(url.hostname or "127.0.0.1", url.port or 8765),
+}
+
+def create_broker(broker_url: str = EVENT_BROKER_URL) -> Broker:
+    url = urlparse(broker_url or "local://")
+    if url.scheme not in BROKERS:
+        raise ValueError(f"Unsupported event broker: {broker_url}")
+    return BROKERS[url.scheme](url)
+
+class EventHub:
+    """
+    Pub/sub perubahan per project di dalam proses. Handler menulis memanggil
+    `publish` setelah commit; broker menentukan apakah event juga sampai ke
+    worker lain.
+    """
+
+    def __init__(self, queue_size: int = EVENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+        self.broker: Broker = LocalBroker()
+        self.broker.hub = self
+        self.published = 0
+        self.delivered = 0
+        self.overflows = 0
+
+    async def start(self, broker: Broker):
+        self.broker = broker
+        await broker.start(self)
+
+    async def stop(self):
+        await self.broker.stop()
+
+    def subscribe(self, project_id: str) -> Subscription:
+        subscription = Subscription(project_id, self.queue_size)
+        self.subscriptions[project_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscriptions = self.subscriptions.get(subscription.project_id)
+        if subscriptions is None:
+            return
+
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self.subscriptions[subscription.project_id]
+
+    def dispatch(self, project_id: str, message: Message):
+        for subscription in self.subscriptions.get(project_id, ()):
+            if subscription.push(message):
+                self.delivered += 1
+            else:
+                self.overflows += 1
+
+    def resync_all(self):
+        for subscriptions in self.subscriptions.values():
+            for subscription in subscriptions:
+                subscription.push(RESYNC)
+
+    async def publish(self, project_id: str, event: str, data):
+        self.published += 1
+        await self.broker.publish(project_id, (event, encode_json(data)))
+
+    def stats(self) -> dict:
+        return {
+            "broker": type(self.broker).__name__,
+            "projects": len(self.subscriptions),
+            "connections": sum(len(subscriptions) for subscriptions in self.subscriptions.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "overflows": self.overflows,
+        }
+
+hub = EventHub()
+
+async def publish_changes(project_id: str, entity_type: str, op: str, ids: List[str]):
+    """
+    Mengumumkan perubahan ke klien yang berlangganan project. Event hanya
+    membawa type, operasi, dan id; isi terbaru diambil klien lewat endpoint
+    biasa (dengan ETag) atau changes feed.
+    """
+    if ids:
+        await hub.publish(project_id, "changes", [{"type": entity_type, "op": op, "id": entity_id} for entity_id in ids])
+
+async def run_relay(host: str, port: int):
+    """
+    Relay TCP untuk `TcpBroker`: setiap baris dari satu worker diteruskan
+    ke semua worker lain. Worker yang tidak membaca cukup cepat diputus
+    (lalu tersambung lagi dan meminta resync ke kliennya).
+    """
+    writers: Set[asyncio.StreamWriter] = set()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writers.add(writer)
+        try:
+            while line := await reader.readline():
+                for other in list(writers):
+                    if other is writer:
+                        continue
+                    if other.transport.get_write_buffer_size() > EVENT_RELAY_MAX_BUFFER:
+                        writers.discard(other)
+                        other.close()
+                        continue
+                    other.write(line)
+        except OSError:
+            pass
+        finally:
+            writers.discard(writer)
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port, limit=EVENT_RELAY_MAX_BUFFER)
+    logger.info(f"Event relay listening on {host}:{port}")
+    async with server:
+        await server.serve_forever()
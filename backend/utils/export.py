@@ -0,0 +1,59 @@
+import os
+from datetime import datetime, timezone
+from typing import AsyncIterator
+from dotenv import load_dotenv
+from sqlalchemy import select
+from models import Document, Note, Project, ProjectMember, Task
+from schemas import DocumentResponse, NoteResponse, ProjectMemberResponse, ProjectResponse, TaskResponse
+from utils.database import read_session
+from utils.responses import encode_json
+
+load_dotenv()
+
+EXPORT_FORMAT_VERSION = 1
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+# type baris -> (model, schema, urutan); diurutkan lewat index (project_id, created_at, id)
+EXPORTED = {
+    "member": (ProjectMember, ProjectMemberResponse, (ProjectMember.joined_at, ProjectMember.id)),
+    "task": (Task, TaskResponse, (Task.created_at, Task.id)),
+    "note": (Note, NoteResponse, (Note.created_at, Note.id)),
+    "document": (Document, DocumentResponse, (Document.created_at, Document.id)),
+}
+
+def _line(entity_type: str, schema, entity) -> bytes:
+    data = schema.model_validate(entity).model_dump(mode="json")
+    return encode_json({"type": entity_type, "data": data}) + b"\n"
+
+async def export_project(project_id: str) -> AsyncIterator[bytes]:
+    """
+    Menghasilkan isi project sebagai NDJSON: satu baris header, metadata
+    project, lalu member, task, note, dan document.
+
+    Memakai session sendiri (session request sudah ditutup saat body
+    di-stream) dan server-side cursor, sehingga memori tetap konstan dan
+    setiap batch `EXPORT_BATCH_SIZE` baris langsung dikirim ke klien.
+    """
+    yield encode_json({
+        "type": "export",
+        "version": EXPORT_FORMAT_VERSION,
+        "project_id": project_id,
+        "exported_at": datetime.now(timezone.utc).isoformat(),
+    }) + b"\n"
+
+    async with read_session() as db:
+        project = await db.get(Project, project_id)
+        if project is None:
+            return
+        yield _line("project", ProjectResponse, project)
+
+        for entity_type, (model, schema, order) in EXPORTED.items():
+            result = await db.stream_scalars(
+                select(model)
+                .where(model.project_id == project_id)
+                .order_by(*order)
+                .execution_options(yield_per=EXPORT_BATCH_SIZE)
+            )
+            async for batch in result.partitions():
+                yield b"".join(_line(entity_type, schema, entity) for entity in batch)
+                db.expunge_all()
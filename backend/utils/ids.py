@@ -0,0 +1,122 @@
+import os
+import threading
+import time
+import uuid
+from typing import Annotated
+from pydantic import AfterValidator
+from sqlalchemy import BINARY, LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+def uuid7() -> uuid.UUID:
+    """
+    UUID versi 7 (RFC 9562): 48 bit waktu Unix dalam milidetik, lalu 12 bit
+    counter dan 62 bit acak. Id baru selalu lebih besar dari id sebelumnya
+    di proses yang sama, sehingga insert jatuh di ujung index, bukan di
+    posisi acak seperti uuid4.
+    """
+    global _last_ms, _counter
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            # Bit teratas counter dikosongkan agar ada ruang untuk naik.
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+        timestamp, counter = _last_ms, _counter
+
+    value = (timestamp & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= counter << 64
+    value |= 0b10 << 62
+    value |= int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    return uuid.UUID(int=value)
+
+def new_id() -> str:
+    return str(uuid7())
+
+def canonical_id(value: str) -> str:
+    """Bentuk kanonik (huruf kecil, bertanda hubung); ValueError bila bukan UUID."""
+    return str(uuid.UUID(value))
+
+# Id dari input klien: selain UUID ditolak dengan 422 oleh validasi schema.
+UUIDStr = Annotated[str, AfterValidator(canonical_id)]
+
+class BinaryUUID(TypeDecorator):
+    """
+    UUID disimpan sebagai 16 byte (`BINARY(16)`, BLOB di SQLite), tetapi di
+    Python dan API tetap string kanonik `xxxxxxxx-xxxx-...`. Urutan byte
+    sama dengan urutan string heksadesimalnya.
+
+    Nilai yang bukan UUID ditolak saat ditulis (INSERT/UPDATE); hanya
+    perbandingan di WHERE yang memakai `_BinaryUUIDLookup`.
+    """
+    impl = BINARY(16)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(LargeBinary())
+        return dialect.type_descriptor(BINARY(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return value.bytes
+        if isinstance(value, bytes) and len(value) == 16:
+            return value
+        if isinstance(value, str) and len(value) == 36 and value[8] == value[13] == value[18] == value[23] == "-":
+            # Jalur cepat untuk string kanonik (jauh lebih murah dari uuid.UUID);
+            # bentuk lain tetap divalidasi lewat uuid.UUID di bawah.
+            try:
+                raw = bytes.fromhex(value.replace("-", ""))
+            except ValueError:
+                raw = b""
+            if len(raw) == 16:
+                return raw
+        try:
+            return uuid.UUID(value).bytes
+        except (AttributeError, TypeError, ValueError):
+            raise ValueError(f"Invalid UUID: {value!r}") from None
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return value
+        value = bytes(value)
+        if len(value) == 16:
+            return str(uuid.UUID(bytes=value))
+        # Sisa id CHAR(36) lama atau nilai rusak dikembalikan apa adanya
+        # agar satu baris tidak membuat seluruh response gagal.
+        try:
+            return value.decode("ascii")
+        except UnicodeDecodeError:
+            return value.hex()
+
+    def coerce_compared_value(self, op, value):
+        return _BinaryUUIDLookup()
+
+    @property
+    def python_type(self):
+        return str
+
+class _BinaryUUIDLookup(BinaryUUID):
+    """Tipe parameter pembanding: id yang bukan UUID tidak cocok dengan baris mana pun."""
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        try:
+            return super().process_bind_param(value, dialect)
+        except ValueError:
+            # Panjangnya bukan 16 byte sehingga tidak pernah sama dengan
+            # id tersimpan; path dengan id asal tetap berakhir 404.
+            return b""
@@ -0,0 +1,257 @@
+import csv
+import json
+import logging
+import os
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from dotenv import load_dotenv
+from pydantic import ValidationError
+from sqlalchemy import Enum, String, insert, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from models import Document, Note, SearchPosting, Task, User
+from schemas import DocumentCreate, NoteCreate, TaskCreate
+from models.content import CompressedContentMixin
+from utils.content import content_columns
+from utils.etag import bump_version
+from utils.events import publish_changes
+from utils.ids import new_id
+from utils.search import build_postings
+from utils.stats import apply_task_changes, increment_counter, task_snapshot
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+MAX_REPORTED_ERRORS = 100
+FORMATS = ("ndjson", "csv")
+
+# entity_type -> (model, schema validasi, koleksi versi, counter notes/documents)
+IMPORTABLE = {
+    "task": (Task, TaskCreate, "tasks", None),
+    "note": (Note, NoteCreate, "notes", "notes_total"),
+    "document": (Document, DocumentCreate, "documents", "documents_total"),
+}
+
+# Baris export (`utils/export.py`) yang bukan entity dilewati tanpa error.
+SKIPPED_TYPES = ("export", "project", "member")
+
+def detect_format(filename: Optional[str]) -> str:
+    if filename and filename.lower().endswith(".csv"):
+        return "csv"
+    return "ndjson"
+
+def _enum_columns(model) -> Dict[str, List[str]]:
+    return {
+        column.name: column.type.enums
+        for column in model.__table__.columns
+        if isinstance(column.type, Enum)
+    }
+
+def _length_columns(model) -> Dict[str, int]:
+    return {
+        column.name: column.type.length
+        for column in model.__table__.columns
+        if isinstance(column.type, String) and column.type.length
+    }
+
+ENUM_COLUMNS = {entity_type: _enum_columns(model) for entity_type, (model, *_) in IMPORTABLE.items()}
+LENGTH_COLUMNS = {entity_type: _length_columns(model) for entity_type, (model, *_) in IMPORTABLE.items()}
+
+def read_records(
+    lines: Iterable[str],
+    file_format: str,
+    default_type: Optional[str]
+) -> Iterator[Tuple[int, Optional[str], object]]:
+    """
+    Mengurai file baris demi baris dan menghasilkan `(nomor baris, entity_type,
+    data)`. Bila baris tidak bisa diurai, `data` berisi pesan error (str).
+
+    NDJSON menerima objek entity biasa atau format `{"type", "data"}` hasil
+    export. CSV memakai baris pertama sebagai header; kolom `entity_type`
+    opsional (`type` sudah dipakai oleh document).
+    """
+    if file_format == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            data = {key: (value if value != "" else None) for key, value in row.items() if key}
+            yield reader.line_num, data.pop("entity_type", None) or default_type, data
+        return
+
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield line_no, default_type, "Invalid JSON"
+            continue
+
+        if not isinstance(data, dict):
+            yield line_no, default_type, "Expected a JSON object"
+        elif isinstance(data.get("data"), dict):
+            yield line_no, data.get("type"), data["data"]
+        elif data.get("type") == "export":
+            continue
+        else:
+            yield line_no, default_type, data
+
+def _validation_detail(exc: ValidationError) -> str:
+    error = exc.errors()[0]
+    location = ".".join(str(part) for part in error["loc"])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+class Importer:
+    """
+    Memasukkan entity dalam batch: setiap batch adalah satu transaksi berisi
+    satu INSERT executemany untuk entity, satu untuk posting pencarian,
+    satu update statistik, dan satu kenaikan versi koleksi.
+    """
+
+    def __init__(self, db: AsyncSession, project_id: str, user_id: str, batch_size: int = IMPORT_BATCH_SIZE):
+        self.db = db
+        self.project_id = project_id
+        self.user_id = user_id
+        self.batch_size = batch_size
+        self.pending = defaultdict(list)
+        self.imported = 0
+        self.failed = 0
+        self.errors = []
+
+    def reject(self, line_no: int, detail: str):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line_no, "detail": detail})
+
+    def prepare(self, line_no: int, entity_type: Optional[str], data) -> Optional[Tuple[str, dict]]:
+        """Validasi satu baris; `(entity_type, values)` atau None bila dilewati/ditolak."""
+        if entity_type in SKIPPED_TYPES:
+            return None
+        if isinstance(data, str):
+            self.reject(line_no, data)
+            return None
+        if entity_type not in IMPORTABLE:
+            self.reject(line_no, f"Unknown entity type: {entity_type}" if entity_type else "Missing entity type")
+            return None
+
+        _, schema, _, _ = IMPORTABLE[entity_type]
+        try:
+            values = schema.model_validate(data).model_dump()
+        except ValidationError as exc:
+            self.reject(line_no, _validation_detail(exc))
+            return None
+
+        for column, allowed in ENUM_COLUMNS[entity_type].items():
+            value = values.get(column)
+            if value is not None and value not in allowed:
+                self.reject(line_no, f"{column}: must be one of {', '.join(allowed)}")
+                return None
+
+        for column, length in LENGTH_COLUMNS[entity_type].items():
+            value = values.get(column)
+            if isinstance(value, str) and len(value) > length:
+                self.reject(line_no, f"{column}: must be at most {length} characters")
+                return None
+
+        values.update(id=new_id(), project_id=self.project_id, created_by=self.user_id)
+        return entity_type, values
+
+    def read_chunk(self, records: Iterator[Tuple[int, Optional[str], object]]) -> Tuple[list, bool]:
+        """
+        Membaca, mengurai, dan memvalidasi hingga `batch_size` baris. Dijalankan
+        di thread pool karena membaca file upload dan parsing bersifat blocking.
+        Mengembalikan baris valid dan apakah masih ada baris tersisa.
+        """
+        rows = []
+        count = 0
+        for line_no, entity_type, data in records:
+            count += 1
+            prepared = self.prepare(line_no, entity_type, data)
+            if prepared is not None:
+                rows.append((line_no, *prepared))
+            if count >= self.batch_size:
+                return rows, True
+        return rows, False
+
+    async def add(self, line_no: int, entity_type: str, values: dict):
+        self.pending[entity_type].append((line_no, values))
+
+        if len(self.pending[entity_type]) >= self.batch_size:
+            await self.flush(entity_type)
+
+    async def _drop_unknown_assignees(self, rows: list) -> list:
+        assignees = {values["assigned_to"] for _, values in rows if values.get("assigned_to")}
+        if not assignees:
+            return rows
+
+        known = set((await self.db.scalars(select(User.id).where(User.id.in_(assignees)))).all())
+        kept = []
+        for line_no, values in rows:
+            if values.get("assigned_to") and values["assigned_to"] not in known:
+                self.reject(line_no, "assigned_to: unknown user")
+            else:
+                kept.append((line_no, values))
+        return kept
+
+    async def flush(self, entity_type: str):
+        rows = self.pending.pop(entity_type, [])
+        if entity_type == "task":
+            rows = await self._drop_unknown_assignees(rows)
+        if not rows:
+            return
+
+        model, _, collection, counter = IMPORTABLE[entity_type]
+        values = [values for _, values in rows]
+        entities = [SimpleNamespace(**row) for row in values]
+        if issubclass(model, CompressedContentMixin):
+            values = [{**row, **content_columns(row["content"])} for row in values]
+
+        try:
+            # INSERT Core ke tabel, bukan ORM bulk insert: ORM membuang key
+            # bernilai None sehingga baris dengan kolom kosong yang berbeda
+            # terpecah menjadi banyak executemany kecil.
+            await self.db.execute(insert(model.__table__), values)
+
+            postings = [posting for entity in entities for posting in build_postings(entity_type, entity)]
+            if postings:
+                await self.db.execute(insert(SearchPosting.__table__), postings)
+
+            if counter is None:
+                await apply_task_changes(self.db, self.project_id, [(None, task_snapshot(entity)) for entity in entities])
+            else:
+                await increment_counter(self.db, self.project_id, counter, len(values))
+
+            await bump_version(self.db, self.project_id, collection)
+            await self.db.commit()
+        except DBAPIError as exc:
+            # Satu batch adalah satu transaksi: bila gagal, seluruh barisnya dilaporkan.
+            # Pesan driver (nama tabel/constraint, potongan SQL) hanya ke log.
+            await self.db.rollback()
+            logger.warning(
+                f"Import into project {self.project_id} failed for {len(rows)} {entity_type} rows "
+                f"(lines {rows[0][0]}-{rows[-1][0]}): {exc.orig}"
+            )
+            for line_no, _ in rows:
+                self.reject(line_no, "Database error")
+            return
+
+        self.imported += len(values)
+        await publish_changes(self.project_id, entity_type, "created", [entity.id for entity in entities])
+
+    async def run(self, records: Iterable[Tuple[int, Optional[str], object]]) -> dict:
+        records = iter(records)
+        more = True
+        while more:
+            # Event loop hanya mengerjakan INSERT; file dibaca per chunk di thread.
+            rows, more = await run_in_threadpool(self.read_chunk, records)
+            for line_no, entity_type, values in rows:
+                await self.add(line_no, entity_type, values)
+
+        for entity_type in list(self.pending):
+            await self.flush(entity_type)
+
+        return {"imported": self.imported, "failed": self.failed, "errors": self.errors}
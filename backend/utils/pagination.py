@@ -0,0 +1,86 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import load_only
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+LIST_VIEW_PATTERN = "^(full|summary)$"
+
+def encode_keyset(values: list) -> str:
+    raw = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_keyset(cursor: str, size: int) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        values = None
+
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+    return values
+
+def load_fields(model, schema):
+    """
+    Membatasi SELECT pada kolom yang dipakai `schema`. Kolom lain (misalnya
+    content yang besar) tidak diambil dari database dan tidak bisa
+    di-lazy-load secara tidak sengaja.
+    """
+    return load_only(*(getattr(model, name) for name in schema.model_fields), raiseload=True)
+
+def encode_cursor(created_at: datetime, entity_id: str) -> str:
+    """
+    Cursor opaque untuk keyset pagination, berisi posisi (created_at, id)
+    dari baris terakhir pada halaman sebelumnya.
+    """
+    return encode_keyset([created_at.isoformat(), entity_id])
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    created_at, entity_id = decode_keyset(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), str(entity_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+async def paginate(
+    db: AsyncSession,
+    stmt,
+    model,
+    cursor: Optional[str],
+    limit: int
+) -> Tuple[List, Optional[str]]:
+    """
+    Menerapkan keyset pagination pada `(created_at, id)` sehingga biaya setiap
+    halaman tetap konstan, berapapun posisinya (tidak memakai OFFSET).
+    """
+    if cursor:
+        created_at, entity_id = decode_cursor(cursor)
+        stmt = stmt.where(or_(
+            model.created_at > created_at,
+            and_(model.created_at == created_at, model.id > entity_id)
+        ))
+
+    result = await db.execute(stmt.order_by(model.created_at, model.id).limit(limit + 1))
+    rows = list(result.scalars())
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+
+    return rows, next_cursor
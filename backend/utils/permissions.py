@@ -0,0 +1,73 @@
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models import ProjectMember, RoleEnum
+from utils.cache import MISSING, TTLCache
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+MEMBERSHIP_CACHE_SIZE = int(os.getenv("MEMBERSHIP_CACHE_SIZE", "10000"))
+MEMBERSHIP_CACHE_TTL = int(os.getenv("MEMBERSHIP_CACHE_TTL", "60"))
+
+WRITE_ROLES = (RoleEnum.admin, RoleEnum.member)
+
+# (user_id, project_id) -> RoleEnum, atau None bila bukan anggota.
+# Cache ini per proses: worker lain baru melihat perubahan membership
+# setelah TTL habis, jadi TTL sebaiknya tetap pendek.
+membership_cache = TTLCache(maxsize=MEMBERSHIP_CACHE_SIZE, ttl=MEMBERSHIP_CACHE_TTL)
+
+async def get_member_role(project_id: str, user_id: str, db: AsyncSession) -> Optional[RoleEnum]:
+    key = (user_id, project_id)
+    role = membership_cache.get(key)
+    if role is not MISSING:
+        return role
+
+    role = await db.scalar(select(ProjectMember.role).where(
+        ProjectMember.project_id == project_id,
+        ProjectMember.user_id == user_id
+    ).limit(1))
+
+    membership_cache.set(key, role)
+    return role
+
+def invalidate_project(project_id: str):
+    membership_cache.pop_where(lambda key: key[1] == project_id)
+
+def remember_member_role(project_id: str, user_id: str, role: Optional[RoleEnum]):
+    membership_cache.set((user_id, project_id), role)
+
+def ensure_access(role: Optional[RoleEnum]):
+    if role is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have access to this project"
+        )
+
+def ensure_can_modify(role: Optional[RoleEnum]):
+    if role not in WRITE_ROLES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to modify this project"
+        )
+
+def ensure_admin(role: Optional[RoleEnum]):
+    ensure_access(role)
+
+    if role != RoleEnum.admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You need admin role for this action"
+        )
+
+async def check_project_access(project_id: str, user_id: str, db: AsyncSession) -> RoleEnum:
+    role = await get_member_role(project_id, user_id, db)
+    ensure_access(role)
+    return role
+
+async def check_member_access(project_id: str, user_id: str, db: AsyncSession) -> RoleEnum:
+    role = await get_member_role(project_id, user_id, db)
+    ensure_can_modify(role)
+    return role
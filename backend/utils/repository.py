@@ -0,0 +1,157 @@
+from typing import Callable, Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import and_, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from models import ProjectMember, ProjectVersion, RoleEnum
+from utils.cache import MISSING
+from utils.permissions import ensure_access, ensure_can_modify, get_member_role, membership_cache, remember_member_role
+
+class ScopedRepository:
+    """
+    Mengambil entity milik sebuah project sekaligus memeriksa membership
+    user dalam satu statement (membership LEFT JOIN entity).
+
+    Tidak ada baris membership berarti 403, membership ada tetapi entity
+    kosong berarti 404. Bila role sudah ada di membership cache, hanya
+    entity yang di-query.
+    """
+
+    def __init__(self, model, not_found: str, scope_column=None):
+        self.model = model
+        self.not_found = not_found
+        self.scope_column = scope_column if scope_column is not None else model.project_id
+
+    def _entity_query(self, project_id: str, entity_id: str):
+        return select(self.model).where(
+            self.model.id == entity_id,
+            self.scope_column == project_id
+        )
+
+    async def get(
+        self,
+        db: AsyncSession,
+        project_id: str,
+        entity_id: str,
+        user_id: str,
+        authorize: Callable[[Optional[RoleEnum]], None] = ensure_access,
+        lock: bool = False
+    ):
+        """
+        `lock=True` memuat entity dengan SELECT ... FOR UPDATE, untuk update
+        yang menghitung delta dari nilai lama (misalnya counter statistik)
+        agar dua update bersamaan tidak memakai snapshot yang sama.
+        """
+        entity, _ = await self._get(db, project_id, entity_id, user_id, authorize, lock=lock)
+        return entity
+
+    async def get_with_version(
+        self,
+        db: AsyncSession,
+        project_id: str,
+        entity_id: str,
+        user_id: str,
+        collection: str,
+        authorize: Callable[[Optional[RoleEnum]], None] = ensure_access
+    ) -> Tuple[object, int]:
+        """
+        Seperti `get`, ditambah versi koleksi `collection` (untuk ETag) yang
+        dibaca lewat LEFT JOIN di statement yang sama, jadi 304 tetap satu
+        statement dan versi baru dipakai setelah membership lolos.
+        """
+        entity, version = await self._get(
+            db, project_id, entity_id, user_id, authorize, getattr(ProjectVersion, collection)
+        )
+        return entity, version or 0
+
+    async def _get(
+        self, db: AsyncSession, project_id: str, entity_id: str, user_id: str, authorize,
+        version_column=None, lock: bool = False
+    ):
+        role = membership_cache.get((user_id, project_id))
+        columns = (version_column,) if version_column is not None else ()
+
+        if role is MISSING:
+            stmt = (
+                select(ProjectMember.role, self.model, *columns)
+                .select_from(ProjectMember)
+                .outerjoin(self.model, and_(
+                    self.model.id == entity_id,
+                    self.scope_column == ProjectMember.project_id
+                ))
+            )
+            if columns:
+                stmt = stmt.outerjoin(ProjectVersion, ProjectVersion.project_id == ProjectMember.project_id)
+            if lock:
+                stmt = stmt.with_for_update()
+            row = (await db.execute(
+                stmt.where(
+                    ProjectMember.project_id == project_id,
+                    ProjectMember.user_id == user_id
+                )
+                .limit(1)
+            )).first()
+
+            role, entity, version = (row[0], row[1], row[2] if columns else None) if row else (None, None, None)
+            remember_member_role(project_id, user_id, role)
+            authorize(role)
+        else:
+            authorize(role)
+            stmt = self._entity_query(project_id, entity_id)
+            if columns:
+                stmt = stmt.add_columns(*columns).outerjoin(
+                    ProjectVersion, ProjectVersion.project_id == self.scope_column
+                )
+            if lock:
+                stmt = stmt.with_for_update()
+            row = (await db.execute(stmt)).first()
+            entity, version = (row[0], row[1] if columns else None) if row else (None, None)
+
+        if entity is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=self.not_found
+            )
+
+        return entity, version
+
+    async def delete(
+        self,
+        db: AsyncSession,
+        project_id: str,
+        entity_id: str,
+        user_id: str,
+        *columns,
+        authorize: Callable[[Optional[RoleEnum]], None] = ensure_can_modify
+    ):
+        """
+        Menghapus entity dengan satu DELETE ber-WHERE id dan project, tanpa
+        memuat barisnya lebih dulu; 404 bila tidak ada baris yang terhapus.
+
+        Bila pemanggil butuh nilai lama (`columns`, misalnya untuk statistik),
+        nilainya diambil lewat DELETE ... RETURNING bila dialect mendukung,
+        atau satu SELECT kolom itu saja. Mengembalikan baris tersebut.
+        """
+        authorize(await get_member_role(project_id, user_id, db))
+
+        scope = [self.model.id == entity_id]
+        if self.scope_column is not self.model.id:
+            scope.append(self.scope_column == project_id)
+        stmt = delete(self.model).where(*scope).execution_options(synchronize_session=False)
+
+        row = None
+        if not columns:
+            found = (await db.execute(stmt)).rowcount > 0
+        elif db.bind.dialect.delete_returning:
+            row = (await db.execute(stmt.returning(*columns))).first()
+            found = row is not None
+        else:
+            row = (await db.execute(select(*columns).where(*scope).with_for_update())).first()
+            found = row is not None and (await db.execute(stmt)).rowcount > 0
+
+        if not found:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=self.not_found
+            )
+
+        return row
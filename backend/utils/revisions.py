@@ -0,0 +1,240 @@
+import difflib
+import json
+import os
+import zlib
+from typing import List, Optional, Tuple
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from models import Revision
+
+load_dotenv()
+
+# Setiap revisi ke-N disimpan utuh, sehingga rekonstruksi paling banyak
+# menerapkan N - 1 delta.
+REVISION_SNAPSHOT_INTERVAL = int(os.getenv("REVISION_SNAPSHOT_INTERVAL", "20"))
+
+SNAPSHOT = "snapshot"
+DELTA = "delta"
+
+# Delta disimpan ringkas: int positif = retain, int negatif = delete,
+# str = insert. Sisa teks setelah operasi terakhir dipertahankan.
+
+def compact_ops(ops) -> list:
+    compact = []
+    for op in ops:
+        if op.retain:
+            compact.append(op.retain)
+        elif op.delete:
+            compact.append(-op.delete)
+        elif op.insert:
+            compact.append(op.insert)
+    return compact
+
+def make_delta(old: str, new: str) -> list:
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+
+    delta = []
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            delta.append(sum(len(line) for line in old_lines[i1:i2]))
+            continue
+        if i2 > i1:
+            delta.append(-sum(len(line) for line in old_lines[i1:i2]))
+        if j2 > j1:
+            delta.append("".join(new_lines[j1:j2]))
+
+    if delta and isinstance(delta[-1], int) and delta[-1] > 0:
+        delta.pop()
+    return delta
+
+def apply_delta(text: str, delta: list) -> str:
+    parts = []
+    position = 0
+    for op in delta:
+        if isinstance(op, str):
+            parts.append(op)
+        elif op > 0:
+            if position + op > len(text):
+                raise ValueError("Retain past end of text")
+            parts.append(text[position:position + op])
+            position += op
+        else:
+            if position - op > len(text):
+                raise ValueError("Delete past end of text")
+            position -= op
+
+    parts.append(text[position:])
+    return "".join(parts)
+
+def _pack(data) -> bytes:
+    raw = data if isinstance(data, str) else json.dumps(data, separators=(",", ":"))
+    return zlib.compress(raw.encode("utf-8"))
+
+def _unpack(body: bytes, kind: str):
+    raw = zlib.decompress(body).decode("utf-8")
+    return raw if kind == SNAPSHOT else json.loads(raw)
+
+def _row(entity_type: str, entity, number: int, kind: str, data, size: int, user_id: str) -> dict:
+    return {
+        "entity_type": entity_type,
+        "entity_id": entity.id,
+        "number": number,
+        "project_id": entity.project_id,
+        "kind": kind,
+        "body": _pack(data),
+        "size": size,
+        "created_by": user_id,
+    }
+
+def revision_rows(
+    entity_type: str,
+    entity,
+    previous: Optional[str],
+    user_id: str,
+    delta: Optional[list] = None
+) -> List[dict]:
+    """
+    Baris revisi untuk perubahan isi `entity` dari `previous` ke isi saat
+    ini (kosong bila isinya tidak berubah), dan menaikkan `entity.revision`. Entity yang belum pernah punya
+    revisi (baru atau data lama) lebih dulu mendapat snapshot revisi 0 dari
+    isi sebelumnya.
+    """
+    previous = previous or ""
+    current = entity.content or ""
+    if delta is None and current == previous:
+        return []
+
+    number = (entity.revision or 0) + 1
+
+    rows = []
+    if number == 1:
+        rows.append(_row(entity_type, entity, 0, SNAPSHOT, previous, len(previous), user_id))
+
+    if delta is None:
+        delta = make_delta(previous, current)
+
+    delta_size = sum(len(op) if isinstance(op, str) else 1 for op in delta)
+    if number % REVISION_SNAPSHOT_INTERVAL == 0 or delta_size * 2 > len(current):
+        rows.append(_row(entity_type, entity, number, SNAPSHOT, current, len(current), user_id))
+    else:
+        rows.append(_row(entity_type, entity, number, DELTA, delta, len(current), user_id))
+
+    entity.revision = number
+    return rows
+
+async def save_revisions(db: AsyncSession, rows: List[dict]):
+    if rows:
+        await db.execute(insert(Revision.__table__), rows)
+
+async def commit_revisions(db: AsyncSession):
+    """
+    Commit transaksi yang menulis revisi. Dua penulisan bersamaan dari
+    revisi yang sama bertabrakan di primary key revisi dan yang kalah
+    mendapat 409.
+    """
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Content was modified concurrently, reload and retry"
+        )
+
+async def apply_patch(db: AsyncSession, entity_type: str, entity, patch, user_id: str):
+    if patch.base_revision != (entity.revision or 0):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Base revision {patch.base_revision} is stale, current revision is {entity.revision or 0}"
+        )
+
+    delta = compact_ops(patch.ops)
+    previous = entity.content or ""
+    try:
+        entity.content = apply_delta(previous, delta)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Patch does not apply: {exc}"
+        )
+
+    if patch.title is not None:
+        entity.title = patch.title
+
+    await save_revisions(db, revision_rows(entity_type, entity, previous, user_id, delta))
+
+async def list_revisions(
+    db: AsyncSession,
+    entity_type: str,
+    entity_id: str,
+    limit: int,
+    before: Optional[int] = None
+) -> Tuple[list, Optional[int]]:
+    stmt = select(
+        Revision.number, Revision.kind, Revision.size, Revision.created_by, Revision.created_at
+    ).where(Revision.entity_type == entity_type, Revision.entity_id == entity_id)
+    if before is not None:
+        stmt = stmt.where(Revision.number < before)
+
+    rows = (await db.execute(stmt.order_by(Revision.number.desc()).limit(limit + 1))).all()
+
+    next_before = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_before = rows[-1].number
+
+    return rows, next_before
+
+async def reconstruct_revision(db: AsyncSession, entity_type: str, entity, number: int) -> Optional[str]:
+    """
+    Isi `entity` pada revisi `number`: snapshot terdekat di bawahnya lalu
+    delta-delta setelahnya, dibaca dengan satu query.
+    """
+    if number == (entity.revision or 0):
+        return entity.content
+    if number > (entity.revision or 0):
+        return None
+
+    base = select(func.max(Revision.number)).where(
+        Revision.entity_type == entity_type,
+        Revision.entity_id == entity.id,
+        Revision.kind == SNAPSHOT,
+        Revision.number <= number
+    ).scalar_subquery()
+
+    chain = (await db.execute(
+        select(Revision.kind, Revision.body)
+        .where(
+            Revision.entity_type == entity_type,
+            Revision.entity_id == entity.id,
+            Revision.number >= base,
+            Revision.number <= number
+        )
+        .order_by(Revision.number)
+    )).all()
+
+    if not chain:
+        return None
+
+    text = _unpack(chain[0].body, chain[0].kind)
+    for kind, body in chain[1:]:
+        data = _unpack(body, kind)
+        text = data if kind == SNAPSHOT else apply_delta(text, data)
+    return text
+
+async def remove_revisions(db: AsyncSession, entity_type: str, entity_ids: List[str]):
+    if not entity_ids:
+        return
+
+    await db.execute(delete(Revision).where(
+        Revision.entity_type == entity_type,
+        Revision.entity_id.in_(entity_ids)
+    ))
+
+async def remove_project_revisions(db: AsyncSession, project_id: str):
+    await db.execute(delete(Revision).where(Revision.project_id == project_id))
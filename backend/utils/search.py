@@ -0,0 +1,235 @@
+import html
+import re
+from collections import Counter
+from typing import List, Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import and_, delete, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from models import Document, Note, SearchPosting, Task
+from utils.pagination import decode_keyset, encode_keyset
+
+TOKEN_PATTERN = re.compile(r"\w+")
+MIN_TERM_LENGTH = 2
+MAX_TERM_LENGTH = 64
+MAX_QUERY_TERMS = 8
+TITLE_WEIGHT = 3
+SNIPPET_RADIUS = 80
+
+# entity_type -> (model, kolom isi yang diindeks selain title)
+SEARCHABLE = {
+    "task": (Task, "description"),
+    "note": (Note, "content"),
+    "document": (Document, "content"),
+}
+
+def tokenize(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    return [
+        term for term in TOKEN_PATTERN.findall(text.lower())
+        if MIN_TERM_LENGTH <= len(term) <= MAX_TERM_LENGTH
+    ]
+
+def build_postings(entity_type: str, entity) -> List[dict]:
+    _, body_field = SEARCHABLE[entity_type]
+
+    weights = Counter()
+    for term in tokenize(entity.title):
+        weights[term] += TITLE_WEIGHT
+    for term in tokenize(getattr(entity, body_field)):
+        weights[term] += 1
+
+    return [
+        {
+            "project_id": entity.project_id,
+            "term": term,
+            "entity_type": entity_type,
+            "entity_id": entity.id,
+            "weight": weight,
+        }
+        for term, weight in weights.items()
+    ]
+
+def touches_index(entity_type: str, fields) -> bool:
+    _, body_field = SEARCHABLE[entity_type]
+    return "title" in fields or body_field in fields
+
+async def index_entity(db: AsyncSession, entity_type: str, entity, replace: bool = True):
+    """
+    Memperbarui posting list sebuah entity di dalam transaksi yang sedang
+    berjalan, sehingga index selalu konsisten dengan datanya. Entity baru
+    belum punya posting, jadi `replace=False` melewati DELETE-nya.
+    """
+    await index_entities(db, entity_type, [entity], replace)
+
+async def index_entities(db: AsyncSession, entity_type: str, entities: List, replace: bool = True):
+    """Versi batch `index_entity`: satu DELETE dan satu INSERT untuk semua entity."""
+    if not entities:
+        return
+
+    if any(entity.id is None for entity in entities):
+        await db.flush()
+
+    if replace:
+        await remove_entities(db, entity_type, [entity.id for entity in entities])
+
+    rows = [row for entity in entities for row in build_postings(entity_type, entity)]
+    if rows:
+        await db.execute(insert(SearchPosting), rows)
+
+async def remove_entity(db: AsyncSession, entity_type: str, entity_id: str):
+    await remove_entities(db, entity_type, [entity_id])
+
+async def remove_entities(db: AsyncSession, entity_type: str, entity_ids: List[str]):
+    if not entity_ids:
+        return
+
+    await db.execute(delete(SearchPosting).where(
+        SearchPosting.entity_type == entity_type,
+        SearchPosting.entity_id.in_(entity_ids)
+    ))
+
+async def remove_project(db: AsyncSession, project_id: str):
+    await db.execute(delete(SearchPosting).where(SearchPosting.project_id == project_id))
+
+def make_snippet(text: Optional[str], terms: List[str]) -> Optional[str]:
+    if not text:
+        return None
+
+    pattern = re.compile(
+        r"(?<!\w)(" + "|".join(re.escape(term) for term in terms) + r")(?!\w)",
+        re.IGNORECASE
+    )
+    match = pattern.search(text)
+    start = max(0, match.start() - SNIPPET_RADIUS) if match else 0
+    end = min(len(text), start + 2 * SNIPPET_RADIUS)
+
+    snippet = pattern.sub(
+        lambda m: f"\x00{m.group(0)}\x01",
+        text[start:end]
+    )
+    snippet = html.escape(snippet).replace("\x00", "<mark>").replace("\x01", "</mark>")
+
+    return ("…" if start > 0 else "") + snippet + ("…" if end < len(text) else "")
+
+def parse_query(query: str) -> List[str]:
+    return list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+
+def decode_search_cursor(cursor: str) -> Tuple[int, str, str]:
+    last_score, last_type, last_id = decode_keyset(cursor, 3)
+    if (
+        not isinstance(last_score, int) or isinstance(last_score, bool)
+        or not isinstance(last_type, str) or not isinstance(last_id, str)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return last_score, last_type, last_id
+
+async def search_project(
+    db: AsyncSession,
+    project_id: str,
+    query: str,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Mencari entity yang memuat semua term pada query, diurutkan berdasarkan
+    bobot (term di title bernilai lebih tinggi). Hanya posting list dari
+    term yang dicari yang dibaca, tabel entity tidak pernah di-scan.
+    """
+    terms = parse_query(query)
+    if not terms:
+        return [], None
+
+    score = func.sum(SearchPosting.weight)
+    stmt = (
+        select(SearchPosting.entity_type, SearchPosting.entity_id, score.label("score"))
+        .where(
+            SearchPosting.project_id == project_id,
+            SearchPosting.term.in_(terms)
+        )
+        .group_by(SearchPosting.entity_type, SearchPosting.entity_id)
+        .having(func.count() == len(terms))
+    )
+
+    if cursor:
+        last_score, last_type, last_id = decode_search_cursor(cursor)
+        stmt = stmt.having(or_(
+            score < last_score,
+            and_(score == last_score, or_(
+                SearchPosting.entity_type > last_type,
+                and_(SearchPosting.entity_type == last_type, SearchPosting.entity_id > last_id)
+            ))
+        ))
+
+    ranked = (await db.execute(
+        stmt.order_by(score.desc(), SearchPosting.entity_type, SearchPosting.entity_id)
+        .limit(limit + 1)
+    )).all()
+
+    next_cursor = None
+    if len(ranked) > limit:
+        ranked = ranked[:limit]
+        last = ranked[-1]
+        next_cursor = encode_keyset([int(last.score), last.entity_type, last.entity_id])
+
+    entities = {}
+    for entity_type, (model, _) in SEARCHABLE.items():
+        ids = [row.entity_id for row in ranked if row.entity_type == entity_type]
+        if ids:
+            result = await db.scalars(select(model).where(model.id.in_(ids)))
+            entities.update({(entity_type, entity.id): entity for entity in result})
+
+    hits = []
+    for row in ranked:
+        entity = entities.get((row.entity_type, row.entity_id))
+        if entity is None:
+            continue
+
+        _, body_field = SEARCHABLE[row.entity_type]
+        hits.append({
+            "type": row.entity_type,
+            "id": entity.id,
+            "title": entity.title,
+            "snippet": make_snippet(getattr(entity, body_field), terms),
+            "score": int(row.score),
+            "updated_at": entity.updated_at,
+        })
+
+    return hits, next_cursor
+
+def rebuild_search_index(db: Session, project_id: Optional[str] = None, batch_size: int = 500) -> int:
+    """
+    Membangun ulang index dari data yang ada (untuk data lama atau bila
+    index dicurigai tidak konsisten). Dipakai oleh `manage.py reindex-search`.
+    """
+    cleanup = delete(SearchPosting)
+    if project_id:
+        cleanup = cleanup.where(SearchPosting.project_id == project_id)
+    db.execute(cleanup)
+
+    indexed = 0
+    for entity_type, (model, _) in SEARCHABLE.items():
+        last_id = ""
+        while True:
+            stmt = select(model).where(model.id > last_id).order_by(model.id).limit(batch_size)
+            if project_id:
+                stmt = stmt.where(model.project_id == project_id)
+
+            batch = db.scalars(stmt).all()
+            if not batch:
+                break
+
+            rows = [row for entity in batch for row in build_postings(entity_type, entity)]
+            if rows:
+                db.execute(insert(SearchPosting), rows)
+
+            indexed += len(batch)
+            last_id = batch[-1].id
+            db.expunge_all()
+
+    db.commit()
+    return indexed
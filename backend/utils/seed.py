@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from models import User, Project, ProjectMember, RoleEnum
+from models import User, Project, ProjectMember, ProjectStatistics, ProjectVersion, RoleEnum
 from utils.auth import get_password_hash
 import logging
 
@@ -20,10 +20,7 @@ def seed_database(db: Session):
         )
 
         db.add(demo_user)
-        db.commit()
-        db.refresh(demo_user)
-
-        logger.info(f"Created demo user: {demo_user.email}")
+        db.flush()
 
         demo_project = Project(
             name="DevNoteX Project",
@@ -32,10 +29,7 @@ def seed_database(db: Session):
         )
 
         db.add(demo_project)
-        db.commit()
-        db.refresh(demo_project)
-
-        logger.info(f"Created demo project: {demo_project.name}")
+        db.flush()
 
         demo_membership = ProjectMember(
             project_id=demo_project.id,
@@ -44,9 +38,11 @@ def seed_database(db: Session):
         )
 
         db.add(demo_membership)
+        db.add(ProjectStatistics(project_id=demo_project.id))
+        db.add(ProjectVersion(project_id=demo_project.id))
         db.commit()
 
-        logger.info(f"Added {demo_user.email} as admin to {demo_project.name}")
+        logger.info(f"Created demo user {demo_user.email} as admin of {demo_project.name}")
         logger.info("Seed data created successfully!")
 
     except Exception as e:
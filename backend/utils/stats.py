@@ -0,0 +1,244 @@
+from collections import Counter
+from datetime import date, datetime, timezone
+from typing import Iterable, NamedTuple, Optional, Tuple
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from models import (
+    Document,
+    Note,
+    PriorityEnum,
+    Project,
+    ProjectStatistics,
+    StatusEnum,
+    Task,
+    TaskDueCount,
+)
+from utils.database import AsyncSessionLocal
+
+COUNTER_COLUMNS = [
+    column.name for column in ProjectStatistics.__table__.columns
+    if column.name not in ("project_id", "updated_at")
+]
+
+class TaskSnapshot(NamedTuple):
+    status: str
+    priority: Optional[str]
+    due_day: Optional[date]
+
+def _due_day(due_date: Optional[datetime]) -> Optional[date]:
+    if due_date is None:
+        return None
+    if due_date.tzinfo is not None:
+        due_date = due_date.astimezone(timezone.utc)
+    return due_date.date()
+
+def task_snapshot(task) -> TaskSnapshot:
+    """
+    Bagian task yang mempengaruhi counter. Diambil sebelum dan sesudah
+    perubahan lalu diteruskan ke `apply_task_change`.
+    """
+    return TaskSnapshot(
+        status=StatusEnum(task.status or StatusEnum.backlog).value,
+        priority=PriorityEnum(task.priority).value if task.priority else None,
+        due_day=_due_day(task.due_date),
+    )
+
+def _increment_stmt(project_id: str, deltas: dict):
+    values = {
+        column: getattr(ProjectStatistics, column) + delta
+        for column, delta in deltas.items() if delta
+    }
+    if not values:
+        return None
+
+    return (
+        update(ProjectStatistics)
+        .where(ProjectStatistics.project_id == project_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+def _due_upsert_stmt(dialect: str, project_id: str, due_day: date, delta: int):
+    table = TaskDueCount.__table__
+    values = {"project_id": project_id, "due_day": due_day, "open_tasks": delta}
+
+    if dialect == "mysql":
+        stmt = mysql_insert(table).values(**values)
+        return stmt.on_duplicate_key_update(open_tasks=table.c.open_tasks + stmt.inserted.open_tasks)
+
+    stmt = sqlite_insert(table).values(**values)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.project_id, table.c.due_day],
+        set_={"open_tasks": table.c.open_tasks + stmt.excluded.open_tasks}
+    )
+
+async def increment_counter(db: AsyncSession, project_id: str, column: str, delta: int):
+    stmt = _increment_stmt(project_id, {column: delta})
+    if stmt is not None:
+        await db.execute(stmt)
+
+async def apply_task_change(
+    db: AsyncSession,
+    project_id: str,
+    before: Optional[TaskSnapshot],
+    after: Optional[TaskSnapshot]
+):
+    """
+    Memperbarui counter project di transaksi yang sama dengan penulisan task.
+    `before` kosong berarti task baru, `after` kosong berarti task dihapus.
+    """
+    await apply_task_changes(db, project_id, [(before, after)])
+
+async def apply_task_changes(
+    db: AsyncSession,
+    project_id: str,
+    changes: Iterable[Tuple[Optional[TaskSnapshot], Optional[TaskSnapshot]]]
+):
+    """Versi batch `apply_task_change`: semua delta digabung menjadi satu UPDATE."""
+    deltas = Counter()
+    due_deltas = Counter()
+    for before, after in changes:
+        if before == after:
+            continue
+
+        for snapshot, sign in ((before, -1), (after, 1)):
+            if snapshot is None:
+                continue
+
+            deltas["tasks_total"] += sign
+            deltas[f"tasks_{snapshot.status}"] += sign
+            deltas[f"priority_{snapshot.priority or 'none'}"] += sign
+
+            if snapshot.due_day and snapshot.status != StatusEnum.done.value:
+                due_deltas[snapshot.due_day] += sign
+
+    stmt = _increment_stmt(project_id, deltas)
+    if stmt is not None:
+        await db.execute(stmt)
+
+    dialect = db.get_bind().dialect.name
+    for due_day, delta in due_deltas.items():
+        if delta:
+            await db.execute(_due_upsert_stmt(dialect, project_id, due_day, delta))
+
+async def remove_project_stats(db: AsyncSession, project_id: str):
+    await db.execute(delete(TaskDueCount).where(TaskDueCount.project_id == project_id))
+    await db.execute(delete(ProjectStatistics).where(ProjectStatistics.project_id == project_id))
+
+async def read_project_stats(db: AsyncSession, project_id: str) -> dict:
+    overdue = select(func.coalesce(func.sum(TaskDueCount.open_tasks), 0)).where(
+        TaskDueCount.project_id == project_id,
+        TaskDueCount.due_day < datetime.now(timezone.utc).date()
+    ).scalar_subquery()
+
+    stmt = select(ProjectStatistics, overdue).where(ProjectStatistics.project_id == project_id)
+    row = (await db.execute(stmt)).first()
+
+    if row is None:
+        # Project lama yang belum pernah di-reconcile. Ditulis lewat primary
+        # karena `db` bisa saja session replica.
+        async with AsyncSessionLocal() as primary:
+            try:
+                await primary.run_sync(rebuild_project_stats, project_id)
+                await primary.commit()
+            except IntegrityError:
+                # Read pertama lain untuk project yang sama sudah membuat
+                # barisnya lebih dulu; cukup baca hasilnya.
+                await primary.rollback()
+            row = (await primary.execute(stmt)).first()
+
+    stats, tasks_overdue = row
+    by_priority = {priority.value: getattr(stats, f"priority_{priority.value}") for priority in PriorityEnum}
+    by_priority["none"] = stats.priority_none
+
+    return {
+        "tasks_total": stats.tasks_total,
+        "tasks_completed": stats.tasks_done,
+        "tasks_overdue": int(tasks_overdue or 0),
+        "tasks_by_status": {status.value: getattr(stats, f"tasks_{status.value}") for status in StatusEnum},
+        "tasks_by_priority": by_priority,
+        "notes_total": stats.notes_total,
+        "documents_total": stats.documents_total,
+    }
+
+def rebuild_project_stats(db: Session, project_id: str):
+    """
+    Menghitung ulang semua counter sebuah project dari tabel aslinya.
+    Baris stats dikunci (FOR UPDATE) agar penulisan yang berjalan bersamaan
+    menunggu sampai perhitungan ulang selesai.
+    """
+    stats = db.scalar(
+        select(ProjectStatistics)
+        .where(ProjectStatistics.project_id == project_id)
+        .with_for_update()
+    )
+    if stats is None:
+        stats = ProjectStatistics(project_id=project_id)
+        db.add(stats)
+
+    counters = dict.fromkeys(COUNTER_COLUMNS, 0)
+    task_counts = db.execute(
+        select(Task.status, Task.priority, func.count())
+        .where(Task.project_id == project_id)
+        .group_by(Task.status, Task.priority)
+    )
+    for task_status, priority, count in task_counts:
+        counters["tasks_total"] += count
+        counters[f"tasks_{StatusEnum(task_status).value}"] += count
+        counters[f"priority_{PriorityEnum(priority).value if priority else 'none'}"] += count
+
+    counters["notes_total"] = db.scalar(
+        select(func.count()).select_from(Note).where(Note.project_id == project_id)
+    )
+    counters["documents_total"] = db.scalar(
+        select(func.count()).select_from(Document).where(Document.project_id == project_id)
+    )
+
+    for column, value in counters.items():
+        setattr(stats, column, value)
+
+    due_day = func.date(Task.due_date)
+    due_counts = db.execute(
+        select(due_day, func.count())
+        .where(
+            Task.project_id == project_id,
+            Task.due_date.isnot(None),
+            Task.status != StatusEnum.done
+        )
+        .group_by(due_day)
+    ).all()
+
+    db.execute(delete(TaskDueCount).where(TaskDueCount.project_id == project_id))
+    if due_counts:
+        db.execute(insert(TaskDueCount), [
+            {
+                "project_id": project_id,
+                "due_day": day if isinstance(day, date) else date.fromisoformat(day),
+                "open_tasks": count,
+            }
+            for day, count in due_counts
+        ])
+
+    db.flush()
+
+def reconcile_all_stats(db: Session, batch_size: int = 200) -> int:
+    """Menjalankan `rebuild_project_stats` untuk semua project, satu transaksi per project."""
+    reconciled = 0
+    last_id = ""
+    while True:
+        project_ids = db.scalars(
+            select(Project.id).where(Project.id > last_id).order_by(Project.id).limit(batch_size)
+        ).all()
+        if not project_ids:
+            return reconciled
+
+        for project_id in project_ids:
+            rebuild_project_stats(db, project_id)
+            db.commit()
+            reconciled += 1
+
+        last_id = project_ids[-1]